@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# ============================================================
+# BENCHMARK_BUSQUEDA.PY
+# Autor: Luis Henry Baldeón Ochoa
+# Objetivo:
+#   Comparar las búsquedas del Catalogo de catalogo.py (índices por
+#   nombre, precio y prefijo) con recorrer una lista de Producto.
+#
+# Uso:
+#   python benchmark_busqueda.py [--productos 1000000] [--consultas 20]
+#
+#   Mide el tiempo por consulta de:
+#     nombre exacto     un producto por su nombre
+#     precio $20-$100   todo lo que cuesta entre 20 y 100, ordenado por precio
+#     precio angosto    rangos de $1 al azar (pocos resultados)
+#     autocompletar     los 10 primeros nombres con un prefijo
+#     agregar + quitar  un producto nuevo que entra y sale del catálogo
+# ============================================================
+
+import argparse
+import random
+import sys
+import time
+from decimal import Decimal
+from typing import Callable, List
+
+from benchmark_catalogo import generar_datos
+from catalogo import Catalogo
+from tienda_virtual import Producto
+
+
+def por_consulta(funcion: Callable[[object], object], consultas: List[object]):
+    """Tiempo promedio por consulta y la lista de resultados."""
+    inicio = time.perf_counter()
+    resultados = [funcion(consulta) for consulta in consultas]
+    return (time.perf_counter() - inicio) / max(1, len(consultas)), resultados
+
+
+def escenarios(lista: List[Producto], catalogo: Catalogo, consultas: int, rnd: random.Random):
+    nombres = [rnd.choice(lista).nombre for _ in range(consultas)]
+    anchos = [(Decimal(d), Decimal(d + 1)) for d in (rnd.randint(1, 998) for _ in range(consultas))]
+    prefijos = [n[: len(n) - 2] for n in nombres]
+
+    def lista_nombre(nombre):
+        return next((p for p in lista if p.nombre == nombre), None)
+
+    def lista_rango(rango):
+        desde, hasta = rango
+        return sorted((p for p in lista if desde <= p.precio <= hasta), key=lambda p: (p.precio, p.nombre))
+
+    def lista_prefijo(prefijo):
+        clave = prefijo.casefold()
+        return sorted((p for p in lista if p.nombre.casefold().startswith(clave)),
+                      key=lambda p: (p.nombre.casefold(), p.nombre))[:10]
+
+    def lista_agregar(i):
+        lista.append(Producto(f"Nuevo {i}", 50))
+        lista.remove(lista[-1])
+
+    def catalogo_agregar(i):
+        catalogo.agregar(Producto(f"Nuevo {i}", 50))
+        catalogo.quitar(f"Nuevo {i}")
+
+    return [
+        ("nombre exacto", lista_nombre, catalogo.buscar, nombres),
+        ("precio $20-$100", lista_rango, lambda r: catalogo.por_precio(*r), [(Decimal(20), Decimal(100))] * 3),
+        ("precio angosto", lista_rango, lambda r: catalogo.por_precio(*r), anchos),
+        ("autocompletar", lista_prefijo, catalogo.autocompletar, prefijos),
+        ("agregar + quitar", lista_agregar, catalogo_agregar, list(range(consultas))),
+    ]
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de los índices de catalogo.py")
+    parser.add_argument("--productos", type=int, default=1_000_000, help="tamaño del catálogo")
+    parser.add_argument("--consultas", type=int, default=20, help="consultas por escenario")
+    args = parser.parse_args(argv)
+
+    nombres, precios = generar_datos(args.productos)
+    lista = [Producto(n, p) for n, p in zip(nombres, precios)]
+    inicio = time.perf_counter()
+    catalogo = Catalogo(lista)
+    print(f"{args.productos} productos; armar los índices tomó {time.perf_counter() - inicio:.2f}s")
+
+    print(f"{'Escenario':<18} {'Recorrer':>12} {'Índice':>12} {'Mejora':>10}")
+    print("-" * 56)
+    for nombre, recorrer, con_indice, consultas in escenarios(lista, catalogo, args.consultas, random.Random(2)):
+        t_lista, r_lista = por_consulta(recorrer, consultas)
+        t_indice, r_indice = por_consulta(con_indice, consultas)
+        if r_lista != r_indice:
+            print(f"ERROR: los resultados no coinciden en '{nombre}'")
+            return 1
+        mejora = t_lista / t_indice if t_indice > 0 else float("inf")
+        print(f"{nombre:<18} {t_lista * 1000:10.3f}ms {t_indice * 1000:10.3f}ms {mejora:9.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# ============================================================
+# BENCHMARK_CATALOGO.PY
+# Autor: Luis Henry Baldeón Ochoa
+# Objetivo:
+#   Comparar un catálogo hecho como lista de objetos Producto con el
+#   CatalogoColumnar de catalogo_columnar.py (nombres en una lista, precios
+#   en una columna de centavos).
+#
+# Uso:
+#   python benchmark_catalogo.py [--productos 100000,1000000] [--repeticiones 3]
+#
+#   Para cada tamaño mide (crear el catálogo no entra en los tiempos):
+#     memoria           bytes que ocupa el catálogo recién creado (tracemalloc)
+#     descuento 15%     bajar todos los precios y redondear al centavo
+#     impuesto + cambio impuesto del 12% y conversión de moneda a todo
+#     filtrar precio    posiciones con precio entre 100 y 500
+# ============================================================
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Callable, List, Tuple
+
+from catalogo_columnar import CENTAVO, CatalogoColumnar
+from tienda_virtual import Producto
+
+
+def generar_datos(cantidad: int, semilla: int = 1) -> Tuple[List[str], List[Decimal]]:
+    rnd = random.Random(semilla)
+    nombres = [f"Producto {i}" for i in range(cantidad)]
+    precios = [Decimal(rnd.randint(100, 99999)).scaleb(-2) for _ in range(cantidad)]
+    return nombres, precios
+
+
+def memoria_de(crear) -> Tuple[int, object]:
+    """Bytes que quedan reservados después de crear el objeto (sin contar los datos de entrada)."""
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        objeto = crear()
+        return tracemalloc.get_traced_memory()[0] - antes, objeto
+    finally:
+        tracemalloc.stop()
+
+
+def escalar_lista(productos: List[Producto], factor: Decimal) -> None:
+    """Repreciado con objetos: un bucle de Python sobre cada instancia."""
+    for producto in productos:
+        producto.precio = (producto.precio * factor).quantize(CENTAVO, rounding=ROUND_HALF_UP)
+
+
+def cronometrar_preparado(preparar: Callable[[], object], medir: Callable[[object], object],
+                          repeticiones: int = 3, presupuesto: float = 5.0) -> Tuple[float, object]:
+    """Como cronometrar(), pero cada corrida recibe datos nuevos de `preparar` (que no se mide)."""
+    mejor, gastado, resultado = float("inf"), 0.0, None
+    for _ in range(max(1, repeticiones)):
+        datos = preparar()
+        inicio = time.perf_counter()
+        resultado = medir(datos)
+        tiempo = time.perf_counter() - inicio
+        mejor = min(mejor, tiempo)
+        gastado += tiempo
+        if gastado > presupuesto:
+            break
+    return mejor, resultado
+
+
+def escenarios(nombres: List[str], precios: List[Decimal]):
+    """(nombre, medir con objetos, medir con columnas) sobre catálogos recién creados."""
+    def lista_descuento(productos):
+        escalar_lista(productos, Decimal("0.85"))
+        return sum(p.precio for p in productos)
+
+    def columnar_descuento(catalogo):
+        catalogo.aplicar_descuento(15)
+        return catalogo.total()
+
+    def lista_impuesto(productos):
+        escalar_lista(productos, Decimal("1.12"))
+        escalar_lista(productos, Decimal("0.27"))
+        return sum(p.precio for p in productos)
+
+    def columnar_impuesto(catalogo):
+        catalogo.aplicar_impuesto(12).convertir_moneda("0.27")
+        return catalogo.total()
+
+    desde, hasta = Decimal(100), Decimal(500)
+
+    def lista_filtrar(productos):
+        return [i for i, p in enumerate(productos) if desde <= p.precio <= hasta]
+
+    def columnar_filtrar(catalogo):
+        return [int(i) for i in catalogo.filtrar_por_precio(desde, hasta)]
+
+    return [
+        ("descuento 15%", lista_descuento, columnar_descuento),
+        ("impuesto + cambio", lista_impuesto, columnar_impuesto),
+        ("filtrar precio", lista_filtrar, columnar_filtrar),
+    ]
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark del catálogo columnar")
+    parser.add_argument("--productos", default="100000,1000000", help="tamaños del catálogo, separados por coma")
+    parser.add_argument("--repeticiones", type=int, default=3, help="se informa la mejor corrida")
+    args = parser.parse_args(argv)
+
+    print(f"Motor de columnas: {CatalogoColumnar().motor}")
+    print(f"{'Productos':>9}  {'Escenario':<18} {'Objetos':>12} {'Columnar':>12} {'Mejora':>8}")
+    print("-" * 66)
+    for cantidad in [int(t) for t in args.productos.split(",") if t.strip()]:
+        nombres, precios = generar_datos(cantidad)
+
+        def nueva_lista():
+            return [Producto(n, p) for n, p in zip(nombres, precios)]
+
+        def nuevo_columnar():
+            return CatalogoColumnar(nombres, precios)
+
+        # los nombres y precios de entrada ya existen; se mide lo que agrega cada estructura
+        m_lista, _ = memoria_de(nueva_lista)
+        m_columnar, _ = memoria_de(nuevo_columnar)
+        print(f"{cantidad:>9}  {'memoria':<18} {m_lista / 2**20:10.1f}MB {m_columnar / 2**20:10.1f}MB "
+              f"{m_lista / max(m_columnar, 1):7.1f}x")
+        for nombre, con_objetos, columnar in escenarios(nombres, precios):
+            t_objetos, r_objetos = cronometrar_preparado(nueva_lista, con_objetos, args.repeticiones)
+            t_columnar, r_columnar = cronometrar_preparado(nuevo_columnar, columnar, args.repeticiones)
+            if r_objetos != r_columnar:
+                print(f"ERROR: los resultados no coinciden en '{nombre}'")
+                return 1
+            mejora = t_objetos / t_columnar if t_columnar > 0 else float("inf")
+            print(f"{cantidad:>9}  {nombre:<18} {t_objetos * 1000:10.1f}ms {t_columnar * 1000:10.1f}ms {mejora:7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
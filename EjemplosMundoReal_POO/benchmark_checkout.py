@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# ============================================================
+# BENCHMARK_CHECKOUT.PY
+# Autor: Luis Henry Baldeón Ochoa
+# Objetivo:
+#   Generar carga de compras desde varios hilos sobre el Inventario de
+#   checkout_concurrente.py y medir pedidos por segundo y contención,
+#   comparando una sola cerradura con el bloqueo por franjas.
+#
+# Uso:
+#   python benchmark_checkout.py [--hilos 8] [--pedidos 2000] [--productos 200]
+#                                [--stock 1000] [--franjas 1,64] [--pago-ms 0.2]
+#                                [--abandono 0.1]
+#
+#   Cada hilo arma carritos de 1 a 4 productos (unos pocos productos se
+#   piden mucho más que el resto), reserva, simula el pago con una pausa
+#   de --pago-ms y confirma, o abandona y libera la reserva. Al final se
+#   comprueba que no se vendió más de lo que había.
+#
+#   Con el GIL de CPython las secciones críticas son tan cortas que casi
+#   nunca hay que esperar una franja; la diferencia entre una cerradura y
+#   muchas se nota cuando los hilos corren en paralelo de verdad.
+# ============================================================
+
+import argparse
+import random
+import sys
+import threading
+import time
+from decimal import Decimal
+from typing import Dict, List
+
+from checkout_concurrente import Inventario, StockInsuficiente
+from tienda_virtual import CarritoCompras, Producto
+
+
+def generar_carga(inventario: Inventario, productos: List[Producto], hilos: int, pedidos: int,
+                  pago_ms: float, abandono: float, semilla: int = 1) -> Dict[str, float]:
+    """Corre `pedidos` compras en cada uno de `hilos` hilos y devuelve los contadores."""
+    # pocos productos concentran la mayoría de los pedidos, como en una oferta
+    pesos = [1 / (i + 1) for i in range(len(productos))]
+    totales = {"confirmados": 0, "sin_stock": 0, "abandonados": 0}
+    suma = threading.Lock()
+    largada = threading.Barrier(hilos + 1)
+
+    def comprador(numero: int) -> None:
+        rnd = random.Random(semilla * 1000 + numero)
+        propios = dict.fromkeys(totales, 0)
+        largada.wait()
+        for _ in range(pedidos):
+            carrito = CarritoCompras()
+            for producto in rnd.choices(productos, pesos, k=rnd.randint(1, 4)):
+                carrito.agregar_producto(producto)
+            try:
+                reserva = inventario.reservar(carrito)
+            except StockInsuficiente:
+                propios["sin_stock"] += 1
+                continue
+            if pago_ms > 0:
+                time.sleep(pago_ms / 1000)
+            if rnd.random() < abandono:
+                inventario.liberar(reserva)
+                propios["abandonados"] += 1
+            else:
+                inventario.confirmar(reserva)
+                propios["confirmados"] += 1
+        with suma:
+            for clave, valor in propios.items():
+                totales[clave] += valor
+
+    trabajadores = [threading.Thread(target=comprador, args=(i,)) for i in range(hilos)]
+    for trabajador in trabajadores:
+        trabajador.start()
+    largada.wait()
+    inicio = time.perf_counter()
+    for trabajador in trabajadores:
+        trabajador.join()
+    totales["segundos"] = time.perf_counter() - inicio
+    return totales
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Generador de carga del checkout concurrente")
+    parser.add_argument("--hilos", type=int, default=8, help="compradores simultáneos")
+    parser.add_argument("--pedidos", type=int, default=2000, help="pedidos por hilo")
+    parser.add_argument("--productos", type=int, default=200, help="productos distintos")
+    parser.add_argument("--stock", type=int, default=1000, help="unidades iniciales de cada producto")
+    parser.add_argument("--franjas", default="1,64", help="cantidades de franjas a comparar, separadas por coma")
+    parser.add_argument("--pago-ms", type=float, default=0.2, help="pausa entre reservar y confirmar")
+    parser.add_argument("--abandono", type=float, default=0.1, help="fracción de reservas que se liberan")
+    args = parser.parse_args(argv)
+
+    productos = [Producto(f"Producto {i}", Decimal(10 + i)) for i in range(args.productos)]
+    print(f"{args.hilos} hilos x {args.pedidos} pedidos, {args.productos} productos con {args.stock} unidades")
+    print(f"{'Franjas':>7} {'Pedidos/s':>10} {'Confirmados':>12} {'Sin stock':>10} {'Abandonados':>12} {'Contención':>11}")
+    print("-" * 67)
+    for franjas in [int(t) for t in args.franjas.split(",") if t.strip()]:
+        inventario = Inventario(franjas)
+        for producto in productos:
+            inventario.agregar_stock(producto, args.stock)
+        totales = generar_carga(inventario, productos, args.hilos, args.pedidos, args.pago_ms, args.abandono)
+
+        for producto in productos:
+            nombre = producto.nombre
+            cuentas = (inventario.disponible(nombre), inventario.reservado(nombre), inventario.vendido(nombre))
+            if min(cuentas) < 0 or cuentas[1] != 0 or sum(cuentas) != args.stock:
+                print(f"ERROR: el stock de {nombre} no cuadra (disponible, reservado, vendido) = {cuentas}")
+                return 1
+
+        tomas, esperas = inventario.contencion()
+        pedidos = args.hilos * args.pedidos
+        print(f"{franjas:>7} {pedidos / totales['segundos']:>10.0f} {totales['confirmados']:>12} "
+              f"{totales['sin_stock']:>10} {totales['abandonados']:>12} {esperas / max(tomas, 1):>10.2%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
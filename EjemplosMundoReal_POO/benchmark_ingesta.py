@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# ============================================================
+# BENCHMARK_INGESTA.PY
+# Autor: Luis Henry Baldeón Ochoa
+# Objetivo:
+#   Medir la ingesta de pedidos de ingesta_pedidos.py: líneas por segundo
+#   y memoria máxima con archivos cada vez más grandes. La memoria debe
+#   quedar igual aunque el archivo crezca.
+#
+# Uso:
+#   python benchmark_ingesta.py [--lineas 100000,1000000] [--formatos csv,jsonl]
+#                               [--abiertos 64]
+#
+#   Los archivos se generan en una carpeta temporal que se borra al final.
+#   Cada pedido tiene de 1 a 6 líneas y algunas líneas de pedidos vecinos
+#   vienen mezcladas. La memoria se mide en una segunda pasada con
+#   tracemalloc (que hace todo más lento), separada de la de velocidad.
+# ============================================================
+
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from typing import Iterator, List, Tuple
+
+from ingesta_pedidos import CAMPOS, EstadisticasIngesta, ingerir
+
+
+def generar_lineas(cantidad: int, semilla: int = 1) -> Iterator[Tuple[str, str, str, int]]:
+    """`cantidad` líneas de pedido; un 5% se adelanta a la línea anterior de otro pedido."""
+    rnd = random.Random(semilla)
+    catalogo = [(f"Producto {i}", f"{rnd.randint(100, 99999) / 100:.2f}") for i in range(500)]
+    pedido, restantes, pendiente = 0, 0, None
+    for _ in range(cantidad):
+        if restantes == 0:
+            pedido, restantes = pedido + 1, rnd.randint(1, 6)
+        restantes -= 1
+        nombre, precio = rnd.choice(catalogo)
+        linea = (f"P{pedido:08d}", nombre, precio, rnd.randint(1, 3))
+        if pendiente is None and rnd.random() < 0.05:
+            pendiente = linea
+            continue
+        yield linea
+        if pendiente is not None:
+            yield pendiente
+            pendiente = None
+    if pendiente is not None:
+        yield pendiente
+
+
+def escribir(ruta: str, formato: str, cantidad: int) -> None:
+    with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+        if formato == "csv":
+            escritor = csv.writer(archivo)
+            escritor.writerow(CAMPOS)
+            escritor.writerows(generar_lineas(cantidad))
+        else:
+            for linea in generar_lineas(cantidad):
+                archivo.write(json.dumps(dict(zip(CAMPOS, linea))) + "\n")
+
+
+def consumir(ruta: str, abiertos: int) -> Tuple[EstadisticasIngesta, object]:
+    """Ingiere el archivo entero y devuelve las estadísticas y la suma de los totales."""
+    estadisticas = EstadisticasIngesta()
+    total = sum(carrito.calcular_total() for _, carrito in ingerir(ruta, abiertos, estadisticas))
+    return estadisticas, total
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de la ingesta de pedidos")
+    parser.add_argument("--lineas", default="100000,1000000", help="tamaños de archivo, separados por coma")
+    parser.add_argument("--formatos", default="csv,jsonl", help="formatos a probar")
+    parser.add_argument("--abiertos", type=int, default=64, help="pedidos abiertos a la vez")
+    args = parser.parse_args(argv)
+
+    print(f"{'Formato':<7} {'Líneas':>9} {'Archivo':>10} {'Pedidos':>9} {'Líneas/s':>10} {'Memoria máx.':>13}")
+    print("-" * 63)
+    with tempfile.TemporaryDirectory(prefix="ingesta_") as carpeta:
+        for formato in [f.strip() for f in args.formatos.split(",") if f.strip()]:
+            for cantidad in [int(t) for t in args.lineas.split(",") if t.strip()]:
+                ruta = os.path.join(carpeta, f"pedidos_{cantidad}.{formato}")
+                escribir(ruta, formato, cantidad)
+                estadisticas, total = consumir(ruta, args.abiertos)
+                velocidad = estadisticas.lineas_por_segundo
+
+                tracemalloc.start()
+                try:
+                    _, total_medido = consumir(ruta, args.abiertos)
+                    pico = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                if estadisticas.lineas != cantidad or total != total_medido:
+                    print(f"ERROR: la ingesta de {ruta} no leyó lo que se escribió")
+                    return 1
+                print(f"{formato:<7} {cantidad:>9} {os.path.getsize(ruta) / 2**20:8.1f}MB "
+                      f"{estadisticas.pedidos:>9} {velocidad:>10,.0f} {pico / 2**10:10.0f} KB")
+                os.remove(ruta)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# ============================================================
+# BENCHMARK_MEMORIA.PY
+# Autor: Luis Henry Baldeón Ochoa
+# Objetivo:
+#   Medir cuántos bytes ocupa cada objeto de las clases del curso
+#   (Producto, Cliente, Reserva, Cita, MiembroUniversidad, Empleado) frente
+#   a sus variantes con __slots__, creando un millón de cada una.
+#
+# Uso:
+#   python benchmark_memoria.py [--objetos 1000000]
+#
+#   Todos los objetos comparten los mismos valores de atributos, así se
+#   mide solo el objeto y no los textos que guarda. Para Producto también
+#   se muestra el CatalogoColumnar de catalogo_columnar.py (un precio en
+#   una columna y el nombre en una lista, sin un objeto por producto).
+#
+#   Desde Python 3.11 los atributos de un objeto normal van en línea
+#   mientras nadie pida su __dict__, por eso la diferencia es menor que en
+#   versiones anteriores.
+# ============================================================
+
+import argparse
+import gc
+import importlib.util
+import os
+import sys
+import tracemalloc
+from decimal import Decimal
+from typing import Callable, List
+
+from catalogo_columnar import CatalogoColumnar
+from sistema_reservas import Cliente, ClienteCompacto, Reserva, ReservaCompacta
+from tienda_virtual import Producto, ProductoCompacto
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def cargar(ruta_relativa: str):
+    """Importa un archivo del curso por su ruta (los nombres con espacios o números no se importan normalmente)."""
+    ruta = os.path.join(RAIZ, ruta_relativa)
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    spec = importlib.util.spec_from_file_location(f"_curso_{nombre}", ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def bytes_por_objeto(crear: Callable[[], object], cantidad: int) -> float:
+    """Memoria que agrega cada objeto creado (la lista que los guarda ya existe antes de medir)."""
+    objetos = [None] * cantidad
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for i in range(cantidad):
+            objetos[i] = crear()
+        usados = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del objetos
+    return usados / cantidad
+
+
+def bytes_por_fila_columnar(cantidad: int) -> float:
+    """Memoria por producto de un CatalogoColumnar (nombre compartido, precio en la columna)."""
+    nombres = ["Laptop"] * cantidad
+    precios = [850] * cantidad
+    gc.collect()
+    tracemalloc.start()
+    try:
+        catalogo = CatalogoColumnar(nombres, precios)
+        usados = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del catalogo
+    return usados / cantidad
+
+
+def casos():
+    """(clase, original, compacta, argumentos, método a comparar)."""
+    citas = cargar(os.path.join("SEMANA 2", "01_abstraccion_sistema_citas.py"))
+    universidad = cargar(os.path.join("SEMANA 2", "03_herencia_roles_universidad.py"))
+    empleados = cargar(os.path.join("SEMANA 6", "tarea_poo_semana6.py"))
+    cliente = Cliente("Luis Henry Baldeón Ochoa", "0605386986")
+    return [
+        ("Producto", Producto, ProductoCompacto, ("Laptop", Decimal("850.00")), "mostrar_producto"),
+        ("Cliente", Cliente, ClienteCompacto, ("Luis Henry Baldeón Ochoa", "0605386986"), "mostrar_datos"),
+        ("Reserva", Reserva, ReservaCompacta, (cliente, "20/12/2025", "Hotel Amazónico"), "confirmar_reserva"),
+        ("Cita", citas.Cita, citas.CitaCompacta,
+         ("Luis Baldeón", "Dra. Ramírez", "10-12-2025", "Medicina General"), "resumen"),
+        ("MiembroUniversidad", universidad.MiembroUniversidad, universidad.MiembroUniversidadCompacto,
+         ("María López", "maria@uea.edu.ec", "EST-001"), "presentar"),
+        ("Empleado", empleados.Empleado, empleados.EmpleadoCompacto,
+         ("Ana Torres", "0102030405", 500.00), "calcular_pago"),
+    ]
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Bytes por objeto: clases normales frente a __slots__")
+    parser.add_argument("--objetos", type=int, default=1_000_000, help="objetos a crear de cada clase")
+    args = parser.parse_args(argv)
+
+    print(f"{args.objetos} objetos de cada clase")
+    print(f"{'Clase':<20} {'Normal':>10} {'__slots__':>10} {'Ahorro':>8}")
+    print("-" * 51)
+    for nombre, original, compacta, argumentos, metodo in casos():
+        normal, compacto = original(*argumentos), compacta(*argumentos)
+        if getattr(normal, metodo)() != getattr(compacto, metodo)():
+            print(f"ERROR: {compacta.__name__}.{metodo}() no da lo mismo que {original.__name__}.{metodo}()")
+            return 1
+        if hasattr(compacto, "__dict__"):
+            print(f"ERROR: {compacta.__name__} todavía tiene __dict__")
+            return 1
+        antes = bytes_por_objeto(lambda: original(*argumentos), args.objetos)
+        despues = bytes_por_objeto(lambda: compacta(*argumentos), args.objetos)
+        print(f"{nombre:<20} {antes:8.1f} B {despues:8.1f} B {1 - despues / antes:7.0%}")
+    columnar = bytes_por_fila_columnar(args.objetos)
+    print(f"{'Producto (columnas)':<20} {'':>10} {columnar:8.1f} B")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# ============================================================
+# BENCHMARK_RESERVAS.PY
+# Autor: Luis Henry Baldeón Ochoa
+# Objetivo:
+#   Comparar el MotorReservas de motor_reservas.py (agenda ordenada por
+#   lugar) con recorrer la lista de todas las reservas, con un millón de
+#   reservas ya cargadas.
+#
+# Uso:
+#   python benchmark_reservas.py [--reservas 1000000] [--lugares 2000] [--consultas 20]
+#
+#   Mide el tiempo por consulta de:
+#     lugares libres   qué lugares no tienen reservas entre dos fechas
+#     reservar         comprobar que un lugar está libre y registrar la reserva
+#     reservas de un lugar   las reservas que ocupan una semana de un lugar
+# ============================================================
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, List
+
+from motor_reservas import MotorReservas, ReservaSolapada, formatear_rango, parsear_rango
+from sistema_reservas import Cliente, Reserva
+
+
+def generar_reservas(cantidad: int, lugares: int, semilla: int = 1) -> List[Reserva]:
+    """Estadías de 1 a 7 noches, una detrás de otra en cada lugar, con días libres entre medio."""
+    rnd = random.Random(semilla)
+    clientes = [Cliente(f"Cliente {i}", f"{i:010d}") for i in range(100)]
+    inicio = date(2020, 1, 1)
+    reservas = []
+    for numero in range(lugares):
+        lugar = f"Lugar {numero}"
+        dia = inicio + timedelta(days=rnd.randint(0, 6))
+        for _ in range(cantidad // lugares + (numero < cantidad % lugares)):
+            salida = dia + timedelta(days=rnd.randint(1, 7))
+            reservas.append(Reserva(rnd.choice(clientes), formatear_rango(dia, salida), lugar))
+            dia = salida + timedelta(days=rnd.randint(0, 3))
+    rnd.shuffle(reservas)
+    return reservas
+
+
+def por_consulta(funcion: Callable[[object], object], consultas: List[object]):
+    inicio = time.perf_counter()
+    resultados = [funcion(consulta) for consulta in consultas]
+    return (time.perf_counter() - inicio) / max(1, len(consultas)), resultados
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark del motor de reservas")
+    parser.add_argument("--reservas", type=int, default=1_000_000, help="reservas ya cargadas")
+    parser.add_argument("--lugares", type=int, default=2000, help="lugares distintos")
+    parser.add_argument("--consultas", type=int, default=20, help="consultas por escenario")
+    args = parser.parse_args(argv)
+
+    reservas = generar_reservas(args.reservas, args.lugares)
+    # la lista de comparación ya tiene las fechas convertidas: solo se mide el recorrido
+    todas = [(r.lugar, *(d.toordinal() for d in parsear_rango(r.fecha))) for r in reservas]
+    lugares = sorted({r.lugar for r in reservas})
+    ultimo = max(salida for _, _, salida in todas)
+
+    inicio = time.perf_counter()
+    motor = MotorReservas()
+    motor.cargar(reservas)
+    print(f"{len(motor)} reservas en {len(lugares)} lugares; cargarlas tomó {time.perf_counter() - inicio:.2f}s")
+
+    rnd = random.Random(2)
+    rangos = []
+    for _ in range(args.consultas):
+        entrada = date.fromordinal(rnd.randint(todas[0][1], ultimo))
+        rangos.append((entrada, entrada + timedelta(days=rnd.randint(1, 4))))
+    posibles = [(rnd.choice(lugares), *rango) for rango in rangos]
+
+    def lista_libres(rango):
+        desde, hasta = (d.toordinal() for d in rango)
+        ocupados = {lugar for lugar, entrada, salida in todas if entrada < hasta and desde < salida}
+        return [lugar for lugar in motor.lugares if lugar not in ocupados]
+
+    def lista_reservar(pedido):
+        lugar, entrada, salida = pedido
+        desde, hasta = entrada.toordinal(), salida.toordinal()
+        return not any(l == lugar and e < hasta and desde < s for l, e, s in todas)
+
+    def motor_reservar(pedido):
+        lugar, entrada, salida = pedido
+        try:
+            reserva = motor.nueva_reserva(Cliente("Nuevo", "0"), lugar, entrada, salida)
+        except ReservaSolapada:
+            return False
+        motor.cancelar(reserva)  # se deshace para que todas las consultas vean lo mismo
+        return True
+
+    def lista_de_lugar(pedido):
+        lugar, entrada, _ = pedido
+        desde, hasta = entrada.toordinal(), entrada.toordinal() + 7
+        return sorted(e for l, e, s in todas if l == lugar and e < hasta and desde < s)
+
+    def motor_de_lugar(pedido):
+        lugar, entrada, _ = pedido
+        cruzadas = motor.reservas_en(lugar, entrada, entrada + timedelta(days=7))
+        return [parsear_rango(r.fecha)[0].toordinal() for r in cruzadas]
+
+    escenarios = [
+        ("lugares libres", lista_libres, lambda rango: motor.lugares_libres(*rango), rangos),
+        ("reservar", lista_reservar, motor_reservar, posibles),
+        ("reservas de un lugar", lista_de_lugar, motor_de_lugar, posibles),
+    ]
+    print(f"{'Escenario':<22} {'Recorrer':>12} {'Motor':>12} {'Mejora':>9}")
+    print("-" * 58)
+    for nombre, recorrer, con_motor, consultas in escenarios:
+        t_lista, r_lista = por_consulta(recorrer, consultas)
+        t_motor, r_motor = por_consulta(con_motor, consultas)
+        if r_lista != r_motor:
+            print(f"ERROR: los resultados no coinciden en '{nombre}'")
+            return 1
+        mejora = t_lista / t_motor if t_motor > 0 else float("inf")
+        print(f"{nombre:<22} {t_lista * 1000:10.3f}ms {t_motor * 1000:10.3f}ms {mejora:8.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
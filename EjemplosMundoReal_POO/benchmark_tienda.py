@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# ============================================================
+# BENCHMARK_TIENDA.PY
+# Autor: Luis Henry Baldeón Ochoa
+# Objetivo:
+#   Comparar el CarritoCompras de tienda_virtual.py (líneas agrupadas y
+#   total al día) con el carrito original, que guardaba una lista y
+#   sumaba todos los precios cada vez que se pedía el total.
+#
+# Uso:
+#   python benchmark_tienda.py [--lineas 1000,4000,10000] [--catalogo 500] [--repeticiones 5]
+#
+#   Para cada tamaño mide:
+#     agregar + total   agregar uno por uno y leer el total después de cada
+#                       cambio (como en un checkout que muestra el total)
+#     agregar en bloque todos de una vez y un solo total al final
+#     quitar + total    quitar la mitad, uno por uno, leyendo el total
+# ============================================================
+
+import argparse
+import random
+import sys
+import time
+from decimal import Decimal
+from typing import Callable, List, Tuple
+
+from tienda_virtual import CarritoCompras, Producto
+
+
+class CarritoLista:
+    """El carrito original: una lista y una suma completa en cada total."""
+    def __init__(self):
+        self.productos = []
+
+    def agregar_producto(self, producto):
+        self.productos.append(producto)
+
+    def quitar_producto(self, producto):
+        self.productos.remove(producto)
+
+    def calcular_total(self):
+        total = 0
+        for producto in self.productos:
+            total += producto.precio
+        return total
+
+
+def generar_productos(cantidad: int, catalogo: int, semilla: int = 1) -> List[Producto]:
+    """`cantidad` productos elegidos al azar de un catálogo (hay repetidos)."""
+    rnd = random.Random(semilla)
+    disponibles = [Producto(f"Producto {i}", Decimal(rnd.randint(100, 99999)) / 100) for i in range(catalogo)]
+    return [rnd.choice(disponibles) for _ in range(cantidad)]
+
+
+def cronometrar(funcion: Callable[[], object], repeticiones: int = 5,
+                presupuesto: float = 1.0) -> Tuple[float, object]:
+    """Mejor tiempo de hasta `repeticiones` corridas (deja de repetir al pasar `presupuesto` segundos)."""
+    mejor, gastado, resultado = float("inf"), 0.0, None
+    for _ in range(max(1, repeticiones)):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        tiempo = time.perf_counter() - inicio
+        mejor = min(mejor, tiempo)
+        gastado += tiempo
+        if gastado > presupuesto:
+            break
+    return mejor, resultado
+
+
+def escenarios(productos: List[Producto]):
+    mitad = productos[: len(productos) // 2]
+
+    def lista_agregar():
+        carrito = CarritoLista()
+        for p in productos:
+            carrito.agregar_producto(p)
+            total = carrito.calcular_total()
+        return total
+
+    def nuevo_agregar():
+        carrito = CarritoCompras()
+        for p in productos:
+            carrito.agregar_producto(p)
+            total = carrito.calcular_total()
+        return total
+
+    def lista_bloque():
+        carrito = CarritoLista()
+        for p in productos:
+            carrito.agregar_producto(p)
+        return carrito.calcular_total()
+
+    def nuevo_bloque():
+        carrito = CarritoCompras()
+        carrito.agregar_productos(productos)
+        return carrito.calcular_total()
+
+    def lista_quitar():
+        carrito = CarritoLista()
+        carrito.productos = list(productos)
+        for p in mitad:
+            carrito.quitar_producto(p)
+            total = carrito.calcular_total()
+        return total
+
+    def nuevo_quitar():
+        carrito = CarritoCompras()
+        carrito.agregar_productos(productos)
+        for p in mitad:
+            carrito.quitar_producto(p)
+            total = carrito.calcular_total()
+        return total
+
+    return [
+        ("agregar + total", lista_agregar, nuevo_agregar),
+        ("agregar en bloque", lista_bloque, nuevo_bloque),
+        ("quitar + total", lista_quitar, nuevo_quitar),
+    ]
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark del carrito de tienda_virtual.py")
+    parser.add_argument("--lineas", default="1000,4000,10000", help="productos por carrito, separados por coma")
+    parser.add_argument("--catalogo", type=int, default=500, help="productos distintos a elegir")
+    parser.add_argument("--repeticiones", type=int, default=5, help="se informa la mejor corrida")
+    args = parser.parse_args(argv)
+
+    print(f"{'Productos':>9}  {'Escenario':<18} {'Lista':>10} {'Agrupado':>10} {'Mejora':>8}")
+    print("-" * 62)
+    for cantidad in [int(t) for t in args.lineas.split(",") if t.strip()]:
+        productos = generar_productos(cantidad, args.catalogo)
+        for nombre, con_lista, agrupado in escenarios(productos):
+            t_lista, total_lista = cronometrar(con_lista, args.repeticiones)
+            t_nuevo, total_nuevo = cronometrar(agrupado, args.repeticiones)
+            if total_lista != total_nuevo:
+                print(f"ERROR: los totales no coinciden en '{nombre}': {total_lista} != {total_nuevo}")
+                return 1
+            mejora = t_lista / t_nuevo if t_nuevo > 0 else float("inf")
+            print(f"{cantidad:>9}  {nombre:<18} {t_lista * 1000:8.1f}ms {t_nuevo * 1000:8.1f}ms {mejora:7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,264 @@
+# Catálogo - Ejemplo de Programación Orientada a Objetos
+# Autor: Luis Henry Baldeón Ochoa
+# Descripción: Catálogo de productos de la tienda con índices para buscar
+# por nombre, por rango de precio y por prefijo (autocompletar) sin
+# recorrer toda la lista.
+
+import gc
+from bisect import bisect_left, insort
+from decimal import Decimal
+from itertools import islice, takewhile
+from operator import itemgetter
+
+from tienda_virtual import Producto
+
+
+class _IndiceOrdenado:
+    """
+    Entradas (clave, nombre, producto) en orden, repartidas en bloques de
+    unos pocos cientos (como los nombres no se repiten, las tuplas nunca
+    llegan a comparar el producto). `maximos` guarda la última entrada de
+    cada bloque: bisect sobre ella elige el bloque y otro bisect dentro del
+    bloque da la posición. Insertar o quitar solo mueve los elementos de un
+    bloque, no los de toda la lista, así que sigue siendo barato con un
+    millón de productos.
+    """
+    TAMANO_BLOQUE = 512
+
+    def __init__(self):
+        self.bloques = []
+        self.maximos = []
+
+    def cargar(self, entradas):
+        """Reemplaza el contenido con (clave, nombre, producto) ordenando una sola vez."""
+        # dos ordenamientos estables (primero por nombre, después por clave)
+        # dan el mismo orden que comparar tuplas y son bastante más rápidos
+        ordenados = sorted(sorted(entradas, key=itemgetter(1)), key=itemgetter(0))
+        tamano = self.TAMANO_BLOQUE
+        self.bloques = [ordenados[i:i + tamano] for i in range(0, len(ordenados), tamano)]
+        self.maximos = [bloque[-1] for bloque in self.bloques]
+
+    def insertar(self, clave, producto):
+        entrada = (clave, producto.nombre, producto)
+        if not self.bloques:
+            self.bloques.append([entrada])
+            self.maximos.append(entrada)
+            return
+        i = min(bisect_left(self.maximos, entrada), len(self.bloques) - 1)
+        bloque = self.bloques[i]
+        insort(bloque, entrada)
+        self.maximos[i] = bloque[-1]
+        if len(bloque) > 2 * self.TAMANO_BLOQUE:
+            # el bloque creció demasiado: se parte en dos mitades
+            mitad = len(bloque) // 2
+            self.bloques[i:i + 1] = [bloque[:mitad], bloque[mitad:]]
+            self.maximos[i:i + 1] = [bloque[mitad - 1], bloque[-1]]
+
+    def quitar(self, clave, nombre):
+        entrada = (clave, nombre)
+        i = bisect_left(self.maximos, entrada)
+        bloque = self.bloques[i]
+        del bloque[bisect_left(bloque, entrada)]
+        if bloque:
+            self.maximos[i] = bloque[-1]
+        else:
+            del self.bloques[i]
+            del self.maximos[i]
+
+    def _inicio(self, clave):
+        """(bloque, posición) de la primera entrada con clave >= `clave`."""
+        # (clave,) es menor que cualquier (clave, nombre)
+        inicio = (clave,)
+        i = bisect_left(self.maximos, inicio)
+        if i == len(self.bloques):
+            return i, 0
+        return i, bisect_left(self.bloques[i], inicio)
+
+    def _desde(self, clave):
+        """Recorre las entradas desde la primera con clave >= `clave`."""
+        i, j = self._inicio(clave)
+        for bloque in islice(self.bloques, i, None):
+            yield from islice(bloque, j, None)
+            j = 0
+
+    def rango(self, desde=None, hasta=None):
+        """Productos con desde <= clave <= hasta (extremos opcionales), en orden."""
+        i, j = (0, 0) if desde is None else self._inicio(desde)
+        productos = []
+        for b in range(i, len(self.bloques)):
+            entradas = islice(self.bloques[b], j, None)
+            j = 0
+            if hasta is None or self.maximos[b][0] <= hasta:
+                # el bloque entero cae en el rango: sin comparar entrada por entrada
+                productos.extend(map(itemgetter(2), entradas))
+            else:
+                productos.extend(e[2] for e in takewhile(lambda e: e[0] <= hasta, entradas))
+                break
+        return productos
+
+    def con_prefijo(self, prefijo, limite=None):
+        """Productos cuya clave empieza con `prefijo`, en orden."""
+        encontrados = takewhile(lambda e: e[0].startswith(prefijo), self._desde(prefijo))
+        return [e[2] for e in islice(encontrados, limite)]
+
+
+class Catalogo:
+    """
+    Catálogo de productos de la tienda, con tres índices:
+
+    - por nombre: un diccionario, buscar(nombre) es O(1)
+    - por precio: claves ordenadas, por_precio(20, 100) es O(log n) más
+      lo que devuelve
+    - por prefijo: nombres en minúsculas ordenados, para autocompletar
+
+    Los índices se mantienen al día en cada agregar, actualizar y quitar.
+    Para cambiar un producto hay que usar actualizar(): si se cambia el
+    objeto Producto directamente, los índices no se enteran.
+    """
+    def __init__(self, productos=()):
+        self._por_nombre = {}
+        self._indice_precio = _IndiceOrdenado()
+        self._indice_prefijo = _IndiceOrdenado()
+        self.agregar_productos(productos)
+
+    @staticmethod
+    def _decimal(valor):
+        # el mismo criterio que el carrito: los precios se comparan como Decimal
+        if isinstance(valor, Decimal):
+            return valor
+        if isinstance(valor, int):
+            return Decimal(valor)
+        return Decimal(str(valor))
+
+    @classmethod
+    def _precio(cls, producto):
+        return cls._decimal(producto.precio)
+
+    @staticmethod
+    def _clave_texto(texto):
+        return texto.casefold()
+
+    def __len__(self):
+        return len(self._por_nombre)
+
+    def __contains__(self, nombre):
+        return nombre in self._por_nombre
+
+    def __iter__(self):
+        return iter(self._por_nombre.values())
+
+    def agregar(self, producto):
+        # el precio se valida antes de tocar nada: si no es un número, el
+        # catálogo queda como estaba
+        self._insertar(producto, self._precio(producto))
+
+    def _insertar(self, producto, precio):
+        if producto.nombre in self._por_nombre:
+            raise ValueError(f"{producto.nombre} ya está en el catálogo")
+        self._indice_precio.insertar(precio, producto)
+        self._indice_prefijo.insertar(self._clave_texto(producto.nombre), producto)
+        self._por_nombre[producto.nombre] = producto
+
+    def agregar_productos(self, productos):
+        """
+        Agrega muchos productos de una vez. Con muchos productos conviene
+        más que agregar() uno por uno: los índices se ordenan una sola vez
+        en vez de insertar cada entrada en su lugar. Todo o nada: si algún
+        nombre se repite (con el catálogo o dentro de la lista) o algún
+        precio no es un número, no se agrega ninguno.
+        """
+        # armar millones de tuplas dispara el recolector de ciclos una y otra
+        # vez (y ninguna forma ciclos): se pausa mientras dura la carga
+        recolector = gc.isenabled()
+        gc.disable()
+        try:
+            self._agregar_todos(productos)
+        finally:
+            if recolector:
+                gc.enable()
+
+    def _agregar_todos(self, productos):
+        nuevos = {}
+        precios = []
+        for producto in productos:
+            if producto.nombre in self._por_nombre or producto.nombre in nuevos:
+                raise ValueError(f"{producto.nombre} ya está en el catálogo")
+            nuevos[producto.nombre] = producto
+            precios.append(self._precio(producto))
+        # pocos productos frente a los que ya hay: sale más barato insertarlos
+        if len(nuevos) < 64 or len(nuevos) < len(self._por_nombre) // 8:
+            for producto, precio in zip(nuevos.values(), precios):
+                self._insertar(producto, precio)
+            return
+        # los índices se arman con las entradas que ya tenían más las nuevas
+        # (sin volver a convertir precios) y el diccionario se toca al final
+        por_precio = [e for bloque in self._indice_precio.bloques for e in bloque]
+        por_prefijo = [e for bloque in self._indice_prefijo.bloques for e in bloque]
+        por_precio.extend(zip(precios, nuevos, nuevos.values()))
+        por_prefijo.extend(zip(map(self._clave_texto, nuevos), nuevos, nuevos.values()))
+        self._indice_precio.cargar(por_precio)
+        self._indice_prefijo.cargar(por_prefijo)
+        self._por_nombre.update(nuevos)
+
+    def buscar(self, nombre):
+        """El producto con ese nombre exacto, o None."""
+        return self._por_nombre.get(nombre)
+
+    def quitar(self, nombre):
+        producto = self._por_nombre.pop(nombre, None)
+        if producto is None:
+            raise ValueError(f"{nombre} no está en el catálogo")
+        self._indice_precio.quitar(self._precio(producto), nombre)
+        self._indice_prefijo.quitar(self._clave_texto(nombre), nombre)
+        return producto
+
+    def actualizar(self, nombre, precio=None, nombre_nuevo=None):
+        """Cambia el precio y/o el nombre de un producto y corrige los índices."""
+        producto = self._por_nombre.get(nombre)
+        if producto is None:
+            raise ValueError(f"{nombre} no está en el catálogo")
+        if nombre_nuevo is not None and nombre_nuevo != nombre and nombre_nuevo in self._por_nombre:
+            raise ValueError(f"{nombre_nuevo} ya está en el catálogo")
+        if precio is not None:
+            self._decimal(precio)  # un precio inválido falla antes de tocar los índices
+        self.quitar(nombre)
+        if precio is not None:
+            producto.precio = precio
+        if nombre_nuevo is not None:
+            producto.nombre = nombre_nuevo
+        self.agregar(producto)
+        return producto
+
+    def por_precio(self, minimo=None, maximo=None):
+        """Productos con minimo <= precio <= maximo, del más barato al más caro."""
+        desde = None if minimo is None else self._decimal(minimo)
+        hasta = None if maximo is None else self._decimal(maximo)
+        return self._indice_precio.rango(desde, hasta)
+
+    def autocompletar(self, prefijo, limite=10):
+        """Hasta `limite` productos cuyo nombre empieza con `prefijo` (sin distinguir mayúsculas), en orden alfabético."""
+        return self._indice_prefijo.con_prefijo(self._clave_texto(prefijo), limite)
+
+
+if __name__ == "__main__":
+    catalogo = Catalogo([
+        Producto("Laptop", 850),
+        Producto("Mouse", 25),
+        Producto("Monitor", 199.99),
+        Producto("Micrófono", 60),
+        Producto("Teclado", "45.50"),
+    ])
+
+    print("Entre $20 y $100:")
+    for producto in catalogo.por_precio(20, 100):
+        print(" ", producto.mostrar_producto())
+
+    print("Autocompletar 'mo':")
+    for producto in catalogo.autocompletar("mo"):
+        print(" ", producto.mostrar_producto())
+
+    catalogo.actualizar("Monitor", precio=99)
+    catalogo.quitar("Mouse")
+    print("Entre $20 y $100 después de actualizar:")
+    for producto in catalogo.por_precio(20, 100):
+        print(" ", producto.mostrar_producto())
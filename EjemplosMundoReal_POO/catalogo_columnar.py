@@ -0,0 +1,281 @@
+# Catálogo Columnar - Ejemplo de Programación Orientada a Objetos
+# Autor: Luis Henry Baldeón Ochoa
+# Descripción: Catálogo de productos guardado por columnas (nombres en una
+# lista, precios en un arreglo tipado) que reprecia todo el catálogo de una
+# vez y entrega vistas que se usan como un Producto.
+#
+# Con NumPy las operaciones sobre la columna corren en C. Sin NumPy la
+# columna es un array('q') y cada operación es un bucle de Python sobre
+# ella: ocupa lo mismo, pero no es más rápido que recorrer una lista.
+
+from array import array
+from decimal import Decimal, ROUND_HALF_UP
+
+from tienda_virtual import Producto
+
+try:
+    import numpy as np
+except ImportError:  # sin NumPy las columnas son array('q') de la biblioteca estándar
+    np = None
+
+CENTAVO = Decimal("0.01")
+# Límite de un entero de 64 bits con signo, el tipo de la columna de precios
+_MAXIMO_INT64 = 2 ** 63 - 1
+
+
+def a_centavos(precio):
+    """Convierte un precio (int, float, str o Decimal) a centavos enteros, redondeando a la mitad hacia arriba."""
+    if not isinstance(precio, Decimal):
+        # str() primero: Decimal(0.1) arrastraría el error del float
+        precio = Decimal(precio) if isinstance(precio, int) else Decimal(str(precio))
+    centavos = int(precio.quantize(CENTAVO, rounding=ROUND_HALF_UP).scaleb(2))
+    if centavos < 0:
+        raise ValueError("El precio no puede ser negativo")
+    if centavos > _MAXIMO_INT64:
+        raise OverflowError("El precio no cabe en la columna de precios")
+    return centavos
+
+
+def _columna(centavos):
+    """Crea la columna de precios con el motor disponible."""
+    if np is not None:
+        return np.array(centavos, dtype=np.int64)
+    return array("q", centavos)
+
+
+def _posiciones(indices):
+    """`indices` (lista, array('q') o arreglo de NumPy) como arreglo de NumPy, para indexar la columna."""
+    return None if indices is None else np.asarray(indices, dtype=np.int64)
+
+
+class ProductoVista:
+    """
+    Un producto del catálogo que no guarda datos propios: lee y escribe la
+    fila `indice` de las columnas. Si el catálogo se reprecia, la vista ve
+    el precio nuevo; congelar() da un Producto independiente.
+
+    Como ProductoCompacto, no hereda de Producto (que tiene __dict__) sino
+    que toma sus métodos: así __slots__ sí evita el __dict__ de cada vista.
+    Por eso isinstance(vista, Producto) es False: sirve donde se usan
+    nombre, precio y mostrar_producto(), no donde se pregunta por la clase.
+    """
+    __slots__ = ("_catalogo", "_indice")
+
+    mostrar_producto = Producto.mostrar_producto
+
+    def __init__(self, catalogo, indice):
+        self._catalogo = catalogo
+        self._indice = indice
+
+    @property
+    def nombre(self):
+        return self._catalogo._nombres[self._indice]
+
+    @nombre.setter
+    def nombre(self, valor):
+        self._catalogo._nombres[self._indice] = valor
+
+    @property
+    def precio(self):
+        return Decimal(int(self._catalogo._centavos[self._indice])).scaleb(-2)
+
+    @precio.setter
+    def precio(self, valor):
+        self._catalogo._centavos[self._indice] = a_centavos(valor)
+
+    def congelar(self):
+        """Copia el producto con su precio actual (para guardarlo en un carrito, por ejemplo)."""
+        return Producto(self.nombre, self.precio)
+
+    # copy.copy() de una vista (lo que hace CarritoCompras) da el Producto congelado
+    __copy__ = congelar
+
+    def __repr__(self):
+        return f"ProductoVista({self.nombre!r}, {self.precio})"
+
+
+class CatalogoColumnar:
+    """
+    Catálogo de productos guardado por columnas.
+
+    Los nombres van en una lista y los precios en una sola columna de
+    centavos enteros (un arreglo de NumPy si está instalado, si no un
+    array('q')). Así un millón de productos no son un millón de objetos, y
+    los descuentos, impuestos o cambios de moneda se aplican a la columna
+    entera en una sola llamada (en C con NumPy, con un bucle sin él). Los centavos enteros mantienen el dinero exacto: cada
+    operación multiplica por una fracción exacta y redondea al centavo.
+    """
+    def __init__(self, nombres=(), precios=()):
+        self._nombres = list(nombres)
+        self._centavos = _columna([a_centavos(p) for p in precios])
+        if len(self._nombres) != len(self._centavos):
+            raise ValueError("Debe haber un precio por cada nombre")
+
+    @classmethod
+    def desde_productos(cls, productos):
+        """Crea el catálogo copiando nombre y precio de objetos Producto."""
+        productos = list(productos)
+        return cls([p.nombre for p in productos], [p.precio for p in productos])
+
+    @property
+    def motor(self):
+        return "numpy" if np is not None else "array"
+
+    def __len__(self):
+        return len(self._nombres)
+
+    def __getitem__(self, indice):
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice fuera del catálogo")
+        return ProductoVista(self, indice)
+
+    def __iter__(self):
+        for indice in range(len(self)):
+            yield ProductoVista(self, indice)
+
+    def agregar_productos(self, nombres, precios):
+        """Agrega muchos productos de una vez (mejor que uno por uno: con NumPy cada agregado copia la columna)."""
+        nombres = list(nombres)
+        nuevos = [a_centavos(p) for p in precios]
+        if len(nombres) != len(nuevos):
+            raise ValueError("Debe haber un precio por cada nombre")
+        if np is not None:
+            self._centavos = np.concatenate([self._centavos, np.array(nuevos, dtype=np.int64)])
+        else:
+            self._centavos.extend(nuevos)
+        self._nombres.extend(nombres)
+
+    def agregar_producto(self, nombre, precio):
+        self.agregar_productos([nombre], [precio])
+        return self[len(self) - 1]
+
+    # ---------------------- Operaciones por columna ----------------------
+
+    def _escalar(self, factor, indices):
+        """Multiplica los precios elegidos por `factor` (Decimal), redondeando al centavo."""
+        # factor = num / den exacto; (2·c·num + den) // (2·den) redondea a la
+        # mitad hacia arriba sin pasar por float
+        num, den = factor.as_integer_ratio()
+        if np is not None:
+            indices = _posiciones(indices)
+            columna = self._centavos if indices is None else self._centavos[indices]
+            mayor = int(columna.max()) if len(columna) else 0
+            if 2 * max(mayor, 1) * num + den <= _MAXIMO_INT64:
+                nuevos = (2 * num * columna + den) // (2 * den)
+            else:
+                # el producto intermedio no cabe en 64 bits: enteros de Python
+                resultado = [(2 * int(c) * num + den) // (2 * den) for c in columna]
+                if resultado and max(resultado) > _MAXIMO_INT64:
+                    raise OverflowError("Un precio resultante no cabe en la columna de precios")
+                nuevos = np.array(resultado, dtype=np.int64)
+            if indices is None:
+                self._centavos = nuevos
+            else:
+                self._centavos[indices] = nuevos
+            return
+        columna = self._centavos
+        doble_num, doble_den = 2 * num, 2 * den
+        if indices is None:
+            nuevos = [(c * doble_num + den) // doble_den for c in columna]
+        else:
+            nuevos = [(columna[i] * doble_num + den) // doble_den for i in indices]
+        if nuevos and max(nuevos) > _MAXIMO_INT64:
+            raise OverflowError("Un precio resultante no cabe en la columna de precios")
+        if indices is None:
+            self._centavos = array("q", nuevos)
+        else:
+            for i, valor in zip(indices, nuevos):
+                columna[i] = valor
+
+    @staticmethod
+    def _porcentaje(porcentaje):
+        return porcentaje if isinstance(porcentaje, Decimal) else Decimal(str(porcentaje))
+
+    def aplicar_descuento(self, porcentaje, indices=None):
+        """Baja los precios un `porcentaje` (0 a 100). `indices` limita el cambio, p. ej. a lo que devolvió filtrar_por_precio()."""
+        porcentaje = self._porcentaje(porcentaje)
+        if not 0 <= porcentaje <= 100:
+            raise ValueError("El descuento debe estar entre 0 y 100")
+        self._escalar(1 - porcentaje / 100, indices)
+        return self
+
+    def aplicar_impuesto(self, porcentaje, indices=None):
+        """Sube los precios un `porcentaje` de impuesto."""
+        porcentaje = self._porcentaje(porcentaje)
+        if porcentaje < 0:
+            raise ValueError("El impuesto no puede ser negativo")
+        self._escalar(1 + porcentaje / 100, indices)
+        return self
+
+    def convertir_moneda(self, tasa, indices=None):
+        """Pasa los precios a otra moneda: cada precio se multiplica por `tasa`."""
+        tasa = self._porcentaje(tasa)
+        if tasa <= 0:
+            raise ValueError("La tasa de cambio debe ser mayor que cero")
+        self._escalar(tasa, indices)
+        return self
+
+    def filtrar_por_precio(self, minimo=None, maximo=None):
+        """
+        Posiciones de los productos con minimo <= precio <= maximo (ambos
+        opcionales), como array('q') con cualquiera de los dos motores.
+        """
+        desde = None if minimo is None else a_centavos(minimo)
+        hasta = None if maximo is None else a_centavos(maximo)
+        if np is not None:
+            mascara = np.ones(len(self._centavos), dtype=bool)
+            if desde is not None:
+                mascara &= self._centavos >= desde
+            if hasta is not None:
+                mascara &= self._centavos <= hasta
+            posiciones = array("q")
+            posiciones.frombytes(np.flatnonzero(mascara).astype(np.int64).tobytes())
+            return posiciones
+        desde = 0 if desde is None else desde
+        hasta = _MAXIMO_INT64 if hasta is None else hasta
+        return array("q", [i for i, c in enumerate(self._centavos) if desde <= c <= hasta])
+
+    def productos(self, indices=None):
+        """Vistas de los productos (todos, o los de `indices`)."""
+        if indices is None:
+            return iter(self)
+        return (ProductoVista(self, int(i)) for i in indices)
+
+    def total(self, indices=None):
+        """Suma de los precios (todos, o los de `indices`) como Decimal."""
+        if np is not None:
+            columna = self._centavos if indices is None else self._centavos[_posiciones(indices)]
+            # la suma en enteros de Python no se desborda aunque la columna sea grande
+            centavos = int(columna.sum(dtype=object)) if len(columna) else 0
+        elif indices is None:
+            centavos = sum(self._centavos)
+        else:
+            centavos = sum(self._centavos[i] for i in indices)
+        return Decimal(centavos).scaleb(-2)
+
+    def memoria_columnas(self):
+        """Bytes que ocupa la columna de precios (los nombres son objetos str aparte)."""
+        if np is not None:
+            return int(self._centavos.nbytes)
+        return self._centavos.itemsize * len(self._centavos)
+
+
+if __name__ == "__main__":
+    from tienda_virtual import CarritoCompras
+
+    catalogo = CatalogoColumnar(["Laptop", "Mouse", "Teclado", "Monitor"], [850, 25, "45.50", 199.99])
+    print(f"Motor: {catalogo.motor}")
+
+    # 15% de descuento a lo que cuesta 100 o más, luego 12% de impuesto a todo
+    caros = catalogo.filtrar_por_precio(minimo=100)
+    catalogo.aplicar_descuento(15, caros).aplicar_impuesto(12)
+    for producto in catalogo:
+        print(producto.mostrar_producto())
+
+    # Una vista se congela en un Producto con el precio del momento
+    carrito = CarritoCompras()
+    carrito.agregar_producto(catalogo[0].congelar())
+    carrito.agregar_producto(catalogo[1].congelar(), 2)
+    carrito.mostrar_carrito()
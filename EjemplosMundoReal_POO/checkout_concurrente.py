@@ -0,0 +1,216 @@
+# Checkout Concurrente - Ejemplo de Programación Orientada a Objetos
+# Autor: Luis Henry Baldeón Ochoa
+# Descripción: Inventario con reservas de stock seguras entre hilos, para
+# que dos compradores al mismo tiempo no se lleven la última Laptop.
+
+import itertools
+import threading
+from collections import Counter
+
+from tienda_virtual import CarritoCompras, Producto
+
+
+class StockInsuficiente(ValueError):
+    """No alcanza el stock de un producto para la reserva pedida."""
+    def __init__(self, nombre, pedidos, disponibles):
+        super().__init__(f"No hay stock suficiente de {nombre}: se pidieron {pedidos} y quedan {disponibles}")
+        self.nombre = nombre
+        self.pedidos = pedidos
+        self.disponibles = disponibles
+
+
+class Reserva:
+    """
+    Unidades apartadas para un carrito. Empieza ACTIVA y termina CONFIRMADA
+    (se vendieron) o LIBERADA (vuelven al stock).
+    """
+    ACTIVA = "ACTIVA"
+    CONFIRMADA = "CONFIRMADA"
+    LIBERADA = "LIBERADA"
+
+    def __init__(self, numero, lineas, total):
+        self.numero = numero
+        self.lineas = lineas  # nombre -> cantidad
+        self.total = total
+        self.estado = Reserva.ACTIVA
+
+    def __repr__(self):
+        return f"Reserva({self.numero}, {self.estado}, {self.lineas})"
+
+
+class Inventario:
+    """
+    Stock de la tienda que varios hilos pueden usar a la vez.
+
+    Cada producto cae en una de `franjas` cerraduras según su nombre
+    (bloqueo por franjas): dos compras de productos distintos casi nunca
+    se esperan entre sí, y una compra de varios productos toma sus franjas
+    siempre en el mismo orden, así no hay bloqueos mutuos. Con franjas=1
+    todo pasa por una sola cerradura.
+
+    Una compra se hace en dos pasos: reservar() aparta las unidades de todo
+    el carrito o de nada; después confirmar() las da por vendidas o
+    liberar() las devuelve. Entre los dos pasos (el pago, por ejemplo) no
+    se tiene ninguna cerradura tomada.
+    """
+    def __init__(self, franjas=64):
+        if franjas < 1:
+            raise ValueError("Debe haber al menos una franja")
+        self._cerraduras = [threading.Lock() for _ in range(franjas)]
+        self._disponible = {}
+        self._reservado = {}
+        self._vendido = {}
+        # por franja: cuántas veces se tomó y cuántas hubo que esperar
+        self._tomas = [0] * franjas
+        self._esperas = [0] * franjas
+        self._numeros = itertools.count(1)
+
+    def _franjas_de(self, nombres):
+        return sorted({hash(nombre) % len(self._cerraduras) for nombre in nombres})
+
+    def _tomar(self, franjas):
+        for franja in franjas:
+            cerradura = self._cerraduras[franja]
+            if not cerradura.acquire(blocking=False):
+                cerradura.acquire()
+                self._esperas[franja] += 1
+            # los contadores de una franja solo se tocan con su cerradura tomada
+            self._tomas[franja] += 1
+
+    def _soltar(self, franjas):
+        for franja in reversed(franjas):
+            self._cerraduras[franja].release()
+
+    def agregar_stock(self, producto, cantidad):
+        """Suma `cantidad` unidades de un producto (o de un nombre) al stock."""
+        if cantidad <= 0:
+            raise ValueError("La cantidad debe ser mayor que cero")
+        nombre = getattr(producto, "nombre", producto)
+        franjas = self._franjas_de([nombre])
+        self._tomar(franjas)
+        try:
+            self._disponible[nombre] = self._disponible.get(nombre, 0) + cantidad
+            self._reservado.setdefault(nombre, 0)
+            self._vendido.setdefault(nombre, 0)
+        finally:
+            self._soltar(franjas)
+
+    def disponible(self, nombre):
+        return self._disponible.get(nombre, 0)
+
+    def reservado(self, nombre):
+        return self._reservado.get(nombre, 0)
+
+    def vendido(self, nombre):
+        return self._vendido.get(nombre, 0)
+
+    def reservar(self, carrito):
+        """
+        Aparta todas las unidades del carrito. Si a algún producto no le
+        alcanza el stock lanza StockInsuficiente y no aparta nada.
+        """
+        pedidos = Counter()
+        for producto, cantidad, _ in carrito.lineas():
+            pedidos[producto.nombre] += cantidad
+        if not pedidos:
+            raise ValueError("El carrito está vacío")
+        franjas = self._franjas_de(pedidos)
+        self._tomar(franjas)
+        try:
+            for nombre, cantidad in pedidos.items():
+                quedan = self._disponible.get(nombre, 0)
+                if quedan < cantidad:
+                    raise StockInsuficiente(nombre, cantidad, quedan)
+            for nombre, cantidad in pedidos.items():
+                self._disponible[nombre] -= cantidad
+                self._reservado[nombre] += cantidad
+        finally:
+            self._soltar(franjas)
+        return Reserva(next(self._numeros), dict(pedidos), carrito.calcular_total())
+
+    def confirmar(self, reserva):
+        """Da por vendidas las unidades de una reserva activa."""
+        franjas = self._franjas_de(reserva.lineas)
+        self._tomar(franjas)
+        try:
+            # el estado se revisa con las franjas tomadas: una reserva no
+            # puede confirmarse y liberarse a la vez
+            if reserva.estado != Reserva.ACTIVA:
+                raise ValueError(f"La reserva {reserva.numero} ya está {reserva.estado.lower()}")
+            for nombre, cantidad in reserva.lineas.items():
+                self._reservado[nombre] -= cantidad
+                self._vendido[nombre] += cantidad
+            reserva.estado = Reserva.CONFIRMADA
+        finally:
+            self._soltar(franjas)
+
+    def liberar(self, reserva):
+        """
+        Devuelve al stock las unidades de una reserva activa. Liberar dos
+        veces no hace nada; liberar una reserva confirmada es un error.
+        Devuelve True si devolvió unidades.
+        """
+        franjas = self._franjas_de(reserva.lineas)
+        self._tomar(franjas)
+        try:
+            if reserva.estado == Reserva.LIBERADA:
+                return False
+            if reserva.estado == Reserva.CONFIRMADA:
+                raise ValueError(f"La reserva {reserva.numero} ya está confirmada")
+            for nombre, cantidad in reserva.lineas.items():
+                self._reservado[nombre] -= cantidad
+                self._disponible[nombre] += cantidad
+            reserva.estado = Reserva.LIBERADA
+            return True
+        finally:
+            self._soltar(franjas)
+
+    def comprar(self, carrito, pagar=None):
+        """
+        Reserva, cobra y confirma. `pagar(reserva)` corre sin cerraduras
+        tomadas; si lanza una excepción la reserva se libera y la excepción
+        sigue su camino.
+        """
+        reserva = self.reservar(carrito)
+        try:
+            if pagar is not None:
+                pagar(reserva)
+        except BaseException:
+            self.liberar(reserva)
+            raise
+        self.confirmar(reserva)
+        return reserva
+
+    def contencion(self):
+        """(veces que se tomó una franja, veces que hubo que esperarla)."""
+        return sum(self._tomas), sum(self._esperas)
+
+
+if __name__ == "__main__":
+    laptop = Producto("Laptop", 850)
+    inventario = Inventario()
+    inventario.agregar_stock(laptop, 1)
+
+    # Ocho compradores quieren la última Laptop al mismo tiempo
+    resultados = []
+    largada = threading.Barrier(8)
+
+    def comprador(numero):
+        carrito = CarritoCompras()
+        carrito.agregar_producto(laptop)
+        largada.wait()
+        try:
+            inventario.comprar(carrito)
+            resultados.append(f"Comprador {numero}: compró la Laptop")
+        except StockInsuficiente:
+            resultados.append(f"Comprador {numero}: sin stock")
+
+    hilos = [threading.Thread(target=comprador, args=(i,)) for i in range(1, 9)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    for linea in sorted(resultados):
+        print(linea)
+    print(f"Vendidas: {inventario.vendido('Laptop')} - Disponibles: {inventario.disponible('Laptop')}")
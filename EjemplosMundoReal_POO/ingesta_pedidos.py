@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# Ingesta de Pedidos - Ejemplo de Programación Orientada a Objetos
+# Autor: Luis Henry Baldeón Ochoa
+# Descripción: Lee lotes de pedidos desde archivos CSV o JSONL (también
+# comprimidos con gzip) línea por línea, arma un CarritoCompras por pedido
+# y entrega cada pedido apenas se completa. La memoria no depende del
+# tamaño del archivo: en cada momento solo hay unos pocos pedidos abiertos.
+#
+# Formato de cada línea: pedido, producto, precio y cantidad (opcional, 1
+# si falta). En CSV son columnas con esos nombres en el encabezado; en
+# JSONL, claves de un objeto por línea.
+#
+# Uso:
+#   python ingesta_pedidos.py archivo.csv [otro.jsonl.gz ...] [--abiertos 1]
+#                             [--saltar-errores] [--silencioso]
+#
+# Con las líneas ordenadas por pedido, cada pedido sale apenas empieza el
+# siguiente. Si los pedidos vienen mezclados, --abiertos N deja N pedidos
+# abiertos a la vez.
+
+import argparse
+import csv
+import gzip
+import json
+import sys
+import time
+from collections import OrderedDict
+from decimal import Decimal, InvalidOperation
+from operator import itemgetter
+
+from tienda_virtual import CarritoCompras, Producto
+
+CAMPOS = ("pedido", "producto", "precio", "cantidad")
+# cuántos números de pedidos ya entregados se recuerdan para detectar repetidos
+RECIENTES = 4096
+
+
+class EstadisticasIngesta:
+    """Contadores de una ingesta, para informar el avance y el rendimiento."""
+    def __init__(self):
+        self.lineas = 0
+        self.errores = 0
+        self.pedidos = 0
+        self.repetidos = 0
+        self.inicio = time.perf_counter()
+
+    @property
+    def segundos(self):
+        return time.perf_counter() - self.inicio
+
+    @property
+    def lineas_por_segundo(self):
+        segundos = self.segundos
+        return self.lineas / segundos if segundos > 0 else 0.0
+
+    def resumen(self):
+        texto = (f"{self.lineas} líneas, {self.pedidos} pedidos en {self.segundos:.2f}s "
+                 f"({self.lineas_por_segundo:,.0f} líneas/s)")
+        if self.errores:
+            texto += f", {self.errores} líneas con error saltadas"
+        if self.repetidos:
+            texto += f", {self.repetidos} pedidos partidos (su número volvió a aparecer)"
+        return texto
+
+
+def _abrir(ruta):
+    if ruta.endswith(".gz"):
+        return gzip.open(ruta, "rt", encoding="utf-8", newline="")
+    return open(ruta, encoding="utf-8", newline="")
+
+
+def _formato(ruta):
+    nombre = ruta[:-3] if ruta.endswith(".gz") else ruta
+    if nombre.endswith(".csv"):
+        return "csv"
+    if nombre.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    raise ValueError(f"No sé leer {ruta}: se esperaba .csv, .jsonl o .ndjson")
+
+
+def _filas_csv(archivo):
+    """(número de línea, valores) de un CSV con encabezado, en el orden de CAMPOS."""
+    lector = csv.reader(archivo)
+    encabezado = [columna.strip().lower() for columna in next(lector, [])]
+    faltan = [campo for campo in CAMPOS[:3] if campo not in encabezado]
+    if faltan:
+        raise ValueError(f"Al CSV le faltan las columnas: {', '.join(faltan)}")
+    posiciones = [encabezado.index(campo) if campo in encabezado else None for campo in CAMPOS]
+    if None in posiciones:
+        # sin columna de cantidad: se completa con None
+        tomar = itemgetter(*posiciones[:3])
+
+        def valores(fila):
+            return (*tomar(fila), None)
+    else:
+        valores = itemgetter(*posiciones)
+    for fila in lector:
+        if not fila:
+            continue
+        try:
+            yield lector.line_num, valores(fila)
+        except IndexError:
+            yield lector.line_num, ValueError(f"tiene {len(fila)} columnas y el encabezado {len(encabezado)}")
+
+
+def _filas_jsonl(archivo):
+    """(número de línea, valores) de un JSONL, en el orden de CAMPOS."""
+    for numero, texto in enumerate(archivo, 1):
+        if not texto.strip():
+            continue
+        try:
+            dato = json.loads(texto)
+            yield numero, [dato.get(campo) for campo in CAMPOS]
+        except (ValueError, AttributeError) as error:
+            # AttributeError: la línea es JSON válido pero no un objeto
+            yield numero, ValueError(f"no es un objeto JSON ({error})")
+
+
+def _cantidad(valor):
+    """La cantidad de una línea: un entero (1 si falta). 2.5 o "2.5" son un error, 2.0 no."""
+    if valor is None or valor == "":
+        return 1
+    if isinstance(valor, int) and not isinstance(valor, bool):
+        return valor
+    if isinstance(valor, str):
+        try:
+            return int(valor)
+        except ValueError:
+            pass  # quizás "2.0": se mira abajo
+    numero = None
+    if not isinstance(valor, bool):
+        try:
+            # str() primero, como con los precios: un float de JSON no arrastra su error
+            numero = Decimal(str(valor).strip())
+        except InvalidOperation:
+            pass
+    if numero is None or not numero.is_finite() or numero != numero.to_integral_value():
+        raise ValueError(f"la cantidad {valor!r} no es un número entero")
+    return int(numero)
+
+
+def leer_lineas(ruta, estadisticas=None, saltar_errores=False):
+    """
+    Recorre las líneas de pedido de un archivo como (pedido, Producto,
+    cantidad), de a una. Una línea mal formada lanza ValueError con su
+    número, o se cuenta y se salta si `saltar_errores` es True.
+    """
+    estadisticas = estadisticas or EstadisticasIngesta()
+    filas = _filas_csv if _formato(ruta) == "csv" else _filas_jsonl
+    # los mismos precios se repiten línea tras línea: cada texto se convierte
+    # una vez (el caché se vacía al llenarse para no crecer con el archivo)
+    precios = {}
+    with _abrir(ruta) as archivo:
+        for numero, valores in filas(archivo):
+            estadisticas.lineas += 1
+            try:
+                if isinstance(valores, Exception):
+                    raise valores
+                pedido, nombre, precio, cantidad = valores
+                if pedido in (None, "") or not nombre:
+                    raise ValueError("falta el pedido o el producto")
+                cantidad = _cantidad(cantidad)
+                if cantidad <= 0:
+                    raise ValueError("la cantidad debe ser mayor que cero")
+                texto = precio
+                precio = precios.get(texto) if isinstance(texto, str) else None
+                if precio is None:
+                    try:
+                        # str() primero: un precio float de JSON no arrastra su error
+                        precio = Decimal(str(texto))
+                    except InvalidOperation:
+                        raise ValueError(f"el precio {texto!r} no es un número") from None
+                    if not precio.is_finite() or precio < 0:
+                        raise ValueError(f"el precio {precio} no es válido")
+                    if isinstance(texto, str):
+                        if len(precios) >= 10000:
+                            precios.clear()
+                        precios[texto] = precio
+            except (ValueError, TypeError) as error:
+                if not saltar_errores:
+                    raise ValueError(f"{ruta}, línea {numero}: {error}") from None
+                estadisticas.errores += 1
+                continue
+            yield str(pedido), Producto(nombre, precio), cantidad
+
+
+def agrupar_en_carritos(lineas, max_abiertos=1, estadisticas=None):
+    """
+    Junta las líneas de cada pedido en un CarritoCompras y entrega
+    (pedido, carrito) cuando el pedido se completa.
+
+    Con max_abiertos=1 (archivos ordenados por pedido) un pedido se da por
+    completo en cuanto aparece la línea de otro. Con un número mayor se
+    toleran archivos donde las líneas de pedidos cercanos vienen mezcladas:
+    un pedido se da por completo cuando ya hay `max_abiertos` pedidos más
+    nuevos abiertos. Al acabarse el archivo salen todos. Si el número
+    de un pedido ya entregado vuelve a aparecer, sale como otro pedido con
+    el mismo número y se cuenta en `estadisticas.repetidos` (solo se
+    recuerdan los últimos RECIENTES números: recordarlos todos haría crecer
+    la memoria con el archivo).
+    """
+    if max_abiertos < 1:
+        raise ValueError("Debe poder haber al menos un pedido abierto")
+    estadisticas = estadisticas or EstadisticasIngesta()
+    abiertos = OrderedDict()
+    # números de los últimos pedidos entregados, solo para contar repetidos
+    recientes = OrderedDict()
+    for pedido, producto, cantidad in lineas:
+        carrito = abiertos.get(pedido)
+        if carrito is None:
+            if pedido in recientes:
+                estadisticas.repetidos += 1
+            if len(abiertos) >= max_abiertos:
+                completo, listo = abiertos.popitem(last=False)
+                recientes[completo] = None
+                if len(recientes) > RECIENTES:
+                    recientes.popitem(last=False)
+                estadisticas.pedidos += 1
+                yield completo, listo
+            carrito = abiertos[pedido] = CarritoCompras()
+        carrito.agregar_producto(producto, cantidad)
+    while abiertos:
+        estadisticas.pedidos += 1
+        yield abiertos.popitem(last=False)
+
+
+def ingerir(rutas, max_abiertos=1, estadisticas=None, saltar_errores=False):
+    """Lee uno o varios archivos en orden y entrega (pedido, carrito) a medida que se completan."""
+    if isinstance(rutas, str):
+        rutas = [rutas]
+    estadisticas = estadisticas or EstadisticasIngesta()
+
+    def todas_las_lineas():
+        for ruta in rutas:
+            yield from leer_lineas(ruta, estadisticas, saltar_errores)
+
+    return agrupar_en_carritos(todas_las_lineas(), max_abiertos, estadisticas)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Arma carritos a partir de archivos de pedidos CSV o JSONL")
+    parser.add_argument("archivos", nargs="+", help="archivos .csv, .jsonl o .ndjson (pueden terminar en .gz)")
+    parser.add_argument("--abiertos", type=int, default=1,
+                        help="pedidos abiertos a la vez antes de dar el más viejo por completo "
+                             "(1 si el archivo está ordenado por pedido; más si vienen mezclados)")
+    parser.add_argument("--saltar-errores", action="store_true", help="saltar las líneas mal formadas en vez de detenerse")
+    parser.add_argument("--silencioso", action="store_true", help="no imprimir cada pedido, solo el resumen")
+    args = parser.parse_args(argv)
+
+    estadisticas = EstadisticasIngesta()
+    salida = sys.stdout
+    try:
+        for pedido, carrito in ingerir(args.archivos, args.abiertos, estadisticas, args.saltar_errores):
+            if not args.silencioso:
+                salida.write(f"{pedido}\t{carrito.unidades}\t{carrito.calcular_total()}\n")
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    print(estadisticas.resumen(), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,238 @@
+# Motor de Reservas - Ejemplo de Programación Orientada a Objetos
+# Autor: Luis Henry Baldeón Ochoa
+# Descripción: Agenda de reservas por lugar que entiende las fechas como
+# rangos de entrada y salida, rechaza las reservas que se cruzan y responde
+# qué lugares están libres entre dos fechas.
+#
+# Formato de la fecha de una Reserva: "dd/mm/aaaa - dd/mm/aaaa" (entrada y
+# salida) o una sola fecha "dd/mm/aaaa" (una noche). También se acepta "-"
+# en lugar de "/" dentro de cada fecha. El día de salida queda libre: una
+# reserva puede entrar el mismo día en que sale la anterior.
+
+from array import array
+from bisect import bisect_left
+from datetime import date, timedelta
+from functools import lru_cache
+
+from sistema_reservas import Cliente, Reserva
+
+
+def parsear_fecha(texto):
+    """Convierte "dd/mm/aaaa" (o "dd-mm-aaaa") en un date."""
+    if isinstance(texto, date):
+        return texto
+    return _fecha_de_texto(texto)
+
+
+# las reservas repiten mucho las mismas fechas: cada texto se convierte una vez
+@lru_cache(maxsize=65536)
+def _fecha_de_texto(texto):
+    partes = texto.strip().replace("-", "/").split("/")
+    if len(partes) == 3:
+        try:
+            return date(int(partes[2]), int(partes[1]), int(partes[0]))
+        except ValueError:
+            pass  # no son números o no es un día real
+    raise ValueError(f"Fecha inválida: {texto!r} (se esperaba dd/mm/aaaa)")
+
+
+def parsear_rango(texto):
+    """
+    Convierte la fecha de una reserva en (entrada, salida). Una sola fecha
+    es una noche: sale al día siguiente.
+    """
+    if " - " in texto:
+        inicio, _, fin = texto.partition(" - ")
+        entrada, salida = parsear_fecha(inicio), parsear_fecha(fin)
+    else:
+        entrada = parsear_fecha(texto)
+        salida = entrada + timedelta(days=1)
+    if salida <= entrada:
+        raise ValueError(f"La salida debe ser posterior a la entrada: {texto!r}")
+    return entrada, salida
+
+
+def formatear_rango(entrada, salida):
+    return f"{entrada:%d/%m/%Y} - {salida:%d/%m/%Y}"
+
+
+class ReservaSolapada(ValueError):
+    """El lugar ya está reservado en parte de las fechas pedidas."""
+    def __init__(self, lugar, entrada, salida, existente):
+        super().__init__(f"{lugar} ya está reservado ({formatear_rango(entrada, salida)})")
+        self.lugar = lugar
+        self.existente = existente
+
+
+class _Agenda:
+    """
+    Reservas de un lugar, ordenadas por día de entrada. Como nunca se
+    cruzan, también quedan ordenadas por día de salida: para saber si un
+    rango está libre basta mirar, con bisect, la última reserva que entra
+    antes de que el rango termine. Los días se guardan como números
+    (date.toordinal()) en arreglos contiguos, que se recorren más rápido
+    que una lista de objetos int.
+    """
+    def __init__(self):
+        self.entradas = array("l")
+        self.salidas = array("l")
+        self.reservas = []
+
+    def _anterior(self, entrada, salida):
+        """Posición donde iría el rango y la reserva que lo pisa (o None)."""
+        posicion = bisect_left(self.entradas, salida)
+        if posicion and self.salidas[posicion - 1] > entrada:
+            return posicion, posicion - 1
+        return posicion, None
+
+    def libre(self, entrada, salida):
+        return self._anterior(entrada, salida)[1] is None
+
+    def insertar(self, entrada, salida, reserva):
+        posicion, choque = self._anterior(entrada, salida)
+        if choque is not None:
+            return self.reservas[choque]
+        self.entradas.insert(posicion, entrada)
+        self.salidas.insert(posicion, salida)
+        self.reservas.insert(posicion, reserva)
+        return None
+
+    def quitar(self, entrada, reserva):
+        posicion = bisect_left(self.entradas, entrada)
+        if posicion == len(self.entradas) or self.reservas[posicion] is not reserva:
+            return False
+        del self.entradas[posicion]
+        del self.salidas[posicion]
+        del self.reservas[posicion]
+        return True
+
+    def cruzadas(self, entrada, salida):
+        """Reservas que ocupan algún día de [entrada, salida)."""
+        fin = bisect_left(self.entradas, salida)
+        # la primera que puede cruzarse es la que entra antes y sale después de `entrada`
+        inicio = bisect_left(self.entradas, entrada, 0, fin)
+        if inicio and self.salidas[inicio - 1] > entrada:
+            inicio -= 1
+        return self.reservas[inicio:fin]
+
+
+class MotorReservas:
+    """
+    Lleva las reservas de todos los lugares y no deja que dos reservas del
+    mismo lugar se crucen. Comprobar un lugar es O(log n) en las reservas
+    de ese lugar; buscar lugares libres revisa cada lugar una vez.
+
+    La fecha y el lugar de una reserva no deben cambiarse mientras está en
+    el motor: hay que cancelarla y volver a reservar.
+    """
+    def __init__(self, lugares=()):
+        self._agendas = {}
+        for lugar in lugares:
+            self.agregar_lugar(lugar)
+
+    def agregar_lugar(self, lugar):
+        self._agendas.setdefault(lugar, _Agenda())
+
+    @property
+    def lugares(self):
+        return list(self._agendas)
+
+    def __len__(self):
+        return sum(len(agenda.reservas) for agenda in self._agendas.values())
+
+    @staticmethod
+    def _dias(entrada, salida):
+        entrada, salida = parsear_fecha(entrada), parsear_fecha(salida)
+        if salida <= entrada:
+            raise ValueError("La salida debe ser posterior a la entrada")
+        return entrada.toordinal(), salida.toordinal()
+
+    def reservar(self, reserva):
+        """Registra una Reserva; lanza ReservaSolapada si el lugar ya está ocupado en esas fechas."""
+        entrada, salida = parsear_rango(reserva.fecha)
+        self.agregar_lugar(reserva.lugar)
+        choque = self._agendas[reserva.lugar].insertar(entrada.toordinal(), salida.toordinal(), reserva)
+        if choque is not None:
+            raise ReservaSolapada(reserva.lugar, *parsear_rango(choque.fecha), choque)
+        return reserva
+
+    def nueva_reserva(self, cliente, lugar, entrada, salida):
+        """Crea y registra la Reserva de `cliente` en `lugar` del día `entrada` al día `salida`."""
+        entrada, salida = parsear_fecha(entrada), parsear_fecha(salida)
+        return self.reservar(Reserva(cliente, formatear_rango(entrada, salida), lugar))
+
+    def cargar(self, reservas):
+        """
+        Registra muchas reservas de una vez: ordena cada lugar una sola vez
+        en vez de insertar de a una. Si dos reservas se cruzan (entre sí o
+        con las que ya estaban) no se registra ninguna.
+        """
+        nuevas = {}
+        for reserva in reservas:
+            entrada, salida = parsear_rango(reserva.fecha)
+            nuevas.setdefault(reserva.lugar, []).append((entrada.toordinal(), salida.toordinal(), reserva))
+        agendas = {}
+        for lugar, filas in nuevas.items():
+            actual = self._agendas.get(lugar)
+            if actual is not None:
+                filas.extend(zip(actual.entradas, actual.salidas, actual.reservas))
+            filas.sort(key=lambda fila: fila[0])
+            for anterior, siguiente in zip(filas, filas[1:]):
+                if siguiente[0] < anterior[1]:
+                    raise ReservaSolapada(lugar, date.fromordinal(anterior[0]),
+                                          date.fromordinal(anterior[1]), anterior[2])
+            agenda = agendas[lugar] = _Agenda()
+            agenda.entradas = array("l", [fila[0] for fila in filas])
+            agenda.salidas = array("l", [fila[1] for fila in filas])
+            agenda.reservas = [fila[2] for fila in filas]
+        self._agendas.update(agendas)
+
+    def cancelar(self, reserva):
+        """Quita una reserva registrada. Devuelve False si no estaba."""
+        agenda = self._agendas.get(reserva.lugar)
+        if agenda is None:
+            return False
+        entrada, _ = parsear_rango(reserva.fecha)
+        return agenda.quitar(entrada.toordinal(), reserva)
+
+    def esta_libre(self, lugar, entrada, salida):
+        # las fechas se validan aunque el lugar no tenga reservas
+        dias = self._dias(entrada, salida)
+        agenda = self._agendas.get(lugar)
+        return agenda is None or agenda.libre(*dias)
+
+    def lugares_libres(self, entrada, salida):
+        """Lugares sin ninguna reserva entre `entrada` (incluida) y `salida` (excluida)."""
+        desde, hasta = self._dias(entrada, salida)
+        libres = []
+        # lo mismo que agenda.libre(), escrito aquí para no pagar una llamada por lugar
+        for lugar, agenda in self._agendas.items():
+            posicion = bisect_left(agenda.entradas, hasta)
+            if not posicion or agenda.salidas[posicion - 1] <= desde:
+                libres.append(lugar)
+        return libres
+
+    def reservas_en(self, lugar, entrada, salida):
+        """Reservas de `lugar` que ocupan algún día entre `entrada` y `salida`, por fecha de entrada."""
+        dias = self._dias(entrada, salida)
+        agenda = self._agendas.get(lugar)
+        return [] if agenda is None else agenda.cruzadas(*dias)
+
+
+if __name__ == "__main__":
+    motor = MotorReservas(["Hotel Amazónico", "Cabaña del Río", "Hostal Central"])
+    luis = Cliente("Luis Henry Baldeón Ochoa", "0605386986")
+    ana = Cliente("Ana Torres", "0102030405")
+
+    # La reserva del sistema original (una noche) y otra que empieza el día que sale
+    motor.reservar(Reserva(luis, "20/12/2025", "Hotel Amazónico"))
+    motor.nueva_reserva(ana, "Hotel Amazónico", "21/12/2025", "24/12/2025")
+    motor.nueva_reserva(ana, "Cabaña del Río", "22/12/2025", "26/12/2025")
+
+    try:
+        motor.nueva_reserva(luis, "Hotel Amazónico", "23/12/2025", "25/12/2025")
+    except ReservaSolapada as error:
+        print(f"Rechazada: {error}")
+        print(error.existente.confirmar_reserva())
+
+    print("Libres del 23/12/2025 al 25/12/2025:", ", ".join(motor.lugares_libres("23/12/2025", "25/12/2025")))
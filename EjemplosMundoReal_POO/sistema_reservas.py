@@ -32,9 +32,30 @@ class Reserva:
         )
 
 
-# Creación de objetos
-cliente1 = Cliente("Luis Henry Baldeón Ochoa", "0605386986")
-reserva1 = Reserva(cliente1, "20/12/2025", "Hotel Amazónico")
+class ClienteCompacto:
+    """
+    Clase que representa un cliente con __slots__ (sin __dict__ por objeto).
+    """
+    __slots__ = ("nombre", "cedula")
+
+    __init__ = Cliente.__init__
+    mostrar_datos = Cliente.mostrar_datos
+
+
+class ReservaCompacta:
+    """
+    Clase que representa una reserva con __slots__ (sin __dict__ por objeto).
+    """
+    __slots__ = ("cliente", "fecha", "lugar")
+
+    __init__ = Reserva.__init__
+    confirmar_reserva = Reserva.confirmar_reserva
+
+
+if __name__ == "__main__":
+    # Creación de objetos
+    cliente1 = Cliente("Luis Henry Baldeón Ochoa", "0605386986")
+    reserva1 = Reserva(cliente1, "20/12/2025", "Hotel Amazónico")
 
-# Ejecución
-print(reserva1.confirmar_reserva())
+    # Ejecución
+    print(reserva1.confirmar_reserva())
@@ -0,0 +1,7 @@
+# Los ejemplos se importan entre sí por nombre (from tienda_virtual import
+# ...), así que las pruebas necesitan la carpeta de los ejemplos en sys.path.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
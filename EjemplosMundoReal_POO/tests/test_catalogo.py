@@ -0,0 +1,103 @@
+# Pruebas del Catálogo: los tres índices tienen que decir lo mismo que el
+# diccionario de nombres después de agregar, actualizar y quitar.
+
+from decimal import Decimal, InvalidOperation
+
+import pytest
+
+from catalogo import Catalogo, _IndiceOrdenado
+from tienda_virtual import Producto
+
+
+def comprobar_indices(catalogo):
+    """Compara cada índice con lo que se obtiene recorriendo todo el catálogo."""
+    productos = list(catalogo)
+    por_precio = sorted(productos, key=lambda p: (Catalogo._precio(p), p.nombre))
+    assert [p.nombre for p in catalogo.por_precio()] == [p.nombre for p in por_precio]
+    por_nombre = sorted(productos, key=lambda p: (p.nombre.casefold(), p.nombre))
+    assert [p.nombre for p in catalogo.autocompletar("", limite=None)] == [p.nombre for p in por_nombre]
+    for producto in productos:
+        assert catalogo.buscar(producto.nombre) is producto
+
+
+@pytest.fixture
+def bloques_chicos(monkeypatch):
+    # con bloques de 4 entradas unas decenas de productos ya parten bloques
+    monkeypatch.setattr(_IndiceOrdenado, "TAMANO_BLOQUE", 4)
+
+
+def test_agregar_actualizar_quitar_mantiene_los_indices(bloques_chicos):
+    catalogo = Catalogo()
+    for i in range(60):
+        catalogo.agregar(Producto(f"Producto {i:02d}", (i * 37) % 50))
+    comprobar_indices(catalogo)
+
+    for i in range(0, 60, 3):
+        catalogo.actualizar(f"Producto {i:02d}", precio=Decimal("9.99"))
+    catalogo.actualizar("Producto 01", nombre_nuevo="artículo 01")
+    comprobar_indices(catalogo)
+
+    for i in range(0, 60, 2):
+        nombre = f"Producto {i:02d}"
+        if nombre in catalogo:
+            catalogo.quitar(nombre)
+    comprobar_indices(catalogo)
+    assert len(catalogo) == 30
+
+
+def test_por_precio_y_autocompletar():
+    catalogo = Catalogo([
+        Producto("Laptop", 850),
+        Producto("Mouse", 25),
+        Producto("Monitor", 199.99),
+        Producto("Micrófono", 60),
+        Producto("Teclado", "45.50"),
+    ])
+    assert [p.nombre for p in catalogo.por_precio(20, 100)] == ["Mouse", "Teclado", "Micrófono"]
+    assert [p.nombre for p in catalogo.por_precio(minimo="199.99")] == ["Monitor", "Laptop"]
+    assert [p.nombre for p in catalogo.autocompletar("MO")] == ["Monitor", "Mouse"]
+    assert catalogo.autocompletar("mo", limite=1)[0].nombre == "Monitor"
+
+
+def test_agregar_con_precio_invalido_no_toca_los_indices():
+    catalogo = Catalogo([Producto("Mouse", 25)])
+    with pytest.raises(InvalidOperation):
+        catalogo.agregar(Producto("Teclado", "barato"))
+    assert "Teclado" not in catalogo
+    comprobar_indices(catalogo)
+
+
+def test_actualizar_con_precio_invalido_no_toca_los_indices():
+    catalogo = Catalogo([Producto("Mouse", 25)])
+    with pytest.raises(InvalidOperation):
+        catalogo.actualizar("Mouse", precio="gratis")
+    assert catalogo.buscar("Mouse").precio == 25
+    comprobar_indices(catalogo)
+
+
+def test_nombre_repetido():
+    catalogo = Catalogo([Producto("Mouse", 25), Producto("Teclado", 40)])
+    with pytest.raises(ValueError):
+        catalogo.agregar(Producto("Mouse", 30))
+    with pytest.raises(ValueError):
+        catalogo.actualizar("Mouse", nombre_nuevo="Teclado")
+    comprobar_indices(catalogo)
+
+
+@pytest.mark.parametrize("cantidad", [3, 200])  # inserción de a uno y reconstrucción
+def test_agregar_productos_es_todo_o_nada(bloques_chicos, cantidad):
+    catalogo = Catalogo([Producto("Mouse", 25)])
+    nuevos = [Producto(f"Producto {i}", i) for i in range(cantidad)]
+
+    with pytest.raises(InvalidOperation):
+        catalogo.agregar_productos(nuevos + [Producto("Roto", "sin precio")])
+    with pytest.raises(ValueError):
+        catalogo.agregar_productos(nuevos + [Producto("Mouse", 30)])
+    with pytest.raises(ValueError):
+        catalogo.agregar_productos(nuevos + [Producto("Producto 0", 1)])
+    assert len(catalogo) == 1
+    comprobar_indices(catalogo)
+
+    catalogo.agregar_productos(nuevos)
+    assert len(catalogo) == cantidad + 1
+    comprobar_indices(catalogo)
@@ -0,0 +1,100 @@
+# Pruebas de la ingesta: cuándo sale cada pedido, cómo se leen las
+# cantidades y qué pasa con las líneas mal formadas.
+
+import gzip
+import json
+from decimal import Decimal
+
+import pytest
+
+from ingesta_pedidos import (EstadisticasIngesta, _cantidad, agrupar_en_carritos,
+                             ingerir, leer_lineas)
+from tienda_virtual import Producto
+
+
+def lineas(*pedidos):
+    """(pedido, Producto, 1) por cada número de pedido, en ese orden."""
+    return [(pedido, Producto(f"Producto {i}", 10), 1) for i, pedido in enumerate(pedidos)]
+
+
+def test_cada_pedido_sale_cuando_empieza_el_siguiente():
+    leidas = []
+
+    def fuente():
+        for linea in lineas("A", "A", "B", "C", "C"):
+            leidas.append(linea[0])
+            yield linea
+
+    entregados = agrupar_en_carritos(fuente())
+    pedido, carrito = next(entregados)
+    # "A" sale en cuanto aparece la primera línea de "B", sin leer más
+    assert (pedido, carrito.unidades) == ("A", 2)
+    assert leidas == ["A", "A", "B"]
+    assert next(entregados)[0] == "B"
+    assert leidas == ["A", "A", "B", "C"]
+    assert [(p, c.unidades) for p, c in entregados] == [("C", 2)]
+
+
+def test_pedidos_mezclados_con_varios_abiertos():
+    estadisticas = EstadisticasIngesta()
+    entregados = agrupar_en_carritos(lineas("A", "B", "A", "C", "B", "D"), 2, estadisticas)
+    # con dos abiertos "A" sale al empezar "C"; "B" al empezar "D"
+    assert [(p, c.unidades) for p, c in entregados] == [("A", 2), ("B", 2), ("C", 1), ("D", 1)]
+    assert (estadisticas.pedidos, estadisticas.repetidos) == (4, 0)
+
+
+def test_pedido_que_reaparece_sale_partido():
+    estadisticas = EstadisticasIngesta()
+    entregados = list(agrupar_en_carritos(lineas("A", "B", "A"), estadisticas=estadisticas))
+    assert [p for p, _ in entregados] == ["A", "B", "A"]
+    assert estadisticas.repetidos == 1
+
+
+def test_al_menos_un_abierto():
+    with pytest.raises(ValueError):
+        list(agrupar_en_carritos(lineas("A"), 0))
+
+
+@pytest.mark.parametrize("valor, esperado", [
+    (None, 1), ("", 1), (3, 3), ("3", 3), (" 4 ", 4), (2.0, 2), ("2.0", 2),
+])
+def test_cantidad_valida(valor, esperado):
+    assert _cantidad(valor) == esperado
+
+
+@pytest.mark.parametrize("valor", [2.5, "2.5", "dos", True, float("nan"), float("inf")])
+def test_cantidad_no_entera(valor):
+    with pytest.raises(ValueError, match="no es un número entero"):
+        _cantidad(valor)
+
+
+def test_csv_y_jsonl_comprimido(tmp_path):
+    csv = tmp_path / "pedidos.csv"
+    csv.write_text("pedido,producto,precio,cantidad\n"
+                   "1,Laptop,850,1\n"
+                   "1,Mouse,25.50,2\n"
+                   "2,Mouse,25.50,\n", encoding="utf-8")
+    jsonl = tmp_path / "pedidos.jsonl.gz"
+    with gzip.open(jsonl, "wt", encoding="utf-8") as archivo:
+        archivo.write(json.dumps({"pedido": 3, "producto": "Teclado", "precio": 45.1, "cantidad": 2}) + "\n")
+
+    estadisticas = EstadisticasIngesta()
+    totales = [(p, c.calcular_total()) for p, c in ingerir([str(csv), str(jsonl)], estadisticas=estadisticas)]
+    assert totales == [("1", Decimal("901.00")), ("2", Decimal("25.50")), ("3", Decimal("90.2"))]
+    assert (estadisticas.lineas, estadisticas.pedidos) == (4, 3)
+
+
+def test_lineas_con_error(tmp_path):
+    ruta = tmp_path / "pedidos.csv"
+    ruta.write_text("pedido,producto,precio,cantidad\n"
+                    "1,Laptop,850,1\n"
+                    "1,Mouse,barato,1\n"
+                    "2,Mouse,25,2.5\n"
+                    "3,Mouse,25,1\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="línea 3"):
+        list(leer_lineas(str(ruta)))
+
+    estadisticas = EstadisticasIngesta()
+    leidas = list(leer_lineas(str(ruta), estadisticas, saltar_errores=True))
+    assert [pedido for pedido, _, _ in leidas] == ["1", "3"]
+    assert estadisticas.errores == 2
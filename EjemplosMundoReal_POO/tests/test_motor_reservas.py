@@ -0,0 +1,91 @@
+# Pruebas del MotorReservas: cruces de fechas, el día de salida libre,
+# la carga masiva y la validación de fechas.
+
+from datetime import date
+
+import pytest
+
+from motor_reservas import MotorReservas, ReservaSolapada, parsear_rango
+from sistema_reservas import Cliente, Reserva
+
+ANA = Cliente("Ana Torres", "0102030405")
+
+
+@pytest.fixture
+def motor():
+    motor = MotorReservas(["Hotel", "Cabaña"])
+    motor.nueva_reserva(ANA, "Hotel", "10/01/2026", "15/01/2026")
+    motor.nueva_reserva(ANA, "Hotel", "20/01/2026", "22/01/2026")
+    return motor
+
+
+def test_parsear_rango():
+    assert parsear_rango("10-01-2026 - 12/01/2026") == (date(2026, 1, 10), date(2026, 1, 12))
+    assert parsear_rango("31/12/2025") == (date(2025, 12, 31), date(2026, 1, 1))
+    with pytest.raises(ValueError):
+        parsear_rango("12/01/2026 - 10/01/2026")
+    with pytest.raises(ValueError):
+        parsear_rango("30/02/2026")
+
+
+@pytest.mark.parametrize("entrada, salida", [
+    ("09/01/2026", "11/01/2026"),  # termina dentro
+    ("14/01/2026", "16/01/2026"),  # empieza dentro
+    ("11/01/2026", "12/01/2026"),  # queda adentro
+    ("05/01/2026", "25/01/2026"),  # cubre las dos
+    ("10/01/2026", "15/01/2026"),  # las mismas fechas
+])
+def test_rechaza_las_que_se_cruzan(motor, entrada, salida):
+    assert not motor.esta_libre("Hotel", entrada, salida)
+    with pytest.raises(ReservaSolapada) as error:
+        motor.nueva_reserva(ANA, "Hotel", entrada, salida)
+    assert error.value.lugar == "Hotel"
+    assert len(motor) == 2
+
+
+@pytest.mark.parametrize("entrada, salida", [
+    ("15/01/2026", "20/01/2026"),  # entra el día que sale una y sale el día que entra la otra
+    ("01/01/2026", "10/01/2026"),
+    ("22/01/2026", "23/01/2026"),
+])
+def test_acepta_las_que_no_se_cruzan(motor, entrada, salida):
+    assert motor.esta_libre("Hotel", entrada, salida)
+    motor.nueva_reserva(ANA, "Hotel", entrada, salida)
+    assert len(motor) == 3
+
+
+def test_lugares_libres_y_reservas_en(motor):
+    assert motor.lugares_libres("14/01/2026", "21/01/2026") == ["Cabaña"]
+    assert motor.lugares_libres("15/01/2026", "20/01/2026") == ["Hotel", "Cabaña"]
+    ocupadas = motor.reservas_en("Hotel", "14/01/2026", "21/01/2026")
+    assert [r.fecha for r in ocupadas] == ["10/01/2026 - 15/01/2026", "20/01/2026 - 22/01/2026"]
+    assert motor.reservas_en("Cabaña", "01/01/2026", "31/01/2026") == []
+
+
+def test_cancelar_libera_las_fechas(motor):
+    reserva = motor.reservas_en("Hotel", "10/01/2026", "11/01/2026")[0]
+    assert motor.cancelar(reserva)
+    assert not motor.cancelar(reserva)
+    assert motor.esta_libre("Hotel", "10/01/2026", "15/01/2026")
+
+
+def test_cargar_es_todo_o_nada(motor):
+    nuevas = [Reserva(ANA, "01/02/2026 - 03/02/2026", "Hotel"),
+              Reserva(ANA, "02/02/2026", "Cabaña")]
+    with pytest.raises(ReservaSolapada):
+        motor.cargar(nuevas + [Reserva(ANA, "12/01/2026", "Hotel")])
+    with pytest.raises(ReservaSolapada):
+        motor.cargar(nuevas + [Reserva(ANA, "02/02/2026 - 04/02/2026", "Hotel")])
+    assert len(motor) == 2
+
+    motor.cargar(nuevas)
+    assert len(motor) == 4
+    assert not motor.esta_libre("Hotel", "02/02/2026", "05/02/2026")
+
+
+@pytest.mark.parametrize("lugar", ["Hotel", "Cabaña", "Sin reservas"])
+def test_fechas_invalidas_fallan_en_cualquier_lugar(motor, lugar):
+    with pytest.raises(ValueError):
+        motor.esta_libre(lugar, "15/01/2026", "10/01/2026")
+    with pytest.raises(ValueError):
+        motor.reservas_en(lugar, "no es fecha", "10/01/2026")
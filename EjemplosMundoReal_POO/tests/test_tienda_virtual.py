@@ -0,0 +1,97 @@
+# Pruebas del CarritoCompras: total incremental, líneas agrupadas por
+# (nombre, precio) y productos que cambian de precio después de agregarlos.
+
+from decimal import Decimal
+
+import pytest
+
+from tienda_virtual import CarritoCompras, Producto, ProductoCompacto
+
+
+def total_recorriendo(carrito):
+    return sum((subtotal for _, _, subtotal in carrito.lineas()), Decimal("0"))
+
+
+def test_total_exacto_en_centavos():
+    carrito = CarritoCompras()
+    for _ in range(10):
+        carrito.agregar_producto(Producto("Chicle", 0.1))
+    assert carrito.calcular_total() == Decimal("1.0")
+    assert carrito.unidades == 10
+
+
+def test_productos_iguales_van_en_una_linea():
+    carrito = CarritoCompras()
+    laptop = Producto("Laptop", 850)
+    carrito.agregar_producto(laptop)
+    carrito.agregar_producto(Producto("Laptop", 850), 2)
+    carrito.agregar_producto(Producto("Mouse", "25.50"))
+    carrito.agregar_producto(Producto("Laptop", 900))  # otro precio, otra línea
+
+    lineas = [(p.nombre, p.precio, cantidad, subtotal) for p, cantidad, subtotal in carrito.lineas()]
+    assert lineas == [
+        ("Laptop", 850, 3, Decimal(2550)),
+        ("Mouse", "25.50", 1, Decimal("25.50")),
+        ("Laptop", 900, 1, Decimal(900)),
+    ]
+    assert carrito.calcular_total() == total_recorriendo(carrito) == Decimal("3475.50")
+    assert [p.nombre for p in carrito.productos] == ["Laptop"] * 3 + ["Mouse", "Laptop"]
+
+
+def test_agregar_y_quitar_muchos():
+    carrito = CarritoCompras()
+    mouse, teclado = Producto("Mouse", 25), ProductoCompacto("Teclado", 40)
+    carrito.agregar_productos([mouse, mouse, (teclado, 3), mouse])
+    assert [(p.nombre, cantidad) for p, cantidad, _ in carrito.lineas()] == [("Mouse", 3), ("Teclado", 3)]
+
+    assert carrito.quitar_productos([(mouse, 2), teclado]) == 3
+    assert carrito.calcular_total() == total_recorriendo(carrito) == Decimal(105)
+
+    # si uno no está no se quita nada
+    with pytest.raises(ValueError):
+        carrito.quitar_productos([mouse, Producto("Monitor", 199)])
+    assert carrito.unidades == 3
+
+
+def test_quitar_hasta_vaciar():
+    carrito = CarritoCompras()
+    mouse = Producto("Mouse", 25)
+    carrito.agregar_producto(mouse, 2)
+    assert carrito.quitar_producto(mouse, 5) == 2
+    assert list(carrito.lineas()) == []
+    assert carrito.calcular_total() == 0
+    with pytest.raises(ValueError):
+        carrito.quitar_producto(mouse)
+
+
+def test_cambio_de_precio_despues_de_agregar():
+    carrito = CarritoCompras()
+    mouse = Producto("Mouse", 25)
+    carrito.agregar_producto(mouse, 2)
+    mouse.precio = 30
+
+    # la línea conserva el precio de cuando se agregó
+    producto, cantidad, subtotal = next(carrito.lineas())
+    assert (producto.precio, cantidad, subtotal) == (25, 2, Decimal(50))
+    assert producto is not mouse
+
+    # el mismo objeto se sigue encontrando por id() para quitarlo
+    assert carrito.quitar_producto(mouse) == 1
+    assert carrito.calcular_total() == Decimal(25)
+
+
+def test_productos_es_de_solo_lectura():
+    carrito = CarritoCompras()
+    carrito.agregar_producto(Producto("Mouse", 25))
+    assert isinstance(carrito.productos, tuple)
+    with pytest.raises(AttributeError):
+        carrito.productos = []
+
+
+def test_cantidad_invalida():
+    carrito = CarritoCompras()
+    with pytest.raises(ValueError):
+        carrito.agregar_producto(Producto("Mouse", 25), 0)
+    with pytest.raises(ValueError):
+        carrito.agregar_productos([(Producto("Mouse", 25), -1)])
+    assert carrito.unidades == 0
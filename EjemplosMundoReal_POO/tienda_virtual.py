@@ -2,6 +2,11 @@
 # Autor: Luis Henry Baldeón Ochoa
 # Descripción: Simulación de una tienda virtual utilizando POO.
 
+import copy
+from collections import Counter
+from decimal import Decimal
+
+
 class Producto:
     """
     Clase que representa un producto de la tienda.
@@ -14,35 +19,180 @@ class Producto:
         return f"Producto: {self.nombre} - Precio: ${self.precio}"
 
 
+class ProductoCompacto:
+    """
+    Clase que representa un producto con __slots__ (sin __dict__ por objeto).
+    """
+    __slots__ = ("nombre", "precio")
+
+    __init__ = Producto.__init__
+    mostrar_producto = Producto.mostrar_producto
+
+
 class CarritoCompras:
     """
     Clase que representa el carrito de compras.
+
+    Los productos iguales (mismo nombre y precio) se agrupan en una sola
+    línea con su cantidad, y el total se actualiza en cada cambio, así
+    calcular_total() no recorre el carrito. El dinero se lleva con Decimal
+    para que los centavos sean exactos.
+
+    Cada línea guarda una copia del producto (copy.copy) con el precio que
+    tenía al agregarlo: si después el producto cambia de precio, el carrito
+    no. `productos` es de solo lectura: se cambia con agregar_producto() y
+    quitar_producto().
     """
     def __init__(self):
-        self.productos = []
+        # (nombre, precio) -> [copia del producto, cantidad, ids de los objetos agregados]
+        self._lineas = {}
+        # id(producto agregado) -> clave de su línea; solo el número, para no
+        # retener el objeto (una vista de un catálogo lo retendría entero)
+        self._por_id = {}
+        self._total = Decimal("0")
+        self._unidades = 0
+
+    @staticmethod
+    def _precio(producto):
+        precio = producto.precio
+        if isinstance(precio, Decimal):
+            return precio
+        if isinstance(precio, int):
+            return Decimal(precio)
+        # str() primero: Decimal(0.1) arrastraría el error del float
+        return Decimal(str(precio))
+
+    @staticmethod
+    def _congelar(producto):
+        """Copia del producto que no cambia si el original cambia de precio."""
+        if type(producto) is Producto:
+            return Producto(producto.nombre, producto.precio)  # mucho más rápido que copy.copy
+        return copy.copy(producto)
+
+    def _clave(self, producto):
+        """Clave de la línea del producto, o None si no está en el carrito."""
+        clave = (producto.nombre, self._precio(producto))
+        if clave in self._lineas:
+            return clave
+        # el producto cambió de precio después de agregarlo: se busca por id().
+        # Un id se puede reusar cuando su objeto muere, por eso se compara
+        # también el nombre
+        clave = self._por_id.get(id(producto))
+        if clave is not None and clave[0] == producto.nombre:
+            return clave
+        return None
+
+    def agregar_producto(self, producto, cantidad=1):
+        if cantidad <= 0:
+            raise ValueError("La cantidad debe ser mayor que cero")
+        precio = self._precio(producto)
+        clave = (producto.nombre, precio)
+        linea = self._lineas.get(clave)
+        if linea is None:
+            linea = self._lineas[clave] = [self._congelar(producto), cantidad, [id(producto)]]
+        else:
+            linea[1] += cantidad
+            if self._por_id.get(id(producto)) != clave:
+                linea[2].append(id(producto))
+        self._por_id[id(producto)] = clave
+        self._total += precio * cantidad
+        self._unidades += cantidad
+
+    def quitar_producto(self, producto, cantidad=1):
+        """
+        Quita hasta `cantidad` unidades del producto; si su línea queda en
+        cero, desaparece. Devuelve cuántas unidades se quitaron.
+        """
+        if cantidad <= 0:
+            raise ValueError("La cantidad debe ser mayor que cero")
+        clave = self._clave(producto)
+        if clave is None:
+            raise ValueError(f"{producto.nombre} no está en el carrito")
+        linea = self._lineas[clave]
+        quitadas = min(cantidad, linea[1])
+        linea[1] -= quitadas
+        if linea[1] == 0:
+            del self._lineas[clave]
+            for numero in linea[2]:
+                if self._por_id.get(numero) == clave:
+                    del self._por_id[numero]
+        self._total -= clave[1] * quitadas
+        self._unidades -= quitadas
+        return quitadas
+
+    @staticmethod
+    def _agrupar(productos):
+        """Junta una lista de productos o de (producto, cantidad) por línea."""
+        # Counter cuenta los repetidos de una pasada; después la clave se
+        # arma una sola vez por elemento distinto
+        grupos = {}
+        for elemento, veces in Counter(productos).items():
+            producto, cantidad = elemento if isinstance(elemento, tuple) else (elemento, 1)
+            if cantidad <= 0:
+                raise ValueError("La cantidad debe ser mayor que cero")
+            cantidad *= veces
+            clave = (producto.nombre, CarritoCompras._precio(producto))
+            if clave in grupos:
+                grupos[clave][1] += cantidad
+            else:
+                grupos[clave] = [producto, cantidad]
+        return grupos
+
+    def agregar_productos(self, productos):
+        """Agrega muchos productos (o pares producto, cantidad) de una vez."""
+        for producto, cantidad in self._agrupar(productos).values():
+            self.agregar_producto(producto, cantidad)
+
+    def quitar_productos(self, productos):
+        """
+        Quita muchos productos (o pares producto, cantidad). Si alguno no está
+        en el carrito no se quita nada. Devuelve las unidades quitadas.
+        """
+        grupos = self._agrupar(productos)
+        for producto, _ in grupos.values():
+            if self._clave(producto) is None:
+                raise ValueError(f"{producto.nombre} no está en el carrito")
+        return sum(self.quitar_producto(producto, cantidad) for producto, cantidad in grupos.values())
+
+    def lineas(self):
+        """
+        Recorre el carrito como (producto, cantidad, subtotal), en orden de
+        llegada. El producto es la copia con el precio del momento en que
+        se agregó.
+        """
+        for (_, precio), (copia, cantidad, _) in self._lineas.items():
+            yield copia, cantidad, precio * cantidad
+
+    @property
+    def productos(self):
+        """
+        Los productos del carrito, uno por unidad y en orden de llegada,
+        como una tupla (de solo lectura).
+        """
+        return tuple(copia for copia, cantidad, _ in self._lineas.values() for _ in range(cantidad))
 
-    def agregar_producto(self, producto):
-        self.productos.append(producto)
+    @property
+    def unidades(self):
+        return self._unidades
 
     def calcular_total(self):
-        total = 0
-        for producto in self.productos:
-            total += producto.precio
-        return total
+        return self._total
 
     def mostrar_carrito(self):
-        for producto in self.productos:
-            print(producto.mostrar_producto())
+        for producto, cantidad, _ in self.lineas():
+            detalle = producto.mostrar_producto()
+            print(detalle if cantidad == 1 else f"{detalle} x{cantidad}")
         print(f"Total a pagar: ${self.calcular_total()}")
 
 
-# Creación de objetos
-producto1 = Producto("Laptop", 850)
-producto2 = Producto("Mouse", 25)
+if __name__ == "__main__":
+    # Creación de objetos
+    producto1 = Producto("Laptop", 850)
+    producto2 = Producto("Mouse", 25)
 
-carrito = CarritoCompras()
-carrito.agregar_producto(producto1)
-carrito.agregar_producto(producto2)
+    carrito = CarritoCompras()
+    carrito.agregar_producto(producto1)
+    carrito.agregar_producto(producto2)
 
-# Ejecución
-carrito.mostrar_carrito()
+    # Ejecución
+    carrito.mostrar_carrito()
@@ -38,6 +38,16 @@ class Cita:
         self.estado = "Cancelada"
 
 
+class CitaCompacta:
+    """La misma Cita con __slots__ (sin __dict__ por objeto)."""
+    __slots__ = ("paciente", "medico", "fecha", "tipo_servicio", "estado")
+
+    __init__ = Cita.__init__
+    resumen = Cita.resumen
+    reprogramar = Cita.reprogramar
+    cancelar = Cita.cancelar
+
+
 # PROGRAMA PRINCIPAL
 if __name__ == "__main__":
     print("=== EJEMPLO 1: ABSTRACCIÓN (Citas médicas) ===")
@@ -25,6 +25,14 @@ class MiembroUniversidad:
         return f"{self.nombre} ({self.identificador}) - {self.correo}"
 
 
+class MiembroUniversidadCompacto:
+    """El mismo MiembroUniversidad con __slots__ (sin __dict__ por objeto)."""
+    __slots__ = ("nombre", "correo", "identificador")
+
+    __init__ = MiembroUniversidad.__init__
+    presentar = MiembroUniversidad.presentar
+
+
 class Estudiante(MiembroUniversidad):
     def __init__(self, nombre, correo, identificador, carrera, nivel):
         super().__init__(nombre, correo, identificador)
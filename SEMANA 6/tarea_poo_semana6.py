@@ -39,6 +39,21 @@ class Empleado:
         return f"Empleado: {self.nombre} | Cédula: {self.cedula} | Pago: ${self.calcular_pago():.2f}"
 
 
+class EmpleadoCompacto:
+    """
+    Empleado con __slots__ (sin __dict__ por objeto).
+    Encapsulación: dentro de Empleado, self.__salario_base se guarda como
+    _Empleado__salario_base, así que el slot debe llamarse igual.
+    """
+    __slots__ = ("nombre", "cedula", "_Empleado__salario_base")
+
+    __init__ = Empleado.__init__
+    get_salario_base = Empleado.get_salario_base
+    set_salario_base = Empleado.set_salario_base
+    calcular_pago = Empleado.calcular_pago
+    mostrar_info = Empleado.mostrar_info
+
+
 class EmpleadoPorHoras(Empleado):
     """
     Clase derivada (Herencia): hereda de Empleado.
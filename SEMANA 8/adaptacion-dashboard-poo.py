@@ -20,14 +20,78 @@
 # NOTA:
 # - Este Dashboard detecta automáticamente carpetas "Unidad ..."
 # - Guarda favoritos en un archivo: dashboard_favoritos.txt
+# - Guarda un índice de scripts en .dashboard_cache/ para no
+#   re-escanear carpetas que no cambiaron
+# - Registra tiempo, CPU y memoria de cada ejecución en
+#   .dashboard_cache/metricas (menú "Tiempos de ejecución")
+# - Guarda el código compilado de cada script en .dashboard_cache/bytecode
+#   para no recompilarlo en cada ejecución capturada
+# - Variables de entorno opcionales:
+#     DASHBOARD_HILOS=8         hilos para recorrer carpetas
+#     DASHBOARD_PROFUNDIDAD=2   niveles bajo cada unidad (3 = Tema/Subtema)
+#     DASHBOARD_PRECALENTADOS=0 intérpretes precalentados para ejecutar en
+#                               lote (Linux/macOS; 0 = desactivado)
+#     DASHBOARD_VIGILAR=1       mantener el árbol en memoria y vigilar cambios
+#                               (0 = volver a leer las carpetas en cada menú)
 # - Funciona en Windows / Linux / macOS
 # ============================================================
 
 import os
 import sys
+import re
+import json
+import math
+import codecs
+import shutil
+import tokenize
+import ast
+import asyncio
+import select
+import struct
+import ctypes
+import ctypes.util
+import hashlib
+import importlib.util
+import marshal
+import pickle
+import mmap
+import queue
+import functools
+import itertools
+import time
+import heapq
+import bisect
+import threading
+import _thread
 import subprocess
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+import shlex
+import signal
+import tempfile
+import io
+import gc
+import atexit
+import runpy
+import traceback
+import contextlib
+import unicodedata
+import uuid
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed, wait)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
 
 
 # --------------------------- Utilidades ---------------------------
@@ -38,6 +102,8 @@ def clear_screen() -> None:
 
 
 def pause(msg: str = "Presiona Enter para continuar...") -> None:
+    if isinstance(sys.stdout, ScreenRenderer):
+        sys.stdout.note_input(f"\n{msg}")
     input(f"\n{msg}")
 
 
@@ -45,10 +111,15 @@ def is_python_file(filename: str) -> bool:
     return filename.lower().endswith(".py")
 
 
+def is_hidden_dir(dirname: str) -> bool:
+    """Carpetas internas que no son unidades ni temas (.git, __pycache__, cachés)."""
+    return dirname.startswith(".") or dirname == "__pycache__"
+
+
 def safe_list_dirs(path: str) -> List[str]:
     """Lista subcarpetas (solo directorios)."""
     try:
-        return sorted([f.name for f in os.scandir(path) if f.is_dir()])
+        return sorted([f.name for f in os.scandir(path) if f.is_dir() and not is_hidden_dir(f.name)])
     except FileNotFoundError:
         return []
     except PermissionError:
@@ -69,22 +140,78 @@ def safe_list_py_files(path: str) -> List[str]:
         return []
 
 
-def read_text_file(path: str) -> Optional[str]:
-    """Lee un archivo de texto y devuelve su contenido."""
+def safe_scan_dir(path: str) -> Tuple[List[str], List[str]]:
+    """
+    Lista subcarpetas y archivos .py con UNA sola llamada a os.scandir.
+    Devuelve (carpetas, scripts), ambos ordenados.
+    """
+    dirs: List[str] = []
+    scripts: List[str] = []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError:
-        return None
+        with os.scandir(path) as it:
+            for f in it:
+                try:
+                    if f.is_dir():
+                        if not is_hidden_dir(f.name):
+                            dirs.append(f.name)
+                    elif f.is_file() and is_python_file(f.name):
+                        scripts.append(f.name)
+                except OSError:
+                    continue
+    except Exception:
+        return [], []
+    return sorted(dirs), sorted(scripts)
+
+
+def pick_units(dirs: List[str]) -> List[str]:
+    """Carpetas "Unidad ..." de la lista; si no hay ninguna, todas."""
+    unidades = [d for d in dirs if d.lower().startswith("unidad")]
+    return unidades if unidades else dirs
+
+
+def decode_line(raw: bytes) -> str:
+    """Decodifica una línea en UTF-8 o, si no se puede, en latin-1."""
+    try:
+        return raw.decode("utf-8")
     except UnicodeDecodeError:
-        # fallback por si el archivo tiene otra codificación
+        return raw.decode("latin-1")
+
+
+SNIFF_BYTES = 64 * 1024
+
+
+def sniff_encoding(head: bytes) -> str:
+    """
+    Adivina la codificación a partir del inicio del archivo:
+    BOM o comentario `# -*- coding: ... -*-` (como hace Python); si no hay,
+    UTF-8 cuando la cabecera lo es, o latin-1 en otro caso.
+    """
+    try:
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(head).readline)
+    except SyntaxError:
+        return "latin-1"
+    if encoding == "utf-8":
         try:
-            with open(path, "r", encoding="latin-1") as f:
-                return f.read()
-        except Exception:
-            return None
-    except Exception:
+            # final=False: un carácter cortado al final de la cabecera no es error
+            codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        except UnicodeDecodeError:
+            return "latin-1"
+    return encoding
+
+
+def read_text_file(path: str) -> Optional[str]:
+    """Lee un archivo de texto (una sola lectura) y devuelve su contenido."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
         return None
+    try:
+        text = data.decode(sniff_encoding(data[:SNIFF_BYTES]))
+    except (UnicodeDecodeError, LookupError):
+        text = data.decode("latin-1")
+    # mismos saltos de línea que open(..., "r")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
 def open_in_editor(filepath: str) -> None:
@@ -105,177 +232,3944 @@ def open_in_editor(filepath: str) -> None:
         print(f"No se pudo abrir el archivo en el editor: {e}")
 
 
-def choose_python_interpreter() -> str:
+def choose_python_interpreter() -> str:
+    """
+    Selecciona el intérprete de Python:
+    - En Windows suele ser 'python'
+    - En Linux/mac suele ser 'python3'
+    """
+    # Si el programa se ejecuta con python, usar el mismo intérprete:
+    # sys.executable es el camino real al python actual.
+    return sys.executable if sys.executable else ("python" if os.name == "nt" else "python3")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentil `pct` (0-100) con interpolación lineal; 0.0 si no hay valores."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * pct / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def env_int(name: str, default: int) -> int:
+    """Lee un entero de una variable de entorno (ej: DASHBOARD_PROFUNDIDAD=3)."""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# --------------------------- Datos y Favoritos ---------------------------
+
+@dataclass
+class ScriptItem:
+    unit_name: str
+    topic_name: str
+    script_name: str
+    script_path: str
+
+    def display_label(self) -> str:
+        return f"{self.unit_name} > {self.topic_name} > {self.script_name}"
+
+
+def normalize_path(path: str) -> str:
+    """Clave de comparación para rutas (absoluta y, en Windows, sin mayúsculas)."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+class FavoritesManager:
+    """
+    Maneja favoritos en un archivo de texto.
+    Cada línea guarda una ruta absoluta del script.
+
+    Los cambios no reescriben el archivo: se agregan al final de un diario
+    (favorites_file + ".journal") como "+ruta" o "-ruta", y cada tanto se
+    compacta todo de nuevo en el archivo principal. En memoria se usa un
+    diccionario ruta-normalizada -> ruta, así is_favorite es O(1).
+    Varias instancias del Dashboard pueden compartir los archivos: refresh()
+    lee solo lo que otras agregaron al diario desde la última vez.
+    """
+    # compactar cuando el diario tenga más líneas que esto y que favoritos
+    COMPACT_MIN_ENTRIES = 64
+
+    def __init__(self, favorites_file: str) -> None:
+        self.favorites_file = favorites_file
+        self.journal_file = favorites_file + ".journal"
+        self.lock_file = favorites_file + ".lock"
+        self._favorites: Dict[str, str] = {}
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._snapshot_sig: Optional[Tuple[int, int, int]] = None
+        self.load()
+
+    @staticmethod
+    def _file_sig(path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _replay_journal(self) -> None:
+        """Aplica las líneas nuevas del diario (desde el último offset leído)."""
+        try:
+            with open(self.journal_file, "rb") as f:
+                f.seek(self._journal_offset)
+                data = f.read()
+        except OSError:
+            return
+        # una línea sin \n puede estar a medio escribir por otra instancia
+        end = data.rfind(b"\n") + 1
+        for raw in data[:end].splitlines():
+            line = decode_line(raw).rstrip("\r")
+            op, path = line[:1], line[1:]
+            if not path:
+                continue
+            if op == "+":
+                self._favorites.setdefault(normalize_path(path), path)
+            elif op == "-":
+                self._favorites.pop(normalize_path(path), None)
+            self._journal_entries += 1
+        self._journal_offset += end
+
+    def load(self) -> None:
+        self._favorites = {}
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._snapshot_sig = self._file_sig(self.favorites_file)
+        content = read_text_file(self.favorites_file)
+        if content:
+            for line in content.splitlines():
+                p = line.strip()
+                if p:
+                    self._favorites.setdefault(normalize_path(p), p)
+        self._replay_journal()
+
+    def refresh(self) -> None:
+        """Incorpora cambios hechos por otras instancias (si los hay)."""
+        if self._file_sig(self.favorites_file) != self._snapshot_sig:
+            self.load()  # otra instancia compactó
+            return
+        try:
+            size = os.path.getsize(self.journal_file)
+        except OSError:
+            size = 0
+        if size < self._journal_offset:
+            self.load()
+        elif size > self._journal_offset:
+            self._replay_journal()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Bloqueo entre procesos (fcntl); en Windows no se bloquea."""
+        if fcntl is None:
+            yield
+            return
+        try:
+            fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            yield
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _append(self, op: str, path: str) -> None:
+        try:
+            with self._locked():
+                self.refresh()
+                if (op == "+") == self.is_favorite(path):
+                    return  # otra instancia ya hizo el mismo cambio
+                with open(self.journal_file, "ab") as f:
+                    f.write(f"{op}{path}\n".encode("utf-8"))
+                self._replay_journal()
+        except Exception as e:
+            print(f"No se pudo guardar favoritos: {e}")
+            return
+        if self._journal_entries > max(self.COMPACT_MIN_ENTRIES, len(self._favorites)):
+            self.save()
+
+    def save(self) -> None:
+        """Compacta: escribe todos los favoritos en el archivo principal y vacía el diario."""
+        tmp = f"{self.favorites_file}.{os.getpid()}.tmp"
+        try:
+            with self._locked():
+                self.refresh()
+                with open(tmp, "w", encoding="utf-8") as f:
+                    for p in self._favorites.values():
+                        f.write(p + "\n")
+                os.replace(tmp, self.favorites_file)
+                with open(self.journal_file, "wb"):
+                    pass
+                self._journal_offset = 0
+                self._journal_entries = 0
+                self._snapshot_sig = self._file_sig(self.favorites_file)
+        except Exception as e:
+            print(f"No se pudo guardar favoritos: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def list(self, existing_only: bool = False) -> List[str]:
+        """
+        Rutas favoritas en orden de alta. La existencia de cada archivo solo
+        se revisa aquí y solo si se pide (existing_only=True).
+        """
+        self.refresh()
+        paths = list(self._favorites.values())
+        if existing_only:
+            paths = [p for p in paths if os.path.exists(p)]
+        return paths
+
+    def is_favorite(self, path: str) -> bool:
+        return normalize_path(path) in self._favorites
+
+    def add(self, path: str) -> None:
+        p = os.path.abspath(path)
+        if os.path.exists(p):
+            self._append("+", p)
+
+    def remove(self, path: str) -> None:
+        self._append("-", os.path.abspath(path))
+
+
+# --------------------------- Índice de Scripts ---------------------------
+
+class ScriptIndex:
+    """
+    Índice en disco del contenido de cada carpeta del proyecto.
+    Por cada directorio guarda su mtime, sus subcarpetas y sus archivos .py.
+    Al consultar una carpeta solo se hace un os.stat: si el mtime no cambió
+    se usa lo guardado (acierto) y si cambió se vuelve a escanear (fallo).
+    Después de cada recorrido completo, prune() olvida las carpetas que no
+    se visitaron (borradas o renombradas junto con una carpeta padre).
+    """
+    VERSION = 1
+    # Un directorio modificado hace menos de esto puede volver a cambiar
+    # dentro del mismo "tick" de mtime; no se confía en su entrada.
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, index_file: str) -> None:
+        self.index_file = index_file
+        # ruta -> (mtime_ns, carpetas, scripts)
+        self._entries: Dict[str, Tuple[int, List[str], List[str]]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self) -> None:
+        content = read_text_file(self.index_file)
+        self._entries = {}
+        if not content:
+            return
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        for path, entry in data.get("dirs", {}).items():
+            try:
+                mtime, dirs, scripts = entry
+                self._entries[path] = (int(mtime), list(dirs), list(scripts))
+            except (TypeError, ValueError):
+                continue
+
+    def save(self) -> None:
+        """Guarda el índice solo si hubo cambios (escritura atómica)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": self.VERSION,
+                "dirs": {p: [m, d, s] for p, (m, d, s) in self._entries.items()},
+            }
+            self._dirty = False
+        tmp = f"{self.index_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.index_file) or ".", exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, self.index_file)
+        except Exception as e:
+            print(f"No se pudo guardar el índice de scripts: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def list_dir(self, path: str) -> Tuple[List[str], List[str]]:
+        """Devuelve (carpetas, scripts) de `path`, re-escaneando solo si cambió."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            with self._lock:
+                if self._entries.pop(path, None) is not None:
+                    self._dirty = True
+            return [], []
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == mtime:
+                self.hits += 1
+                return entry[1], entry[2]
+            self.misses += 1
+
+        dirs, scripts = safe_scan_dir(path)
+        if time.time_ns() - mtime < self.RACY_WINDOW_NS:
+            # cambio muy reciente: guardar, pero forzar re-escaneo la próxima vez
+            mtime = -1
+        with self._lock:
+            self._entries[path] = (mtime, dirs, scripts)
+            self._dirty = True
+        return dirs, scripts
+
+    def prune(self, visited: Iterable[str]) -> int:
+        """Borra las entradas de carpetas que no están en `visited`. Devuelve cuántas borró."""
+        keep = set(visited)
+        with self._lock:
+            stale = [p for p in self._entries if p not in keep]
+            for p in stale:
+                del self._entries[p]
+            if stale:
+                self._dirty = True
+        return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+# --------------------------- Recorrido en Paralelo ---------------------------
+
+class TreeScanner:
+    """
+    Recorre unidades y temas con un grupo acotado de hilos.
+
+    Cada carpeta se lista apenas se descubre (sin esperar a que termine el
+    nivel anterior), así las esperas de red de muchas carpetas se solapan.
+    El resultado se arma al final en el mismo orden que un recorrido
+    secuencial. También guarda cuánto tardó cada carpeta.
+
+    Profundidad: 1 = solo unidades, 2 = unidad/tema (como siempre),
+    3 o más = también subcarpetas de cada tema ("Tema 1/Parte A").
+    """
+    def __init__(self, list_dir: Callable[[str], Tuple[List[str], List[str]]],
+                 max_workers: int = 8, max_depth: int = 2) -> None:
+        self.list_dir = list_dir
+        self.max_workers = max(1, max_workers)
+        self.max_depth = max(1, max_depth)
+        self.latencies: Dict[str, float] = {}
+        self.last_scan_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def _timed_list(self, path: str) -> Tuple[List[str], List[str]]:
+        start = time.perf_counter()
+        try:
+            return self.list_dir(path)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.latencies[path] = elapsed
+
+    def _list_tree(self, roots: List[str]) -> Dict[str, Tuple[List[str], List[str]]]:
+        """Lista en paralelo `roots` (nivel 1) y sus subcarpetas hasta max_depth."""
+        listings: Dict[str, Tuple[List[str], List[str]]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures: Dict[Future, Tuple[str, int]] = {
+                pool.submit(self._timed_list, path): (path, 1) for path in roots
+            }
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    path, depth = futures.pop(fut)
+                    try:
+                        dirs, scripts = fut.result()
+                    except Exception:
+                        dirs, scripts = [], []
+                    listings[path] = (dirs, scripts)
+                    if depth < self.max_depth:
+                        for d in dirs:
+                            child = os.path.join(path, d)
+                            futures[pool.submit(self._timed_list, child)] = (child, depth + 1)
+        return listings
+
+    def scan(self, base_path: str, units: List[str]) -> List[ScriptItem]:
+        start = time.perf_counter()
+        with self._lock:
+            self.latencies = {}
+        unit_paths = [os.path.join(base_path, u) for u in units]
+        listings = self._list_tree(unit_paths)
+        items = self.build_items(listings, units, unit_paths)
+        self.last_scan_seconds = time.perf_counter() - start
+        return items
+
+    def build_items(self, listings: Dict[str, Tuple[List[str], List[str]]],
+                    units: List[str], unit_paths: List[str]) -> List[ScriptItem]:
+        """Arma los ScriptItem a partir de listados ya hechos (sin tocar el disco)."""
+        items: List[ScriptItem] = []
+
+        def add_topic(unit: str, topic: str, topic_path: str, depth: int) -> None:
+            dirs, scripts = listings.get(topic_path, ([], []))
+            for s in scripts:
+                items.append(ScriptItem(unit, topic, s, os.path.join(topic_path, s)))
+            if depth < self.max_depth:
+                for d in dirs:
+                    # el tema es una etiqueta para mostrar, no una ruta: siempre con "/"
+                    add_topic(unit, topic + "/" + d, os.path.join(topic_path, d), depth + 1)
+
+        for unit, unit_path in zip(units, unit_paths):
+            topics, unit_scripts = listings.get(unit_path, ([], []))
+            if not topics or self.max_depth == 1:
+                # si no hay subcarpetas, buscar scripts directo en unidad
+                for s in unit_scripts:
+                    items.append(ScriptItem(unit, "(sin tema)", s, os.path.join(unit_path, s)))
+                continue
+            for topic in topics:
+                add_topic(unit, topic, os.path.join(unit_path, topic), 2)
+        return items
+
+    def slowest(self, n: int = 10) -> List[Tuple[str, float]]:
+        """Las `n` carpetas que más tardaron en el último recorrido (segundos)."""
+        with self._lock:
+            return sorted(self.latencies.items(), key=lambda kv: kv[1], reverse=True)[:n]
+
+
+# --------------------------- Vigilancia de Cambios ---------------------------
+
+class _InotifyBackend:
+    """Avisos del kernel de Linux (inotify) sobre carpetas, usando ctypes."""
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_DELETE_SELF = 0x400
+    IN_MOVE_SELF = 0x800
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+    IN_ONLYDIR = 0x01000000
+    MASK = (IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+            | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+    EVENT = struct.Struct("iIII")  # wd, mask, cookie, largo del nombre
+    name = "inotify"
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify solo existe en Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falló")
+        self._paths: Dict[int, str] = {}
+        self._wds: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def watch(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        with self._lock:
+            self._paths[wd] = path
+            self._wds[path] = wd
+
+    def unwatch(self, path: str) -> None:
+        with self._lock:
+            wd = self._wds.pop(path, None)
+            if wd is None:
+                return
+            self._paths.pop(wd, None)
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        """
+        Carpetas que cambiaron (juntando ráfagas de avisos seguidos).
+        None si el kernel perdió avisos y hay que revisar todo.
+        """
+        changed: Set[str] = set()
+        ready = select.select([self.fd], [], [], timeout)[0]
+        while ready:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            off = 0
+            while off < len(buf):
+                wd, mask, _, length = self.EVENT.unpack_from(buf, off)
+                off += self.EVENT.size + length
+                if mask & self.IN_Q_OVERFLOW:
+                    return None
+                with self._lock:
+                    path = self._paths.get(wd)
+                    if path is not None and mask & self.IN_IGNORED:
+                        # la carpeta ya no existe: el kernel soltó el aviso
+                        del self._paths[wd]
+                        self._wds.pop(path, None)
+                if path is not None:
+                    changed.add(path)
+            ready = select.select([self.fd], [], [], 0.05)[0]
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _PollingBackend:
+    """Plan B sin inotify: compara el mtime de cada carpeta cada `interval` segundos."""
+    name = "sondeo"
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._mtimes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+    @staticmethod
+    def _mtime(path: str) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return -1
+
+    def watch(self, path: str) -> None:
+        mtime = self._mtime(path)
+        with self._lock:
+            self._mtimes[path] = mtime
+
+    def unwatch(self, path: str) -> None:
+        with self._lock:
+            self._mtimes.pop(path, None)
+
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        self._closed.wait(min(timeout, self.interval))
+        with self._lock:
+            watched = list(self._mtimes.items())
+        changed = set()
+        for path, old in watched:
+            mtime = self._mtime(path)
+            if mtime != old:
+                changed.add(path)
+                with self._lock:
+                    if path in self._mtimes:
+                        self._mtimes[path] = mtime
+        return changed
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+@dataclass
+class TreeDelta:
+    """Scripts que aparecieron y que desaparecieron con un cambio en disco."""
+    added: List[ScriptItem] = field(default_factory=list)
+    removed: List[ScriptItem] = field(default_factory=list)
+
+
+class TreeWatcher:
+    """
+    Mantiene en memoria el árbol unidades/temas/scripts y lo actualiza solo
+    cuando algo cambia en disco. Usa inotify en Linux y, si no se puede,
+    revisa los mtime de las carpetas cada POLL_INTERVAL segundos.
+
+    Un hilo aparte re-lee únicamente las carpetas que cambiaron. Los menús
+    consultan listing() / items() sin tocar el disco, y cada cambio queda
+    como un TreeDelta que drain() entrega (por ejemplo al motor de búsqueda).
+    """
+    POLL_INTERVAL = 1.0
+    MAX_PENDING = 256
+
+    def __init__(self, base_path: str,
+                 list_dir: Callable[[str], Tuple[List[str], List[str]]] = safe_scan_dir,
+                 max_workers: int = 8, max_depth: int = 2, use_inotify: bool = True,
+                 poll_interval: Optional[float] = None) -> None:
+        self.base_path = base_path
+        self.list_dir = list_dir
+        self.max_depth = max(1, max_depth)
+        self.use_inotify = use_inotify
+        self.poll_interval = poll_interval or self.POLL_INTERVAL
+        self.max_workers = max_workers
+        # recorrido inicial: la base cuenta como un nivel más
+        self.loader = self._scanner(self.max_depth + 1)
+        self._builder = TreeScanner(list_dir, max_depth=self.max_depth)
+        self._watch_failed = False
+        self.running = False
+        self.generation = 0
+        self._backend = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._listings: Dict[str, Tuple[List[str], List[str]]] = {}
+        self._units: List[str] = []
+        self._unit_items: Dict[str, Dict[str, ScriptItem]] = {}
+        self._items_cache: Optional[List[ScriptItem]] = None
+        self._pending: List[TreeDelta] = []
+        self._resync = True
+
+    @property
+    def backend_name(self) -> str:
+        return self._backend.name if self._backend is not None else "-"
+
+    def _scanner(self, levels: int) -> TreeScanner:
+        return TreeScanner(self._watch_and_list, max_workers=self.max_workers, max_depth=levels)
+
+    def _watch_and_list(self, path: str) -> Tuple[List[str], List[str]]:
+        # primero el aviso y después la lectura: así no se pierde nada entre medio
+        try:
+            self._backend.watch(path)  # type: ignore[union-attr]
+        except OSError:
+            self._watch_failed = True
+        return self.list_dir(path)
+
+    def _depth(self, path: str) -> int:
+        rel = os.path.relpath(path, self.base_path)
+        return 0 if rel == os.curdir else rel.count(os.sep) + 1
+
+    def start(self) -> None:
+        if self.running:
+            return
+        backend = None
+        if self.use_inotify:
+            try:
+                backend = _InotifyBackend()
+            except (OSError, AttributeError):
+                backend = None
+        self._backend = backend or _PollingBackend(self.poll_interval)
+        start = time.perf_counter()
+        self._watch_failed = False
+        listings = self.loader._list_tree([self.base_path])
+        if self._watch_failed:
+            # sin cupo de avisos (max_user_watches): pasar a sondeo
+            self._backend.close()
+            self._backend = _PollingBackend(self.poll_interval)
+            listings = self.loader._list_tree([self.base_path])
+        self.loader.last_scan_seconds = time.perf_counter() - start
+        with self._lock:
+            self._listings = listings
+            self._refresh_items(None)
+            self._pending = []
+            self._resync = True
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name="TreeWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self.running = False
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 1.0)
+        self._backend.close()  # type: ignore[union-attr]
+
+    # ---- lectura (sin disco) ----
+
+    def listing(self, path: str) -> Optional[Tuple[List[str], List[str]]]:
+        """(carpetas, scripts) de una carpeta vigilada, o None si no se vigila."""
+        # el hilo vigilante cambia el diccionario mientras el explorador lee;
+        # los listados se reemplazan enteros, así que basta con leer bajo el candado
+        with self._lock:
+            return self._listings.get(path) if self.running else None
+
+    def items(self) -> List[ScriptItem]:
+        with self._lock:
+            if self._items_cache is None:
+                self._items_cache = [it for u in self._units for it in self._unit_items.get(u, {}).values()]
+            return self._items_cache
+
+    def folder_count(self) -> int:
+        with self._lock:
+            return len(self._listings)
+
+    def folders(self) -> List[str]:
+        """Las carpetas vigiladas (las que listó el recorrido inicial y las nuevas desde entonces)."""
+        with self._lock:
+            return list(self._listings)
+
+    def drain(self) -> Optional[List[TreeDelta]]:
+        """
+        Cambios desde la última llamada, en orden. None si hay que
+        sincronizar todo con items() (al empezar o si se juntaron demasiados).
+        """
+        with self._lock:
+            if self._resync:
+                self._resync = False
+                self._pending = []
+                return None
+            pending, self._pending = self._pending, []
+            return pending
+
+    # ---- actualización (hilo del vigilante) ----
+
+    def _run(self) -> None:
+        while self.running:
+            try:
+                changed = self._backend.wait(0.5)  # type: ignore[union-attr]
+            except (OSError, ValueError):
+                break
+            if not self.running:
+                break
+            if changed is not None and not changed:
+                continue
+            with self._lock:
+                delta = self._apply(changed)
+                if delta.added or delta.removed:
+                    self.generation += 1
+                    self._pending.append(delta)
+                    if len(self._pending) > self.MAX_PENDING:
+                        self._pending = []
+                        self._resync = True
+
+    def _drop(self, path: str) -> None:
+        """Olvida una carpeta y todo lo que tenía debajo."""
+        prefix = path + os.sep
+        for p in [p for p in self._listings if p == path or p.startswith(prefix)]:
+            del self._listings[p]
+            self._backend.unwatch(p)  # type: ignore[union-attr]
+
+    def _apply(self, changed: Optional[Set[str]]) -> TreeDelta:
+        if changed is None:
+            changed = set(self._listings)
+        units: Optional[Set[str]] = set()
+        for path in sorted(changed, key=self._depth):
+            old = self._listings.get(path)
+            if old is None:
+                continue  # ya se borró junto con su carpeta padre
+            depth = self._depth(path)
+            if not os.path.isdir(path):
+                self._drop(path)
+                new = ([], [])
+            else:
+                new = self.list_dir(path)
+                self._listings[path] = new
+                for d in set(old[0]) - set(new[0]):
+                    self._drop(os.path.join(path, d))
+                if depth < self.max_depth:
+                    added = [os.path.join(path, d) for d in new[0] if d not in old[0]]
+                    if added:
+                        self._listings.update(self._scanner(self.max_depth - depth)._list_tree(added))
+            if depth == 0:
+                units = None
+            elif units is not None:
+                units.add(os.path.relpath(path, self.base_path).split(os.sep)[0])
+        return self._refresh_items(units)
+
+    def _refresh_items(self, units: Optional[Set[str]]) -> TreeDelta:
+        """Rehace los scripts de las unidades tocadas (None = todas) y devuelve la diferencia."""
+        current = pick_units(self._listings.get(self.base_path, ([], []))[0])
+        if units is None or current != self._units:
+            units = set(current) | set(self._unit_items)
+        delta = TreeDelta()
+        wanted = set(current)
+        for unit in units:
+            old = self._unit_items.pop(unit, {})
+            new: Dict[str, ScriptItem] = {}
+            if unit in wanted:
+                unit_path = os.path.join(self.base_path, unit)
+                for it in self._builder.build_items(self._listings, [unit], [unit_path]):
+                    new[it.script_path] = it
+                self._unit_items[unit] = new
+            delta.removed.extend(it for p, it in old.items() if new.get(p) != it)
+            delta.added.extend(it for p, it in new.items() if old.get(p) != it)
+        self._units = current
+        self._items_cache = None
+        return delta
+
+
+# --------------------------- Exploración de Proyecto ---------------------------
+
+class ProjectExplorer:
+    """
+    Explora la estructura del proyecto para detectar unidades, temas y scripts.
+    Si recibe un ScriptIndex, las carpetas sin cambios se leen desde el índice.
+    El recorrido completo lo hace un TreeScanner en paralelo.
+    Con un TreeWatcher en marcha todo se lee del árbol en memoria.
+    """
+    def __init__(self, base_path: str, index: Optional[ScriptIndex] = None,
+                 max_workers: int = 8, max_depth: int = 2,
+                 watcher: Optional["TreeWatcher"] = None) -> None:
+        self.base_path = base_path
+        self.index = index
+        self.watcher = watcher
+        self.scanner = TreeScanner(self._list, max_workers=max_workers, max_depth=max_depth)
+
+    def _list(self, path: str) -> Tuple[List[str], List[str]]:
+        if self.watcher is not None:
+            listing = self.watcher.listing(path)
+            if listing is not None:
+                return listing
+        if self.index is not None:
+            return self.index.list_dir(path)
+        return safe_scan_dir(path)
+
+    def get_units(self) -> List[str]:
+        """
+        Detecta carpetas que empiecen con "Unidad" (ej: "Unidad 1").
+        Si no existen, devuelve todas las carpetas del directorio base.
+        """
+        return pick_units(self._list(self.base_path)[0])
+
+    def get_topics(self, unit_path: str) -> List[str]:
+        return self._list(unit_path)[0]
+
+    def get_scripts(self, topic_path: str) -> List[str]:
+        return self._list(topic_path)[1]
+
+    def save_index(self) -> None:
+        if self.index is not None:
+            self.index.save()
+
+    def collect_all_scripts(self) -> List[ScriptItem]:
+        """
+        Recorre todas las unidades y temas para construir una lista global de scripts.
+        Útil para búsqueda rápida.
+        """
+        if self.watcher is not None and self.watcher.running:
+            return self.watcher.items()
+        items = self.scanner.scan(self.base_path, self.get_units())
+        if self.index is not None:
+            # el recorrido listó la base y cada carpeta con su tiempo en latencies
+            self.index.prune([self.base_path, *self.scanner.latencies])
+        self.save_index()
+        return items
+
+    def precompile(self, cache: "BytecodeCache",
+                   items: Optional[List[ScriptItem]] = None) -> Tuple[int, int, int]:
+        """
+        Compila por adelantado (en paralelo) los scripts encontrados, o solo
+        `items`. Devuelve (compilados, reutilizados, con errores).
+        """
+        if items is None:
+            items = self.collect_all_scripts()
+        return cache.precompile(it.script_path for it in items)
+
+
+# --------------------------- Visor de Código ---------------------------
+
+class LineIndex:
+    """
+    Posición (en bytes) donde empieza cada línea de un archivo.
+    Se arma leyendo el archivo por bloques, sin cargarlo entero, y permite
+    saltar a cualquier línea con un seek directo.
+    """
+    CHUNK_BYTES = 1024 * 1024
+
+    def __init__(self, path: str) -> None:
+        st = os.stat(path)
+        self.path = path
+        self.size = st.st_size
+        self.mtime_ns = st.st_mtime_ns
+        self.offsets = array("Q", [0])
+        self.encoding = "utf-8"
+        with open(path, "rb") as f:
+            pos = 0
+            while True:
+                chunk = f.read(self.CHUNK_BYTES)
+                if not chunk:
+                    break
+                if pos == 0:
+                    self.encoding = sniff_encoding(chunk[:SNIFF_BYTES])
+                # largo de cada línea terminada en el bloque (+1 por el salto),
+                # acumulado: son los inicios de las líneas siguientes
+                parts = chunk.split(b"\n")
+                parts.pop()
+                lengths = map((1).__add__, map(len, parts))
+                self.offsets.extend(map(pos.__add__, itertools.accumulate(lengths)))
+                pos += len(chunk)
+        if len(self.offsets) > 1 and self.offsets[-1] == self.size:
+            self.offsets.pop()  # el salto final no abre una línea nueva
+
+    @property
+    def line_count(self) -> int:
+        return len(self.offsets) if self.size else 0
+
+    def is_current(self) -> bool:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        return st.st_size == self.size and st.st_mtime_ns == self.mtime_ns
+
+    def span(self, line: int) -> Tuple[int, int]:
+        """Rango de bytes [inicio, fin) de la línea `line` (desde 0)."""
+        start = self.offsets[line]
+        end = self.offsets[line + 1] if line + 1 < len(self.offsets) else self.size
+        return start, end
+
+
+class CodeViewer:
+    """
+    Muestra un archivo por páginas, leyendo del disco solo las líneas visibles.
+    Los índices de líneas se guardan por archivo (hasta MAX_INDEXES) y se
+    rehacen si el archivo cambió. Las líneas muy largas se recortan para no
+    decodificar megabytes de un archivo minificado.
+    """
+    MAX_INDEXES = 32
+    MAX_LINE_BYTES = 4096
+
+    def __init__(self) -> None:
+        self._indexes: "OrderedDict[str, LineIndex]" = OrderedDict()
+
+    def line_index(self, path: str) -> LineIndex:
+        key = normalize_path(path)
+        index = self._indexes.get(key)
+        if index is None or not index.is_current():
+            index = LineIndex(path)
+            self._indexes[key] = index
+        self._indexes.move_to_end(key)
+        while len(self._indexes) > self.MAX_INDEXES:
+            self._indexes.popitem(last=False)
+        return index
+
+    def read_lines(self, index: LineIndex, first: int, count: int) -> List[str]:
+        """Devuelve las líneas [first, first + count) ya decodificadas."""
+        lines = []
+        with open(index.path, "rb") as f:
+            for n in range(first, min(first + count, index.line_count)):
+                start, end = index.span(n)
+                f.seek(start)
+                raw = f.read(min(end - start, self.MAX_LINE_BYTES))
+                complete = start + len(raw) >= end
+                decoder = codecs.getincrementaldecoder(index.encoding)(errors="replace")
+                text = decoder.decode(raw, final=complete).rstrip("\r\n")
+                if not complete:
+                    text += f" ...[+{end - start - len(raw)} bytes]"
+                lines.append(text)
+        return lines
+
+    def show(self, path: str, page_size: Optional[int] = None) -> None:
+        """
+        Si el archivo cabe en una página se imprime completo; si no, se pagina:
+        Enter = siguiente, b = anterior, N o :N = ir a la línea N, q = salir.
+        """
+        try:
+            index = self.line_index(path)
+        except OSError:
+            print("No se pudo leer el archivo.")
+            return
+        total = index.line_count
+        page = page_size or max(5, shutil.get_terminal_size().lines - 4)
+        if total <= page:
+            for text in self.read_lines(index, 0, total):
+                print(text)
+            return
+
+        width = len(str(total))
+        first = 0
+        while True:
+            for n, text in enumerate(self.read_lines(index, first, page), first + 1):
+                print(f"{n:>{width}} | {text}")
+            last = min(first + page, total)
+            print(f"-- líneas {first + 1}-{last} de {total} ({last * 100 // total}%) -- "
+                  "Enter: siguiente | b: anterior | N o :N: ir a línea | q: salir")
+            try:
+                cmd = input("> ").strip().lower()
+            except EOFError:
+                return
+            if cmd == "q":
+                return
+            if cmd == "b":
+                first = max(0, first - page)
+            elif cmd.lstrip(":").isdigit():
+                first = min(max(0, int(cmd.lstrip(":")) - 1), total - 1)
+            elif last >= total:
+                return
+            else:
+                first = last
+
+
+# --------------------------- Código Precompilado ---------------------------
+
+def bytecode_key(script_path: str, source: bytes) -> str:
+    """Clave del código compilado: versión de bytecode, ruta y contenido del script."""
+    h = hashlib.sha256()
+    for part in (importlib.util.MAGIC_NUMBER, normalize_path(script_path).encode("utf-8"), source):
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.hexdigest()
+
+
+def compile_script(script_path: str, cache_dir: str) -> Tuple[str, str, bool]:
+    """
+    Compila un script a <cache_dir>/<clave>.pyc (formato .pyc por hash,
+    PEP 552). Devuelve (ruta, clave, recién_compilado); la clave es "" si
+    no se pudo (archivo ilegible o con errores de sintaxis: esos se
+    ejecutan desde el fuente para que Python muestre su propio error).
+    Está a nivel de módulo para poder usarse en otro proceso.
+    """
+    try:
+        with open(script_path, "rb") as f:
+            source = f.read()
+    except OSError:
+        return script_path, "", False
+    key = bytecode_key(script_path, source)
+    target = os.path.join(cache_dir, key + ".pyc")
+    if os.path.exists(target):
+        return script_path, key, False
+    try:
+        code = compile(source, script_path, "exec", dont_inherit=True)
+    except (SyntaxError, ValueError):
+        return script_path, "", False
+    data = (importlib.util.MAGIC_NUMBER + (1).to_bytes(4, "little")
+            + importlib.util.source_hash(source) + marshal.dumps(code))
+    tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, target)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return script_path, "", False
+    return script_path, key, True
+
+
+# Programa que reemplaza a "python script.py": carga el código ya compilado
+# y lo ejecuta como __main__ con el mismo sys.argv, sys.path[0] y __file__.
+# Si hay una excepción, la traza empieza en el script, como de costumbre.
+# Si el .pyc ya no está (lo borró un recorte) se compila el fuente.
+_BYTECODE_LOADER_CODE = r"""
+def _main():
+    import marshal, os, sys
+    cached, script = sys.argv[1], sys.argv[2]
+    try:
+        with open(cached, "rb") as f:
+            f.seek(16)
+            code = marshal.load(f)
+    except (OSError, EOFError, ValueError):
+        with open(script, "rb") as f:
+            code = compile(f.read(), script, "exec")
+    sys.argv = sys.argv[2:]
+    sys.path[0] = os.path.dirname(script)
+    g = sys.modules["__main__"].__dict__
+    g.pop("_main", None)
+    g["__file__"] = script
+    g["__cached__"] = None
+    try:
+        exec(code, g)
+    except SystemExit:
+        raise
+    except BaseException as e:
+        import traceback
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        sys.exit(130 if isinstance(e, KeyboardInterrupt) else 1)
+_main()
+"""
+
+
+class BytecodeCache:
+    """
+    Código compilado de los scripts, en una carpeta privada.
+
+    Python nunca guarda el .pyc del script principal: cada "python script.py"
+    lo vuelve a compilar desde el fuente, lo que en scripts grandes es buena
+    parte del arranque. Aquí cada script se compila una vez y se guarda por
+    hash (ruta + contenido + versión de bytecode), así que un cambio en el
+    archivo simplemente apunta a otra entrada. precompile() compila muchos
+    en paralelo con procesos; argv() arma el comando que ejecuta el código
+    guardado. Al pasar de `max_bytes` se borran las entradas menos usadas.
+    Los scripts de menos de `min_bytes` se ejecutan desde el fuente: compilarlos
+    cuesta menos que calcular el hash y arrancar el cargador.
+    """
+    PARALLEL_MIN_FILES = 16
+    # trim() no borra entradas usadas hace menos de esto: un hijo recién
+    # lanzado puede estar por abrir su .pyc
+    TRIM_GRACE_SECONDS = 60.0
+
+    def __init__(self, cache_dir: str, max_workers: Optional[int] = None,
+                 max_bytes: int = 200 * 1024 * 1024, min_bytes: int = 4096) -> None:
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.max_bytes = max_bytes
+        self.min_bytes = min_bytes
+        self.compiled = 0
+        self.reused = 0
+        self.failed = 0
+        self.last_seconds = 0.0
+
+    def _worth_caching(self, script_path: str) -> bool:
+        try:
+            return os.stat(script_path).st_size >= self.min_bytes
+        except OSError:
+            return False
+
+    def path_for(self, script_path: str, compile_missing: bool = True) -> Optional[str]:
+        """
+        El .pyc del contenido actual del script, compilándolo si falta (None
+        si no compila o es más chico que min_bytes). Con compile_missing=False
+        solo se busca uno ya compilado: compile() retiene el GIL y frenaría a
+        los demás hilos.
+        """
+        if not self._worth_caching(script_path):
+            return None
+        if compile_missing:
+            _, key, _ = compile_script(script_path, self.cache_dir)
+        else:
+            try:
+                with open(script_path, "rb") as f:
+                    key = bytecode_key(script_path, f.read())
+            except OSError:
+                return None
+        if not key:
+            return None
+        path = os.path.join(self.cache_dir, key + ".pyc")
+        try:
+            os.utime(path)  # marca de uso para el recorte
+        except OSError:
+            return None
+        return path
+
+    def argv(self, python_cmd: str, script_path: str, compile_missing: bool = True) -> List[str]:
+        """Comando equivalente a [python_cmd, script_path], desde el código precompilado si se puede."""
+        cached = self.path_for(script_path, compile_missing)
+        if cached is None:
+            return [python_cmd, script_path]
+        return [python_cmd, "-c", _BYTECODE_LOADER_CODE, cached, script_path]
+
+    def _compile_all(self, paths: List[str]) -> Iterator[Tuple[str, str, bool]]:
+        worker = functools.partial(compile_script, cache_dir=self.cache_dir)
+        if len(paths) >= self.PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    chunk = max(1, len(paths) // ((self.max_workers or os.cpu_count() or 1) * 4))
+                    return iter(list(pool.map(worker, paths, chunksize=chunk)))
+            except (OSError, BrokenProcessPool, AttributeError, ImportError, RuntimeError,
+                    pickle.PicklingError):
+                # PicklingError: el módulo se cargó con un nombre que los
+                # procesos hijos no pueden importar (este archivo lleva guiones)
+                pass  # sin procesos (o sin fork/spawn posible): seguir en este proceso
+        return map(worker, paths)
+
+    def precompile(self, script_paths: Iterable[str]) -> Tuple[int, int, int]:
+        """
+        Compila los scripts que falten (salvo los de menos de min_bytes).
+        Devuelve (compilados, reutilizados, con errores).
+        """
+        start = time.perf_counter()
+        compiled = reused = failed = 0
+        # lo ya compilado se reconoce por el hash, sin abrir procesos
+        missing = []
+        for path in dict.fromkeys(os.path.abspath(p) for p in script_paths):
+            if not self._worth_caching(path):
+                continue
+            try:
+                with open(path, "rb") as f:
+                    key = bytecode_key(path, f.read())
+            except OSError:
+                failed += 1
+                continue
+            if os.path.exists(os.path.join(self.cache_dir, key + ".pyc")):
+                reused += 1
+            else:
+                missing.append(path)
+        for _, key, fresh in self._compile_all(missing):
+            if not key:
+                failed += 1
+            elif fresh:
+                compiled += 1
+            else:
+                reused += 1
+        self.compiled, self.reused, self.failed = compiled, reused, failed
+        self.trim()
+        self.last_seconds = time.perf_counter() - start
+        return compiled, reused, failed
+
+    def trim(self) -> None:
+        """
+        Borra las entradas menos usadas mientras la carpeta pase de
+        max_bytes, salvo las usadas en los últimos TRIM_GRACE_SECONDS.
+        """
+        try:
+            with os.scandir(self.cache_dir) as it:
+                entries = [(f.stat().st_mtime_ns, f.stat().st_size, f.path) for f in it if f.name.endswith(".pyc")]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        recent = time.time_ns() - int(self.TRIM_GRACE_SECONDS * 1e9)
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes or mtime >= recent:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        try:
+            with os.scandir(self.cache_dir) as it:
+                sizes = [f.stat().st_size for f in it if f.name.endswith(".pyc")]
+        except OSError:
+            sizes = []
+        return {"entries": len(sizes), "bytes": sum(sizes), "compiled": self.compiled,
+                "reused": self.reused, "failed": self.failed}
+
+# --------------------------- Ejecutar y Mostrar Código ---------------------------
+
+@dataclass
+class RunResult:
+    """Resultado de una ejecución con salida capturada."""
+    script_path: str
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    wall_time: float
+    timed_out: bool = False
+    from_cache: bool = False
+    # consumo del proceso hijo (0 si el sistema no lo informa)
+    user_time: float = 0.0
+    system_time: float = 0.0
+    max_rss_kb: int = 0
+    cancelled: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out and not self.cancelled
+
+    def status_label(self) -> str:
+        if self.cancelled:
+            return "CANCELADO"
+        if self.timed_out:
+            return "TIEMPO"
+        if self.returncode == 0:
+            return "OK"
+        return f"ERROR ({self.returncode})"
+
+
+class RunResultCache:
+    """
+    Caché en disco de resultados de ejecuciones exitosas.
+
+    La clave es un hash SHA-256 del código fuente del script, del intérprete
+    (ruta y versión) y de la entrada estándar: si nada de eso cambió, un
+    script determinista no puede dar otra salida. Solo se mira el archivo
+    del script, no los módulos o archivos que él mismo lea.
+    Cada resultado es un archivo <clave>.json; su mtime marca el último uso
+    y, al pasar de `max_bytes` o `max_entries`, se borran los menos usados
+    (LRU).
+    """
+    def __init__(self, cache_dir: str, max_bytes: int = 50 * 1024 * 1024, max_entries: int = 2000) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # clave -> tamaño en bytes, del menos al más recientemente usado
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with os.scandir(self.cache_dir) as it:
+                found = []
+                for f in it:
+                    if f.name.endswith(".json"):
+                        st = f.stat()
+                        found.append((st.st_mtime_ns, f.name[:-5], st.st_size))
+        except OSError:
+            return
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+    @staticmethod
+    def make_key(script_path: str, stdin_text: str, python_cmd: str) -> Optional[str]:
+        try:
+            with open(script_path, "rb") as f:
+                source = f.read()
+        except OSError:
+            return None
+        h = hashlib.sha256()
+        for part in (source, python_cmd.encode("utf-8"), sys.version.encode("utf-8"), stdin_text.encode("utf-8")):
+            h.update(len(part).to_bytes(8, "little"))
+            h.update(part)
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[RunResult]:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(self._path(key))
+            result = RunResult(**data)
+        except (OSError, ValueError, TypeError):
+            with self._lock:
+                self._total_bytes -= self._entries.pop(key, 0)
+                self.misses += 1
+            return None
+        with self._lock:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        result.from_cache = True
+        return result
+
+    def put(self, key: str, result: RunResult) -> None:
+        if not result.ok:
+            return
+        data = dict(result.__dict__, from_cache=False)
+        tmp = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            size = os.path.getsize(tmp)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._total_bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            evicted = []
+            while self._entries and (self._total_bytes > self.max_bytes or len(self._entries) > self.max_entries):
+                old_key, old_size = self._entries.popitem(last=False)
+                self._total_bytes -= old_size
+                evicted.append(old_key)
+        for old_key in evicted:
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "entries": len(self._entries), "bytes": self._total_bytes}
+
+
+def rss_to_kb(maxrss: int) -> int:
+    """ru_maxrss viene en KiB en Linux y en bytes en macOS."""
+    return int(maxrss) // 1024 if sys.platform == "darwin" else int(maxrss)
+
+
+def run_with_usage(cmd: List[str], input_bytes: bytes, timeout: Optional[float],
+                   cwd: str, env: Dict[str, str]) -> Tuple[Optional[int], bytes, bytes, bool, Tuple[float, float, int]]:
+    """
+    Como subprocess.run(..., capture_output=True), pero espera al hijo con
+    os.wait4 para obtener SU consumo (lo mismo que resource.getrusage, solo
+    de ese proceso, aunque haya otros corriendo a la vez).
+    Devuelve (código, stdout, stderr, se_acabó_el_tiempo, (cpu_usuario, cpu_sistema, rss_kb)).
+
+    En Linux el pico de memoria de un hijo arranca en la memoria que tenía
+    el Dashboard al crearlo; si no la supera no se sabe cuánto usó el script
+    y se informa 0 (desconocido).
+    """
+    if not hasattr(os, "wait4"):
+        try:
+            proc = subprocess.run(cmd, input=input_bytes, capture_output=True, timeout=timeout, cwd=cwd, env=env)
+        except subprocess.TimeoutExpired as e:
+            return None, e.stdout or b"", e.stderr or b"", True, (0.0, 0.0, 0)
+        return proc.returncode, proc.stdout, proc.stderr, False, (0.0, 0.0, 0)
+
+    floor_kb = 0
+    if resource is not None and sys.platform.startswith("linux"):
+        floor_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, cwd=cwd, env=env)
+    chunks: Dict[str, bytes] = {}
+
+    def read(name: str, stream: object) -> None:
+        chunks[name] = stream.read()  # type: ignore[attr-defined]
+
+    def write() -> None:
+        try:
+            proc.stdin.write(input_bytes)  # type: ignore[union-attr]
+            proc.stdin.close()  # type: ignore[union-attr]
+        except OSError:
+            pass  # el script terminó sin leer toda la entrada
+
+    threads = [threading.Thread(target=read, args=("out", proc.stdout), daemon=True),
+               threading.Thread(target=read, args=("err", proc.stderr), daemon=True),
+               threading.Thread(target=write, daemon=True)]
+    for t in threads:
+        t.start()
+    expired = threading.Event()
+
+    def kill() -> None:
+        expired.set()
+        try:
+            proc.kill()
+        except OSError:
+            pass
+
+    timer = threading.Timer(timeout, kill) if timeout else None
+    if timer is not None:
+        timer.daemon = True
+        timer.start()
+    try:
+        _, status, ru = os.wait4(proc.pid, 0)
+    finally:
+        if timer is not None:
+            timer.cancel()
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    for t in threads:
+        t.join(timeout=1.0)  # un nieto podría seguir con las tuberías abiertas
+    for stream in (proc.stdout, proc.stderr):
+        try:
+            stream.close()  # type: ignore[union-attr]
+        except OSError:
+            pass
+    rss_kb = rss_to_kb(ru.ru_maxrss)
+    usage = (ru.ru_utime, ru.ru_stime, rss_kb if rss_kb > floor_kb else 0)
+    if expired.is_set():
+        return None, chunks.get("out", b""), chunks.get("err", b""), True, usage
+    return proc.returncode, chunks.get("out", b""), chunks.get("err", b""), False, usage
+
+# Proceso "lanzador": un Python mínimo que crea los procesos de las
+# ejecuciones capturadas y los espera con os.wait4. En Linux un proceso
+# nuevo empieza con el pico de memoria de quien lo creó; creado desde aquí
+# ese punto de partida es el de un intérprete vacío y no el del Dashboard.
+# Atiende varios pedidos a la vez: cada respuesta lleva el id del pedido.
+_SPAWNER_CODE = r"""
+import json, os, subprocess, sys, threading
+lock = threading.Lock()
+
+def reply(msg):
+    with lock:
+        sys.stdout.write(json.dumps(msg) + "\n")
+        sys.stdout.flush()
+
+def wait(req_id, proc):
+    _, status, ru = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    reply({"id": req_id, "rc": proc.returncode, "utime": ru.ru_utime,
+           "stime": ru.ru_stime, "maxrss": ru.ru_maxrss})
+
+for line in sys.stdin:
+    req = json.loads(line)
+    try:
+        with open(req["stdin"], "rb") as fin, open(req["stdout"], "wb") as fout, \
+                open(req["stderr"], "wb") as ferr:
+            proc = subprocess.Popen(req["argv"], stdin=fin, stdout=fout, stderr=ferr,
+                                    cwd=req["cwd"], env=req["env"], start_new_session=True)
+    except OSError as e:
+        reply({"id": req["id"], "error": str(e)})
+        continue
+    reply({"id": req["id"], "pid": proc.pid})
+    threading.Thread(target=wait, args=(req["id"], proc), daemon=True).start()
+"""
+
+
+class ProcessSpawner:
+    """
+    Crea los procesos de las ejecuciones capturadas desde el lanzador
+    (_SPAWNER_CODE), para que el pico de memoria medido sea el del script.
+    Misma interfaz que run_with_usage; la entrada y la salida pasan por
+    archivos temporales, como en el cigoto. Solo en sistemas con os.wait4.
+    """
+    def __init__(self, python_cmd: str) -> None:
+        self.proc = subprocess.Popen(
+            [python_cmd, "-I", "-S", "-c", _SPAWNER_CODE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+        self.closed = False
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._waiting: Dict[int, "queue.Queue[dict]"] = {}
+        threading.Thread(target=self._read_replies, name="ProcessSpawner", daemon=True).start()
+
+    @staticmethod
+    def available() -> bool:
+        return os.name == "posix" and hasattr(os, "wait4")
+
+    def _read_replies(self) -> None:
+        assert self.proc.stdout is not None
+        for line in self.proc.stdout:
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                continue
+            with self._lock:
+                waiting = self._waiting.get(msg.get("id"))
+            if waiting is not None:
+                waiting.put(msg)
+        # el lanzador terminó: despertar a quien siga esperando
+        with self._lock:
+            self.closed = True
+            for waiting in self._waiting.values():
+                waiting.put({})
+
+    def run(self, cmd: List[str], input_bytes: bytes, timeout: Optional[float],
+            cwd: str, env: Dict[str, str]) -> Tuple[Optional[int], bytes, bytes, bool, Tuple[float, float, int]]:
+        with tempfile.TemporaryDirectory(prefix="dashboard-run-") as tmp:
+            req = {
+                "argv": cmd,
+                "cwd": cwd,
+                "env": env,
+                "stdin": os.path.join(tmp, "stdin"),
+                "stdout": os.path.join(tmp, "stdout"),
+                "stderr": os.path.join(tmp, "stderr"),
+            }
+            with open(req["stdin"], "wb") as f:
+                f.write(input_bytes)
+            replies: "queue.Queue[dict]" = queue.Queue()
+            with self._lock:
+                if self.closed:
+                    raise RuntimeError("el lanzador de procesos no está disponible")
+                req["id"] = req_id = next(self._ids)
+                self._waiting[req_id] = replies
+                try:
+                    self.proc.stdin.write(json.dumps(req) + "\n")  # type: ignore[union-attr]
+                    self.proc.stdin.flush()  # type: ignore[union-attr]
+                except (OSError, ValueError):
+                    del self._waiting[req_id]
+                    raise RuntimeError("el lanzador de procesos terminó inesperadamente")
+
+            expired = threading.Event()
+            timer = None
+            try:
+                first = replies.get()
+                if "error" in first:
+                    raise OSError(first["error"])
+                if "pid" not in first:
+                    raise RuntimeError("el lanzador de procesos terminó inesperadamente")
+                pid = first["pid"]
+
+                def kill() -> None:
+                    expired.set()
+                    try:
+                        os.killpg(pid, signal.SIGKILL)
+                    except OSError:
+                        pass
+
+                if timeout:
+                    timer = threading.Timer(timeout, kill)
+                    timer.daemon = True
+                    timer.start()
+                reply = replies.get()
+                if "rc" not in reply:
+                    raise RuntimeError("el lanzador de procesos terminó inesperadamente")
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                with self._lock:
+                    self._waiting.pop(req_id, None)
+            with open(req["stdout"], "rb") as f:
+                out = f.read()
+            with open(req["stderr"], "rb") as f:
+                err = f.read()
+        usage = (reply["utime"], reply["stime"], rss_to_kb(reply["maxrss"]))
+        if expired.is_set():
+            return None, out, err, True, usage
+        return reply["rc"], out, err, False, usage
+
+    def close(self) -> None:
+        try:
+            if self.proc.stdin is not None:
+                self.proc.stdin.close()
+            self.proc.wait(timeout=2)
+        except Exception:
+            self.proc.kill()
+
+
+def _to_text(data: object) -> str:
+    if data is None:
+        return ""
+    if isinstance(data, bytes):
+        return data.decode("utf-8", errors="replace")
+    return str(data)
+
+
+# Proceso "cigoto": importa módulos comunes una sola vez y, por cada pedido,
+# hace fork() y ejecuta el script en el hijo con runpy. El hijo tiene su
+# propio proceso, carpeta, stdin/stdout/stderr y __main__, igual que un
+# "python script.py", pero sin pagar el arranque del intérprete.
+_WARM_ZYGOTE_CODE = r"""
+import atexit, gc, json, os, runpy, sys, traceback
+for _name in sys.argv[1:]:
+    try:
+        __import__(_name)
+    except Exception:
+        pass
+ctl_in = os.fdopen(os.dup(0), "r", encoding="utf-8")
+ctl_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+_null = os.open(os.devnull, os.O_RDWR)
+os.dup2(_null, 0)
+os.dup2(_null, 1)
+
+def _redirect(path, fd, flags):
+    new = os.open(path, flags, 0o600)
+    os.dup2(new, fd)
+    os.close(new)
+
+def _child(req):
+    code = 1
+    try:
+        os.setsid()
+        ctl_in.close()
+        ctl_out.close()
+        _redirect(req["stdin"], 0, os.O_RDONLY)
+        _redirect(req["stdout"], 1, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        _redirect(req["stderr"], 2, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+        sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+        sys.stderr = open(2, "w", encoding="utf-8", closefd=False, buffering=1)
+        os.chdir(req["cwd"])
+        sys.argv = [req["script"]]
+        sys.path[0] = req["cwd"]
+        code = 0
+        namespace = {}
+        try:
+            if req.get("code"):
+                # código ya compilado (BytecodeCache): no hace falta el fuente
+                import marshal, types
+                with open(req["code"], "rb") as f:
+                    f.seek(16)
+                    compiled = marshal.load(f)
+                module = types.ModuleType("__main__")
+                module.__file__ = req["script"]
+                module.__cached__ = None
+                sys.modules["__main__"] = module
+                namespace = module.__dict__
+                exec(compiled, namespace)
+            else:
+                namespace = runpy.run_path(req["script"], run_name="__main__")
+        except SystemExit as e:
+            if e.code is None:
+                code = 0
+            elif isinstance(e.code, int):
+                code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        try:
+            # como al cerrar el intérprete: primero atexit, luego liberar el
+            # módulo para que corran los __del__ pendientes
+            atexit._run_exitfuncs()
+            namespace.clear()
+            gc.collect()
+        except BaseException:
+            pass
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except BaseException:
+                pass
+        os._exit(code)
+
+for line in ctl_in:
+    req = json.loads(line)
+    pid = os.fork()
+    if pid == 0:
+        _child(req)
+    ctl_out.write(json.dumps({"pid": pid}) + "\n")
+    ctl_out.flush()
+    _, status, ru = os.wait4(pid, 0)
+    ctl_out.write(json.dumps({"rc": os.waitstatus_to_exitcode(status), "utime": ru.ru_utime,
+                              "stime": ru.ru_stime, "maxrss": ru.ru_maxrss}) + "\n")
+    ctl_out.flush()
+"""
+
+
+class _WarmWorker:
+    """Un proceso cigoto y su canal de control (una ejecución a la vez)."""
+    def __init__(self, python_cmd: str, preload: Tuple[str, ...]) -> None:
+        self.proc = subprocess.Popen(
+            [python_cmd, "-c", _WARM_ZYGOTE_CODE, *preload],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+
+    def _request(self, req: Dict[str, str]) -> None:
+        assert self.proc.stdin is not None
+        self.proc.stdin.write(json.dumps(req) + "\n")
+        self.proc.stdin.flush()
+
+    def _reply(self) -> Dict[str, int]:
+        assert self.proc.stdout is not None
+        line = self.proc.stdout.readline()
+        if not line:
+            raise RuntimeError("el intérprete precalentado terminó inesperadamente")
+        return json.loads(line)
+
+    def run(self, script_path: str, stdin_text: str, timeout: Optional[float],
+            code_path: Optional[str] = None) -> RunResult:
+        with tempfile.TemporaryDirectory(prefix="dashboard-warm-") as tmp:
+            req = {
+                "script": script_path,
+                "code": code_path or "",
+                "cwd": os.path.dirname(script_path),
+                "stdin": os.path.join(tmp, "stdin"),
+                "stdout": os.path.join(tmp, "stdout"),
+                "stderr": os.path.join(tmp, "stderr"),
+            }
+            with open(req["stdin"], "w", encoding="utf-8") as f:
+                f.write(stdin_text)
+            start = time.perf_counter()
+            self._request(req)
+            pid = self._reply()["pid"]
+
+            expired = threading.Event()
+
+            def kill() -> None:
+                expired.set()
+                try:
+                    os.killpg(pid, signal.SIGKILL)
+                except OSError:
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except OSError:
+                        pass
+
+            timer = threading.Timer(timeout, kill) if timeout else None
+            if timer is not None:
+                timer.daemon = True
+                timer.start()
+            try:
+                reply = self._reply()
+            finally:
+                if timer is not None:
+                    timer.cancel()
+            wall = time.perf_counter() - start
+            out = read_text_file(req["stdout"]) or ""
+            err = read_text_file(req["stderr"]) or ""
+        usage = dict(user_time=reply.get("utime", 0.0), system_time=reply.get("stime", 0.0),
+                     max_rss_kb=rss_to_kb(reply.get("maxrss", 0)))
+        if expired.is_set():
+            return RunResult(script_path, None, out, err, wall, timed_out=True, **usage)
+        return RunResult(script_path, reply["rc"], out, err, wall, **usage)
+
+    def close(self) -> None:
+        try:
+            if self.proc.stdin is not None:
+                self.proc.stdin.close()
+            self.proc.wait(timeout=2)
+        except Exception:
+            self.proc.kill()
+
+
+class WarmInterpreterPool:
+    """
+    Motor de ejecución opcional con intérpretes precalentados.
+
+    Mantiene `size` procesos cigoto que ya arrancaron Python e importaron
+    PRELOAD. Cada script corre en un hijo nuevo creado con fork() desde un
+    cigoto, así que queda aislado como con un proceso nuevo, pero el
+    arranque cuesta solo el fork. Solo existe en sistemas con fork().
+
+    Diferencia con "python script.py": la semilla del hash de str y bytes
+    se elige al arrancar el intérprete, así que todos los hijos de un mismo
+    cigoto la comparten y no se puede cambiar después. El orden de un set o
+    de un dict armado por hash de cadenas se repite entre ejecuciones
+    precalentadas, mientras que en frío cambia cada vez. `random` sí se
+    vuelve a sembrar en cada fork (lo hace el propio módulo).
+    """
+    PRELOAD = ("collections", "dataclasses", "datetime", "decimal", "json",
+               "math", "random", "re", "typing")
+
+    def __init__(self, python_cmd: str, size: int = 2, preload: Tuple[str, ...] = PRELOAD) -> None:
+        self.python_cmd = python_cmd
+        self.preload = preload
+        self._idle: "queue.Queue[_WarmWorker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._alive = 0
+        for _ in range(max(1, size)):
+            self._idle.put(_WarmWorker(python_cmd, preload))
+            self._alive += 1
+
+    @staticmethod
+    def available() -> bool:
+        return os.name == "posix" and hasattr(os, "fork")
+
+    def run_captured(self, script_path: str, stdin_text: str = "",
+                     timeout: Optional[float] = None, code_path: Optional[str] = None) -> RunResult:
+        """`code_path`: .pyc de BytecodeCache para no compilar el fuente en el hijo."""
+        while True:
+            with self._lock:
+                if not self._alive:
+                    raise RuntimeError("no quedan intérpretes precalentados")
+            try:
+                worker = self._idle.get(timeout=0.5)
+                break
+            except queue.Empty:
+                continue  # volver a mirar si queda alguno vivo
+        try:
+            result = worker.run(os.path.abspath(script_path), stdin_text, timeout, code_path)
+        except (OSError, ValueError, RuntimeError):
+            # cigoto caído: se reemplaza y el error sube para usar el modo normal
+            worker.close()
+            try:
+                worker = _WarmWorker(self.python_cmd, self.preload)
+            except (OSError, ValueError):
+                # sin reemplazo: el cerrado no vuelve al grupo, que queda con uno menos
+                with self._lock:
+                    self._alive -= 1
+                raise
+            self._idle.put(worker)
+            raise
+        except BaseException:
+            self._idle.put(worker)
+            raise
+        self._idle.put(worker)
+        return result
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class ScriptRunner:
+    """
+    Maneja la visualización y ejecución de scripts.
+    Con `warm_pool_size` > 0 las ejecuciones capturadas usan intérpretes
+    precalentados (WarmInterpreterPool) cuando el sistema lo permite.
+    Con `cache`, una ejecución capturada de un script sin cambios (y con la
+    misma entrada) devuelve el resultado guardado al instante.
+    Con `metrics`, cada ejecución (capturada o en terminal) deja su tiempo,
+    CPU y memoria en un RunMetricsStore. Las ejecuciones capturadas sin
+    precalentar se crean desde un ProcessSpawner, así su consumo es solo
+    el del script.
+    Con `bytecode`, las ejecuciones capturadas usan el código ya compilado
+    del script (BytecodeCache) en vez de compilarlo en cada arranque.
+    """
+    def __init__(self, warm_pool_size: int = 0, cache: Optional[RunResultCache] = None,
+                 metrics: Optional["RunMetricsStore"] = None,
+                 bytecode: Optional[BytecodeCache] = None) -> None:
+        self.python_cmd = choose_python_interpreter()
+        self.cache = cache
+        self.metrics = metrics
+        self.bytecode = bytecode
+        self.viewer = CodeViewer()
+        self.spawner: Optional[ProcessSpawner] = None
+        self._spawner_lock = threading.Lock()
+        self.warm_pool: Optional[WarmInterpreterPool] = None
+        if warm_pool_size > 0 and WarmInterpreterPool.available():
+            self.warm_pool = WarmInterpreterPool(self.python_cmd, warm_pool_size)
+
+    def close(self) -> None:
+        if self.warm_pool is not None:
+            self.warm_pool.close()
+            self.warm_pool = None
+        if self.spawner is not None:
+            self.spawner.close()
+            self.spawner = None
+
+    def _get_spawner(self) -> Optional[ProcessSpawner]:
+        """El lanzador de procesos (se crea al primer uso y se reemplaza si terminó)."""
+        if not ProcessSpawner.available():
+            return None
+        with self._spawner_lock:
+            if self.spawner is None or self.spawner.closed:
+                if self.spawner is not None:
+                    self.spawner.close()
+                try:
+                    self.spawner = ProcessSpawner(self.python_cmd)
+                except OSError:
+                    self.spawner = None
+            return self.spawner
+
+    def show_code(self, script_path: str) -> None:
+        print(f"\n--- Código: {os.path.basename(script_path)} ---\n")
+        self.viewer.show(script_path)
+
+    def launch_command(self, abs_path: str) -> List[str]:
+        """python script.py; con métricas, a través del envoltorio que registra la ejecución."""
+        if self.metrics is not None:
+            recorder = self.metrics.recorder_path()
+            if recorder is not None:
+                return [self.python_cmd, recorder, self.metrics.record_file(abs_path), abs_path]
+        return [self.python_cmd, abs_path]
+
+    def run(self, script_path: str) -> None:
+        """
+        Ejecuta el script en un proceso separado.
+        - En Windows abre una consola nueva con cmd /k (deja la ventana abierta).
+        - En Linux/mac intenta ejecutar en terminal si existe; si no, ejecuta en segundo plano.
+        """
+        try:
+            abs_path = os.path.abspath(script_path)
+            cmd = self.launch_command(abs_path)
+
+            if os.name == "nt":
+                # Abre una terminal y deja abierta para ver salida
+                subprocess.Popen(["cmd", "/k", *cmd])
+                return
+
+            # macOS / Linux: intentar abrir terminal
+            # 1) GNOME Terminal
+            for term_cmd in [
+                ["gnome-terminal", "--", *cmd],
+                ["konsole", "-e", *cmd],
+                ["xterm", "-hold", "-e", *cmd],
+                ["mate-terminal", "-e", shlex.join(cmd)],
+            ]:
+                try:
+                    subprocess.Popen(term_cmd)
+                    return
+                except FileNotFoundError:
+                    continue
+                except Exception:
+                    continue
+
+            # fallback: ejecutar sin terminal nueva
+            subprocess.Popen(cmd)
+
+        except Exception as e:
+            print(f"Ocurrió un error al ejecutar el script: {e}")
+
+    def run_captured(self, script_path: str, stdin_text: str = "",
+                     timeout: Optional[float] = None, use_cache: bool = True) -> RunResult:
+        """
+        Ejecuta el script y espera a que termine, capturando stdout/stderr.
+        `stdin_text` se entrega como entrada estándar (para scripts con input()).
+        Si pasa `timeout` segundos, el proceso se termina.
+        Si hay caché y `use_cache`, un resultado guardado se devuelve con
+        from_cache=True sin ejecutar nada (y no se registra en las métricas).
+        """
+        abs_path = os.path.abspath(script_path)
+        key = None
+        if self.cache is not None and use_cache:
+            key = self.cache.make_key(abs_path, stdin_text, self.python_cmd)
+            cached = self.cache.get(key) if key else None
+            if cached is not None:
+                return cached
+
+        result = None
+        started = time.time()
+        flags = 0
+        if self.warm_pool is not None:
+            code_path = self.bytecode.path_for(abs_path) if self.bytecode is not None else None
+            try:
+                result = self.warm_pool.run_captured(abs_path, stdin_text, timeout, code_path)
+                flags = RunMetricsStore.WARM
+            except (OSError, ValueError, RuntimeError):
+                pass  # seguir con un proceso normal
+        if result is None:
+            result = self.run_cold(abs_path, stdin_text, timeout)
+        if key is not None:
+            self.cache.put(key, result)  # type: ignore[union-attr]
+        if self.metrics is not None:
+            self.metrics.record(result, started, flags)
+        return result
+
+    def run_cold(self, script_path: str, stdin_text: str = "",
+                 timeout: Optional[float] = None) -> RunResult:
+        """Ejecución capturada con un intérprete nuevo (python script.py)."""
+        abs_path = os.path.abspath(script_path)
+        env = dict(os.environ, PYTHONIOENCODING="utf-8", PYTHONUNBUFFERED="1")
+        if self.bytecode is not None:
+            cmd = self.bytecode.argv(self.python_cmd, abs_path)
+        else:
+            cmd = [self.python_cmd, abs_path]
+        args = (cmd, stdin_text.encode("utf-8"), timeout, os.path.dirname(abs_path), env)
+        start = time.perf_counter()
+        try:
+            spawner = self._get_spawner()
+            try:
+                if spawner is None:
+                    raise RuntimeError("sin lanzador de procesos")
+                rc, out, err, timed_out, (user, system, rss) = spawner.run(*args)
+            except RuntimeError:
+                rc, out, err, timed_out, (user, system, rss) = run_with_usage(*args)
+        except Exception as e:
+            return RunResult(abs_path, None, "", f"No se pudo ejecutar: {e}", time.perf_counter() - start)
+        return RunResult(abs_path, rc, _to_text(out), _to_text(err), time.perf_counter() - start,
+                         timed_out=timed_out, user_time=user, system_time=system, max_rss_kb=rss)
+
+
+class BatchRunner:
+    """
+    Ejecuta muchos scripts (calificación, pruebas de regresión).
+
+    Cada script corre en su propio proceso con salida capturada; a lo más
+    `max_workers` procesos corren a la vez (los hilos del grupo solo esperan
+    a su proceso hijo). La entrada estándar de cada script es, en orden:
+    el archivo "<script>.stdin" si existe junto al script, o `default_stdin`.
+    """
+    def __init__(self, runner: ScriptRunner, max_workers: Optional[int] = None,
+                 timeout: Optional[float] = 30.0, default_stdin: str = "",
+                 use_cache: bool = True) -> None:
+        self.runner = runner
+        self.max_workers = max(1, max_workers or os.cpu_count() or 2)
+        self.timeout = timeout
+        self.default_stdin = default_stdin
+        self.use_cache = use_cache
+
+    def stdin_for(self, script_path: str) -> str:
+        sidecar = read_text_file(script_path + ".stdin")
+        return sidecar if sidecar is not None else self.default_stdin
+
+    def run_one(self, script_path: str) -> RunResult:
+        return self.runner.run_captured(script_path, self.stdin_for(script_path), self.timeout, self.use_cache)
+
+    def run_many(self, script_paths: List[str],
+                 on_result: Optional[Callable[[int, RunResult], None]] = None) -> List[RunResult]:
+        """
+        Ejecuta todos los scripts y devuelve los resultados en el mismo orden.
+        `on_result(i, resultado)` se llama apenas termina cada uno.
+        """
+        results: List[Optional[RunResult]] = [None] * len(script_paths)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self.run_one, p): i for i, p in enumerate(script_paths)}
+            for fut in as_completed(futures):
+                i = futures[fut]
+                result = fut.result()
+                results[i] = result
+                if on_result is not None:
+                    on_result(i, result)
+        return [r for r in results if r is not None]
+
+
+class PreviewTimeout(BaseException):
+    """Se lanza dentro del script en vista previa cuando se acaba el tiempo."""
+
+
+class _ThreadStream:
+    """
+    Reemplazo de sys.stdout/stderr durante una vista previa: lo que escribe
+    el hilo de la vista previa va a `captured`, lo de los demás hilos del
+    Dashboard sigue yendo a `original`.
+    """
+    def __init__(self, captured: io.StringIO, original: object, thread_id: int) -> None:
+        self._captured = captured
+        self._original = original
+        self._thread_id = thread_id
+
+    def _target(self) -> object:
+        return self._captured if threading.get_ident() == self._thread_id else self._original
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)  # type: ignore[attr-defined]
+
+    def flush(self) -> None:
+        target = self._target()
+        if target is not None:
+            target.flush()  # type: ignore[attr-defined]
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._target(), name)
+
+
+class InProcessRunner:
+    """
+    Vista previa rápida: ejecuta el script DENTRO del Dashboard con runpy.
+
+    El script corre como __main__ en un espacio de nombres nuevo, con
+    sys.argv, sys.path[0] y la carpeta actual del script, y con stdin,
+    stdout y stderr redirigidos a memoria (solo lo que escribe el hilo de la
+    vista previa; los demás hilos siguen escribiendo en la consola). Al
+    terminar se restaura todo y se quitan de sys.modules los módulos nuevos
+    cuyo archivo está en la carpeta del script, así la próxima vista previa
+    vuelve a leerlos. Los de la biblioteca estándar o instalados quedan
+    cargados: sacarlos dejaría al Dashboard con módulos huérfanos y las
+    extensiones en C no se pueden volver a importar sin riesgo. Cuesta
+    milisegundos en vez de un proceso.
+
+    Límites (para aislar de verdad, usar ScriptRunner):
+    - no es una caja de arena: el script puede tocar archivos y cualquier
+      estado global del proceso (variables de módulos ya cargados, señales,
+      os.environ) y esos cambios quedan;
+    - la carpeta actual es de todo el proceso: mientras corre la vista
+      previa, los demás hilos también la ven cambiada;
+    - los hilos que el script arranca no se pueden detener: si siguen vivos
+      al terminar se avisa en stderr y quedan corriendo;
+    - solo corre una vista previa a la vez.
+
+    El tiempo límite lo corta una señal en el hilo principal (SIGALRM, o un
+    hilo vigía con _thread.interrupt_main donde no existe), así el script
+    corre a velocidad normal y hasta un time.sleep se interrumpe. Las
+    señales solo llegan al hilo principal: llamado desde otro hilo con
+    tiempo límite, el script se ejecuta en un proceso con `fallback`.
+    """
+    _lock = threading.Lock()
+
+    def __init__(self, timeout: Optional[float] = 5.0, fallback: Optional["ScriptRunner"] = None) -> None:
+        self.timeout = timeout
+        self.fallback = fallback
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _deadline(seconds: float) -> Iterator[None]:
+        """Lanza PreviewTimeout en el hilo principal cuando pasan `seconds`."""
+        if hasattr(signal, "setitimer"):
+            def on_alarm(signum, frame):  # type: ignore[no-untyped-def]
+                raise PreviewTimeout()
+            previous = signal.signal(signal.SIGALRM, on_alarm)
+            signal.setitimer(signal.ITIMER_REAL, seconds)
+            try:
+                yield
+            finally:
+                # anidado: si la alarma llega aquí, igual se restaura el manejador
+                try:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+                finally:
+                    signal.signal(signal.SIGALRM, previous)
+            return
+        # sin SIGALRM (Windows): un hilo vigía simula un Ctrl+C; el
+        # manejador distingue el del vigía de uno de verdad
+        fired = threading.Event()
+
+        def on_interrupt(signum, frame):  # type: ignore[no-untyped-def]
+            if fired.is_set():
+                raise PreviewTimeout()
+            raise KeyboardInterrupt
+
+        def watchdog() -> None:
+            fired.set()
+            _thread.interrupt_main()
+
+        previous = signal.signal(signal.SIGINT, on_interrupt)
+        timer = threading.Timer(seconds, watchdog)
+        timer.daemon = True
+        timer.start()
+        try:
+            yield
+        finally:
+            try:
+                timer.cancel()
+                timer.join()
+            finally:
+                signal.signal(signal.SIGINT, previous)
+
+    @staticmethod
+    def _run_exit_funcs(exit_funcs: List[Tuple[Callable, tuple, dict]]) -> None:
+        while exit_funcs:
+            func, args, kwargs = exit_funcs.pop()
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                traceback.print_exc()
+
+    @staticmethod
+    def _forget_modules(names: Set[str], script_dir: str) -> None:
+        """Quita de sys.modules los módulos de `names` cuyo archivo está bajo script_dir."""
+        prefix = os.path.join(os.path.normcase(script_dir), "")
+        for name in names:
+            module = sys.modules.get(name)
+            path = getattr(module, "__file__", None)
+            if isinstance(path, str) and os.path.normcase(os.path.abspath(path)).startswith(prefix):
+                sys.modules.pop(name, None)
+
+    def run(self, script_path: str, stdin_text: str = "") -> RunResult:
+        if self.timeout and threading.current_thread() is not threading.main_thread():
+            if self.fallback is None:
+                self.fallback = ScriptRunner()
+            return self.fallback.run_captured(script_path, stdin_text, timeout=self.timeout)
+        abs_path = os.path.abspath(script_path)
+        script_dir = os.path.dirname(abs_path)
+        out, err = io.StringIO(), io.StringIO()
+        returncode: Optional[int] = 0
+        timed_out = False
+
+        with self._lock:
+            saved_argv = sys.argv[:]
+            saved_path = sys.path[:]
+            saved_modules = set(sys.modules)
+            saved_threads = set(threading.enumerate())
+            saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+            saved_cwd = os.getcwd()
+            saved_register = atexit.register
+            exit_funcs: List[Tuple[Callable, tuple, dict]] = []
+
+            def register(func: Callable, *args: object, **kwargs: object) -> Callable:
+                exit_funcs.append((func, args, kwargs))
+                return func
+
+            start = time.perf_counter()
+            try:
+                # los atexit del script corren al final de la vista previa,
+                # no cuando se cierre el Dashboard
+                atexit.register = register  # type: ignore[assignment]
+                sys.argv = [abs_path]
+                sys.path.insert(0, script_dir)
+                sys.stdin = io.StringIO(stdin_text)
+                me = threading.get_ident()
+                sys.stdout = _ThreadStream(out, saved_streams[1], me)  # type: ignore[assignment]
+                sys.stderr = _ThreadStream(err, saved_streams[2], me)  # type: ignore[assignment]
+                os.chdir(script_dir)
+                namespace: Dict[str, object] = {}
+                try:
+                    # dentro del try: una alarma que llega justo al salir
+                    # también cuenta como tiempo agotado
+                    with self._deadline(self.timeout) if self.timeout else contextlib.nullcontext():
+                        namespace = runpy.run_path(abs_path, run_name="__main__")
+                except SystemExit as e:
+                    if e.code is None or isinstance(e.code, int):
+                        returncode = e.code or 0
+                    else:
+                        print(e.code, file=sys.stderr)
+                        returncode = 1
+                except PreviewTimeout:
+                    timed_out = True
+                    returncode = None
+                except BaseException:
+                    traceback.print_exc()
+                    returncode = 1
+                # como al cerrar el intérprete: atexit y luego liberar el módulo
+                # (los __del__ escriben mientras la salida sigue redirigida)
+                self._run_exit_funcs(exit_funcs)
+                namespace.clear()
+                gc.collect()
+                left = [t for t in threading.enumerate() if t not in saved_threads and t.is_alive()]
+                if left:
+                    print(f"[vista previa] {len(left)} hilo(s) del script siguen corriendo: "
+                          + ", ".join(t.name for t in left), file=sys.stderr)
+            finally:
+                atexit.register = saved_register  # type: ignore[assignment]
+                sys.stdin, sys.stdout, sys.stderr = saved_streams
+                sys.argv = saved_argv
+                sys.path[:] = saved_path
+                self._forget_modules(set(sys.modules) - saved_modules, script_dir)
+                try:
+                    os.chdir(saved_cwd)
+                except OSError:
+                    pass
+            wall = time.perf_counter() - start
+
+        return RunResult(abs_path, returncode, out.getvalue(), err.getvalue(), wall, timed_out=timed_out)
+
+
+def format_run_summary(results: List[RunResult], base_path: str) -> str:
+    """Tabla resumen: estado, tiempo y script; al final los totales."""
+    lines = [f"{'#':>4}  {'Estado':<12} {'Tiempo (s)':>10}  {'Origen':<6} Script", "-" * 60]
+    for i, r in enumerate(results, start=1):
+        rel = os.path.relpath(r.script_path, base_path)
+        origin = "caché" if r.from_cache else ""
+        lines.append(f"{i:>4}  {r.status_label():<12} {r.wall_time:>10.3f}  {origin:<6} {rel}")
+    ok = sum(1 for r in results if r.ok)
+    timeouts = sum(1 for r in results if r.timed_out)
+    cancelled = sum(1 for r in results if r.cancelled)
+    cached = sum(1 for r in results if r.from_cache)
+    lines.append("-" * 60)
+    lines.append(f"OK: {ok}   Con error: {len(results) - ok - timeouts - cancelled}   Sin terminar (tiempo): {timeouts}"
+                 + (f"   Cancelados: {cancelled}" if cancelled else "")
+                 + f"   Tiempo sumado: {sum(r.wall_time for r in results):.2f} s")
+    if cached:
+        lines.append(f"{cached} resultado(s) salieron de la caché (script sin cambios): "
+                     "el tiempo mostrado es el de la ejecución original.")
+    return "\n".join(lines)
+
+
+# --------------------------- Ejecución en Vivo ---------------------------
+
+@dataclass
+class LiveLine:
+    """Una línea de la salida en vivo. stream: "out", "err" o "fin" (el script terminó)."""
+    index: int
+    stream: str
+    text: str
+
+
+class LiveSession:
+    """
+    Una tanda de scripts corriendo a la vez en el LiveRunner.
+    El hilo del menú saca líneas con lines() y puede cancelar con cancel();
+    `done` se activa cuando todos terminaron y results ya está completo.
+    """
+    def __init__(self, script_paths: List[str], stdins: List[str], timeout: Optional[float],
+                 loop: asyncio.AbstractEventLoop, queue_size: int) -> None:
+        self.script_paths = script_paths
+        self.stdins = stdins
+        self.timeout = timeout
+        self.results: List[Optional[RunResult]] = [None] * len(script_paths)
+        self.done = threading.Event()
+        self._loop = loop
+        # acotada: si el menú no alcanza a mostrar, los scripts esperan (backpressure)
+        self._queue: "asyncio.Queue[LiveLine]" = asyncio.Queue(maxsize=queue_size)
+        self._procs: Dict[int, asyncio.subprocess.Process] = {}
+        self._cancelled: Set[int] = set()
+
+    def lines(self, max_lines: int = 200, timeout: float = 0.05) -> List[LiveLine]:
+        """Hasta `max_lines` líneas nuevas (espera a lo más `timeout` por la primera)."""
+        future = asyncio.run_coroutine_threadsafe(self._take(max_lines, timeout), self._loop)
+        return future.result()
+
+    async def _take(self, max_lines: int, timeout: float) -> List[LiveLine]:
+        taken: List[LiveLine] = []
+        try:
+            taken.append(await asyncio.wait_for(self._queue.get(), timeout))
+        except asyncio.TimeoutError:
+            return taken
+        while len(taken) < max_lines:
+            try:
+                taken.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return taken
+
+    @property
+    def finished(self) -> bool:
+        """Todos terminaron y ya se entregó cada línea."""
+        return self.done.is_set() and self._queue.empty()
+
+    def cancel(self, index: Optional[int] = None) -> None:
+        """Cancela un script (o todos con None) al instante: se mata su proceso."""
+        self._loop.call_soon_threadsafe(self._cancel, index)
+
+    def _cancel(self, index: Optional[int]) -> None:
+        targets = range(len(self.script_paths)) if index is None else [index]
+        for i in targets:
+            self._cancelled.add(i)
+            proc = self._procs.get(i)
+            if proc is not None:
+                LiveRunner.kill(proc)
+
+    def is_cancelled(self, index: int) -> bool:
+        return index in self._cancelled
+
+
+class LiveRunner:
+    """
+    Ejecuta varios scripts a la vez y entrega su salida línea por línea,
+    mientras corren, para mostrarla en un panel con un prefijo por script.
+
+    Un bucle de asyncio vive en un hilo propio: cada script es un proceso
+    hijo cuyos stdout y stderr se leen sin bloquear, así el menú sigue
+    atendiendo al teclado. A lo más `max_parallel` procesos corren a la vez.
+    Las líneas pasan por una cola de `queue_size`; si se llena, se deja de
+    leer la tubería y el propio script queda esperando al escribir.
+    De cada script se guardan las últimas `keep_lines` líneas para el
+    resumen final. Usa el código precompilado y registra las métricas del
+    ScriptRunner, si los tiene.
+    """
+    READ_CHUNK = 64 * 1024
+
+    def __init__(self, runner: ScriptRunner, max_parallel: int = 4, queue_size: int = 1000,
+                 keep_lines: int = 2000, max_line: int = 4096) -> None:
+        self.runner = runner
+        self.max_parallel = max(1, max_parallel)
+        self.queue_size = queue_size
+        self.keep_lines = keep_lines
+        self.max_line = max_line
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="LiveRunner", daemon=True)
+            self._thread.start()
+        return self._loop
+
+    def start(self, script_paths: List[str], stdins: Optional[List[str]] = None,
+              timeout: Optional[float] = None) -> LiveSession:
+        loop = self._ensure_loop()
+        paths = [os.path.abspath(p) for p in script_paths]
+
+        async def create() -> LiveSession:
+            # la cola de asyncio se crea dentro de su propio bucle
+            return LiveSession(paths, stdins or [""] * len(paths), timeout, loop, self.queue_size)
+
+        session = asyncio.run_coroutine_threadsafe(create(), loop).result()
+        asyncio.run_coroutine_threadsafe(self._run_session(session), loop)
+        return session
+
+    def close(self) -> None:
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        self._loop = None
+
+    @staticmethod
+    def kill(proc: "asyncio.subprocess.Process") -> None:
+        try:
+            if os.name == "posix":
+                os.killpg(proc.pid, signal.SIGKILL)  # también sus hijos
+            else:
+                proc.kill()
+        except (OSError, ProcessLookupError):
+            pass
+
+    async def _run_session(self, session: LiveSession) -> None:
+        slots = asyncio.Semaphore(self.max_parallel)
+        try:
+            await asyncio.gather(*(self._run_one(session, i, slots) for i in range(len(session.script_paths))))
+        finally:
+            session.done.set()
+
+    async def _run_one(self, session: LiveSession, index: int, slots: asyncio.Semaphore) -> None:
+        path = session.script_paths[index]
+        async with slots:
+            if session.is_cancelled(index):
+                session.results[index] = RunResult(path, None, "", "", 0.0, cancelled=True)
+                await session._queue.put(LiveLine(index, "fin", "CANCELADO"))
+                return
+            result = await self._execute(session, index, path)
+        session.results[index] = result
+        if self.runner.metrics is not None and not result.cancelled:
+            # record() escribe en disco: en un hilo aparte, para no frenar
+            # la salida en vivo de los demás scripts
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.runner.metrics.record, result, time.time() - result.wall_time)
+        await session._queue.put(LiveLine(index, "fin", f"{result.status_label()} ({result.wall_time:.2f} s)"))
+
+    async def _execute(self, session: LiveSession, index: int, path: str) -> RunResult:
+        if self.runner.bytecode is not None:
+            # fuera del bucle (lee y calcula el hash del script) y sin compilar
+            # aquí: compile() retiene el GIL y frenaría a las demás sesiones.
+            # Un script aún sin .pyc arranca desde el fuente; lo compila
+            # precompile(), que corre en procesos aparte.
+            cmd = await asyncio.get_running_loop().run_in_executor(
+                None, self.runner.bytecode.argv, self.runner.python_cmd, path, False)
+        else:
+            cmd = [self.runner.python_cmd, path]
+        env = dict(os.environ, PYTHONIOENCODING="utf-8", PYTHONUNBUFFERED="1")
+        start = time.perf_counter()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE, cwd=os.path.dirname(path), env=env,
+                start_new_session=(os.name == "posix"))
+        except OSError as e:
+            return RunResult(path, None, "", f"No se pudo ejecutar: {e}", time.perf_counter() - start)
+        session._procs[index] = proc
+        if session.is_cancelled(index):
+            self.kill(proc)  # se canceló mientras arrancaba
+        kept: Dict[str, "deque[str]"] = {
+            "out": deque(maxlen=self.keep_lines),
+            "err": deque(maxlen=self.keep_lines),
+        }
+        feeder = asyncio.ensure_future(self._feed(proc, session.stdins[index]))
+        work = asyncio.gather(self._pump(session, index, "out", proc.stdout, kept["out"]),
+                              self._pump(session, index, "err", proc.stderr, kept["err"]),
+                              proc.wait())
+        timed_out = False
+        try:
+            await asyncio.wait_for(asyncio.shield(work), session.timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            self.kill(proc)
+            await work
+        returncode = proc.returncode
+        feeder.cancel()
+        session._procs.pop(index, None)
+        wall = time.perf_counter() - start
+        cancelled = session.is_cancelled(index) and not timed_out
+        out, err = ("\n".join(kept[name]) + ("\n" if kept[name] else "") for name in ("out", "err"))
+        return RunResult(path, None if (timed_out or cancelled) else returncode, out, err, wall,
+                         timed_out=timed_out, cancelled=cancelled)
+
+    @staticmethod
+    async def _feed(proc: "asyncio.subprocess.Process", stdin_text: str) -> None:
+        try:
+            if stdin_text:
+                proc.stdin.write(stdin_text.encode("utf-8"))  # type: ignore[union-attr]
+                await proc.stdin.drain()  # type: ignore[union-attr]
+            proc.stdin.close()  # type: ignore[union-attr]
+        except (OSError, ConnectionError):
+            pass  # el script terminó sin leer toda la entrada
+
+    async def _pump(self, session: LiveSession, index: int, name: str,
+                    stream: "asyncio.StreamReader", kept: "deque[str]") -> None:
+        """Lee la tubería por bloques y entrega línea por línea (las muy largas, en trozos)."""
+        pending = b""
+        while True:
+            chunk = await stream.read(self.READ_CHUNK)
+            if not chunk:
+                break
+            pending += chunk
+            *complete, pending = pending.split(b"\n")
+            while len(pending) > self.max_line:
+                complete.append(pending[:self.max_line])
+                pending = pending[self.max_line:]
+            for raw in complete:
+                text = raw.rstrip(b"\r").decode("utf-8", errors="replace")
+                kept.append(text)
+                await session._queue.put(LiveLine(index, name, text))
+        if pending:
+            text = pending.decode("utf-8", errors="replace")
+            kept.append(text)
+            await session._queue.put(LiveLine(index, name, text))
+
+
+class LineInput:
+    """Lee líneas del teclado sin bloquear (para recibir órdenes mientras se muestra salida)."""
+    def __init__(self) -> None:
+        self._chars: List[str] = []
+        # bytes leídos del descriptor que aún no forman una línea completa
+        self._pending = b""
+        # con la entrada redirigida no hay nadie tecleando órdenes: no se
+        # consumen líneas que son para los menús siguientes
+        try:
+            self.closed = not sys.stdin.isatty()
+        except (AttributeError, ValueError):
+            self.closed = True
+
+    def poll(self, timeout: float) -> Optional[str]:
+        """Una línea escrita por el usuario, o None si no hubo ninguna en `timeout` segundos."""
+        if self.closed:
+            time.sleep(timeout)
+            return None
+        if os.name == "nt":
+            import msvcrt
+            deadline = time.monotonic() + timeout
+            while True:
+                while msvcrt.kbhit():  # type: ignore[attr-defined]
+                    ch = msvcrt.getwche()  # type: ignore[attr-defined]
+                    if ch in "\r\n":
+                        line, self._chars = "".join(self._chars), []
+                        print()
+                        return line
+                    if ch == "\b":
+                        self._chars = self._chars[:-1]
+                    else:
+                        self._chars.append(ch)
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.02)
+        # Se lee el descriptor con os.read, no con sys.stdin.readline(): si
+        # llegan dos órdenes juntas, la segunda quedaría en el búfer de
+        # sys.stdin, donde select() no la ve.
+        if b"\n" not in self._pending:
+            try:
+                fd = sys.stdin.fileno()
+                ready = select.select([fd], [], [], timeout)[0]
+                data = os.read(fd, 4096) if ready else None
+            except (OSError, ValueError):
+                return None
+            if data is None:
+                return None
+            if not data:
+                self.closed = True  # fin de la entrada: no habrá más órdenes
+                line, self._pending = self._pending, b""
+                return self._decode(line) if line else None
+            self._pending += data
+            if b"\n" not in self._pending:
+                return None
+        line, _, self._pending = self._pending.partition(b"\n")
+        return self._decode(line)
+
+    @staticmethod
+    def _decode(line: bytes) -> str:
+        return line.decode(getattr(sys.stdin, "encoding", None) or "utf-8", "replace").rstrip("\r")
+
+# --------------------------- Métricas de Ejecución ---------------------------
+
+# Programa que envuelve un script abierto en una terminal: lo ejecuta como
+# hijo, espera con os.wait4 para medir su consumo y agrega un registro al
+# historial del script antes de salir con el mismo código.
+_RUN_RECORDER_CODE = r"""
+import os, signal, struct, subprocess, sys, time
+RECORD = struct.Struct({fmt!r})
+record_file, script = sys.argv[1], sys.argv[2]
+started = time.time()
+start = time.perf_counter()
+proc = subprocess.Popen([sys.executable, script])
+signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C es para el script
+if hasattr(os, "wait4"):
+    _, status, ru = os.wait4(proc.pid, 0)
+    proc.returncode = rc = os.waitstatus_to_exitcode(status)
+    rss = ru.ru_maxrss // 1024 if sys.platform == "darwin" else ru.ru_maxrss
+    usage = (ru.ru_utime, ru.ru_stime, rss)
+else:
+    rc = proc.wait()
+    usage = (0.0, 0.0, 0)
+wall = time.perf_counter() - start
+try:
+    fd = os.open(record_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    os.write(fd, RECORD.pack(started, wall, usage[0], usage[1], min(usage[2], 0xFFFFFFFF),
+                             max(-32768, min(32767, rc)), {flags}))
+    os.close(fd)
+except OSError:
+    pass
+sys.exit(rc if rc >= 0 else 128 - rc)
+"""
+
+
+def tukey_fence(values: List[float]) -> float:
+    """
+    Límite de Tukey (Q3 + 1.5 * IQR): lo que pasa de ahí es atípico.
+    El IQR se toma como mínimo un 25 % de Q3, para no marcar simple ruido
+    (el arranque de Python varía unos milisegundos) cuando todos los
+    valores son casi iguales.
+    """
+    q1, q3 = percentile(values, 25), percentile(values, 75)
+    return q3 + 1.5 * max(q3 - q1, 0.25 * q3)
+
+
+@dataclass
+class RunSample:
+    """Una ejecución registrada (tiempos en segundos, memoria en KiB; 0 = desconocida)."""
+    started: float
+    wall_time: float
+    user_time: float
+    system_time: float
+    max_rss_kb: int
+    returncode: int
+    flags: int
+
+    @property
+    def timed_out(self) -> bool:
+        return bool(self.flags & RunMetricsStore.TIMED_OUT)
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+    @property
+    def cpu_time(self) -> float:
+        return self.user_time + self.system_time
+
+    def status_label(self) -> str:
+        if self.timed_out:
+            return "TIEMPO"
+        return "OK" if self.returncode == 0 else f"ERROR ({self.returncode})"
+
+    def origin_label(self) -> str:
+        if self.flags & RunMetricsStore.TERMINAL:
+            return "terminal"
+        if self.flags & RunMetricsStore.WARM:
+            return "precalentado"
+        return "capturada"
+
+
+@dataclass
+class ScriptTiming:
+    """Resumen del historial de un script para la tabla de tiempos."""
+    script_path: str
+    runs: int
+    failures: int
+    p50: float
+    p95: float
+    last: float
+    cpu_p50: float
+    max_rss_kb: int
+    slow: bool = False
+    outlier: bool = False
+
+    def flags_label(self) -> str:
+        return " ".join(label for label, on in (("LENTO", self.slow), ("ATÍPICA", self.outlier)) if on)
+
+
+class RunMetricsStore:
+    """
+    Serie de tiempo local de las ejecuciones de cada script.
+
+    Un archivo binario por script (<hash de la ruta>.bin) al que solo se le
+    agregan registros fijos de RECORD.size bytes: inicio, tiempo real, CPU de
+    usuario y de sistema, memoria máxima, código de salida y marcas
+    (TIMED_OUT, TERMINAL, WARM). scripts.json dice qué ruta es cada archivo.
+    Al pasar de 2 * max_records registros se compacta dejando los últimos
+    max_records. Las ejecuciones en terminal las registra el propio proceso
+    envoltorio (RECORDER_NAME), así que también cuentan aunque el Dashboard
+    no espere a que terminen.
+    """
+    RECORD = struct.Struct("<dfffIhB")
+    TIMED_OUT = 1
+    TERMINAL = 2
+    WARM = 4
+    RECORDER_NAME = "registrar_ejecucion.py"
+    MIN_RUNS_FOR_OUTLIER = 5
+
+    def __init__(self, metrics_dir: str, max_records: int = 1000) -> None:
+        self.metrics_dir = metrics_dir
+        self.max_records = max(1, max_records)
+        self._lock = threading.Lock()
+        # clave (hash de la ruta) -> ruta del script
+        self._paths: Dict[str, str] = {}
+        self._load()
+
+    @property
+    def _paths_file(self) -> str:
+        return os.path.join(self.metrics_dir, "scripts.json")
+
+    def _load(self) -> None:
+        content = read_text_file(self._paths_file)
+        if not content:
+            return
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return
+        if isinstance(data, dict):
+            self._paths = {str(k): str(v) for k, v in data.items()}
+
+    def _save_paths(self) -> None:
+        tmp = f"{self._paths_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.metrics_dir, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._paths, f, ensure_ascii=False)
+            os.replace(tmp, self._paths_file)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _key(script_path: str) -> str:
+        return hashlib.sha1(normalize_path(script_path).encode("utf-8")).hexdigest()[:16]
+
+    def record_file(self, script_path: str) -> str:
+        """Archivo de registros del script (lo anota en scripts.json si es nuevo)."""
+        key = self._key(script_path)
+        abs_path = os.path.abspath(script_path)
+        with self._lock:
+            if self._paths.get(key) != abs_path:
+                self._paths[key] = abs_path
+                self._save_paths()
+        return os.path.join(self.metrics_dir, key + ".bin")
+
+    def recorder_path(self) -> Optional[str]:
+        """Escribe (si hace falta) el envoltorio para terminales y devuelve su ruta."""
+        code = _RUN_RECORDER_CODE.format(fmt=self.RECORD.format, flags=self.TERMINAL)
+        path = os.path.join(self.metrics_dir, self.RECORDER_NAME)
+        if read_text_file(path) == code:
+            return path
+        try:
+            os.makedirs(self.metrics_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8", newline="\n") as f:
+                f.write(code)
+            os.replace(tmp, path)
+        except OSError:
+            return None
+        return path
+
+    def record(self, result: RunResult, started: float, flags: int = 0) -> None:
+        """Agrega una ejecución (las que salieron de la caché no se cuentan)."""
+        if result.from_cache:
+            return
+        if result.timed_out:
+            flags |= self.TIMED_OUT
+        rc = result.returncode if result.returncode is not None else -1
+        data = self.RECORD.pack(started, result.wall_time, result.user_time, result.system_time,
+                                max(0, min(result.max_rss_kb, 0xFFFFFFFF)), max(-32768, min(32767, rc)), flags)
+        path = self.record_file(result.script_path)
+        try:
+            os.makedirs(self.metrics_dir, exist_ok=True)
+            with self._lock:
+                fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+                try:
+                    os.write(fd, data)
+                    size = os.fstat(fd).st_size
+                finally:
+                    os.close(fd)
+                if size > 2 * self.max_records * self.RECORD.size:
+                    self._compact(path)
+        except OSError:
+            pass
+
+    def _compact(self, path: str) -> None:
+        with open(path, "rb") as f:
+            data = f.read()
+        usable = len(data) - len(data) % self.RECORD.size
+        keep = data[max(0, usable - self.max_records * self.RECORD.size):usable]
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(keep)
+        os.replace(tmp, path)
+
+    def _read(self, key: str) -> List[RunSample]:
+        try:
+            with open(os.path.join(self.metrics_dir, key + ".bin"), "rb") as f:
+                data = f.read()
+        except OSError:
+            return []
+        # un registro a medio escribir (corte de luz) se ignora
+        data = data[:len(data) - len(data) % self.RECORD.size]
+        return [RunSample(*row) for row in self.RECORD.iter_unpack(data)]
+
+    def samples(self, script_path: str) -> List[RunSample]:
+        """Ejecuciones registradas del script, de la más vieja a la más nueva."""
+        return sorted(self._read(self._key(script_path)), key=lambda s: s.started)
+
+    @staticmethod
+    def _timed(samples: List[RunSample]) -> List[RunSample]:
+        # en una terminal el tiempo real incluye lo que la persona tardó en
+        # escribir: si hay ejecuciones capturadas, solo se usan esas
+        captured = [s for s in samples if not s.flags & RunMetricsStore.TERMINAL]
+        return captured or samples
+
+    def summarize(self) -> List[ScriptTiming]:
+        """
+        p50/p95 de cada script que todavía existe, del más lento al más rápido.
+        LENTO: su p50 pasa el límite de Tukey de los p50 de todo el árbol.
+        ATÍPICA: la última ejecución pasa el límite de Tukey de las anteriores.
+        """
+        with self._lock:
+            paths = dict(self._paths)
+        timings = []
+        for key, script_path in paths.items():
+            samples = sorted(self._read(key), key=lambda s: s.started)
+            if not samples or not os.path.isfile(script_path):
+                continue
+            timed = self._timed(samples)
+            walls = [s.wall_time for s in timed]
+            timing = ScriptTiming(
+                script_path=script_path,
+                runs=len(samples),
+                failures=sum(1 for s in samples if not s.ok),
+                p50=percentile(walls, 50),
+                p95=percentile(walls, 95),
+                last=walls[-1],
+                cpu_p50=percentile([s.cpu_time for s in timed], 50),
+                max_rss_kb=max(s.max_rss_kb for s in samples),
+            )
+            if len(walls) > self.MIN_RUNS_FOR_OUTLIER:
+                timing.outlier = walls[-1] > tukey_fence(walls[:-1])
+            timings.append(timing)
+        if len(timings) >= 4:
+            fence = tukey_fence([t.p50 for t in timings])
+            for t in timings:
+                t.slow = t.p50 > fence
+        timings.sort(key=lambda t: t.p50, reverse=True)
+        return timings
+
+# --------------------------- Perfilado ---------------------------
+
+# Programa del proceso hijo: corre el script con cProfile y tracemalloc
+# activos y escribe las estadísticas como JSON en el archivo argv[2].
+_PROFILER_CODE = r"""
+import cProfile, json, os, pkgutil, pstats, runpy, sys, time, tracemalloc
+# pkgutil se importa antes: runpy lo carga al vuelo y saldría en el perfil
+ours = ("<string>", "<frozen runpy>", "<frozen zipimport>", runpy.__file__, pkgutil.__file__)
+script, out_path, top = sys.argv[1], sys.argv[2], int(sys.argv[3])
+sys.argv = [script]
+sys.path.insert(0, os.path.dirname(script))
+tracemalloc.start(1)
+prof = cProfile.Profile()
+rc = 0
+start = time.perf_counter()
+prof.enable()
+try:
+    runpy.run_path(script, run_name="__main__")
+except SystemExit as e:
+    rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+except BaseException:
+    import traceback
+    traceback.print_exc()
+    rc = 1
+prof.disable()
+wall = time.perf_counter() - start
+snapshot = tracemalloc.take_snapshot().filter_traces(
+    [tracemalloc.Filter(False, name) for name in ours + (tracemalloc.__file__, "<frozen importlib._bootstrap*>")])
+peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+rows = [[f, l, n, nc, tt, ct] for (f, l, n), (cc, nc, tt, ct, _) in pstats.Stats(prof).stats.items()
+        if f not in ours and not f.startswith("<frozen importlib")]
+keep = {id(r) for key in (4, 5) for r in sorted(rows, key=lambda r: r[key], reverse=True)[:top]}
+allocs = [[st.traceback[0].filename, st.traceback[0].lineno, st.size, st.count]
+          for st in snapshot.statistics("lineno")[:top]]
+with open(out_path, "w", encoding="utf-8") as f:
+    json.dump({"rc": rc, "wall": wall, "peak": peak, "functions": [r for r in rows if id(r) in keep],
+               "allocations": allocs}, f)
+"""
+
+
+@dataclass
+class FunctionStat:
+    """Una función medida por cProfile (tiempos en segundos)."""
+    file: str
+    line: int
+    name: str
+    calls: int
+    tottime: float
+    cumtime: float
+
+    def label(self, base_dir: str = "") -> str:
+        if self.file == "~":
+            return self.name  # función de C, ej: <built-in method builtins.print>
+        file = os.path.relpath(self.file, base_dir) if base_dir and self.file.startswith(base_dir) \
+            else os.path.basename(self.file)
+        return f"{self.name} ({file}:{self.line})"
+
+
+@dataclass
+class AllocationSite:
+    """Línea que reservó memoria, según tracemalloc (lo que seguía vivo al final)."""
+    file: str
+    line: int
+    size: int
+    count: int
+
+
+@dataclass
+class ProfileRun:
+    """Resultado de perfilar un script una vez."""
+    script_path: str
+    started: float
+    source_hash: str
+    returncode: Optional[int]
+    wall_time: float
+    peak_bytes: int
+    functions: List[FunctionStat]
+    allocations: List[AllocationSite]
+    stdout: str = ""
+    stderr: str = ""
+    run_id: str = ""
+
+    def top_functions(self, n: int = 15, key: str = "tottime") -> List[FunctionStat]:
+        return sorted(self.functions, key=lambda f: getattr(f, key), reverse=True)[:n]
+
+    def started_label(self) -> str:
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started))
+
+
+class ProfileHistory:
+    """
+    Historial de perfiles en disco: una carpeta por script (hash de su ruta)
+    con un JSON por ejecución. Se guardan las últimas `max_runs`.
+    """
+    def __init__(self, history_dir: str, max_runs: int = 20) -> None:
+        self.history_dir = history_dir
+        self.max_runs = max_runs
+
+    def _script_dir(self, script_path: str) -> str:
+        key = hashlib.sha1(normalize_path(script_path).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.history_dir, key)
+
+    def add(self, run: ProfileRun) -> None:
+        folder = self._script_dir(run.script_path)
+        # fecha primero, así el orden de los nombres es el de las ejecuciones;
+        # el sufijo al azar separa dos que empiezan en el mismo milisegundo
+        run.run_id = (time.strftime("%Y%m%d-%H%M%S", time.localtime(run.started))
+                      + f"-{int(run.started * 1000) % 1000:03d}-{uuid.uuid4().hex[:8]}")
+        data = dict(run.__dict__)
+        data["functions"] = [list(f.__dict__.values()) for f in run.functions]
+        data["allocations"] = [list(a.__dict__.values()) for a in run.allocations]
+        try:
+            os.makedirs(folder, exist_ok=True)
+            tmp = os.path.join(folder, run.run_id + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, os.path.join(folder, run.run_id + ".json"))
+        except OSError as e:
+            print(f"No se pudo guardar el perfil: {e}")
+            return
+        for old in self._run_files(run.script_path)[:-self.max_runs]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+    def _run_files(self, script_path: str) -> List[str]:
+        folder = self._script_dir(script_path)
+        try:
+            names = sorted(n for n in os.listdir(folder) if n.endswith(".json"))
+        except OSError:
+            return []
+        return [os.path.join(folder, n) for n in names]
+
+    def runs(self, script_path: str) -> List[ProfileRun]:
+        """Ejecuciones guardadas del script, de la más vieja a la más nueva."""
+        runs = []
+        for path in self._run_files(script_path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                data["functions"] = [FunctionStat(*row) for row in data["functions"]]
+                data["allocations"] = [AllocationSite(*row) for row in data["allocations"]]
+                runs.append(ProfileRun(**data))
+            except (OSError, ValueError, TypeError, KeyError):
+                continue
+        return runs
+
+
+class ScriptProfiler:
+    """
+    Perfila un script en un proceso hijo (cProfile + tracemalloc), así el
+    Dashboard no se mide a sí mismo ni se ensucia con lo que haga el script.
+    """
+    def __init__(self, history: ProfileHistory, top: int = 60, timeout: float = 60.0) -> None:
+        self.python_cmd = choose_python_interpreter()
+        self.history = history
+        self.top = top
+        self.timeout = timeout
+
+    def profile(self, script_path: str, stdin_text: str = "") -> ProfileRun:
+        abs_path = os.path.abspath(script_path)
+        try:
+            with open(abs_path, "rb") as f:
+                source_hash = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            source_hash = ""
+        env = dict(os.environ, PYTHONIOENCODING="utf-8")
+        fd, out_path = tempfile.mkstemp(prefix="perfil_", suffix=".json")
+        os.close(fd)
+        started = time.time()
+        run = ProfileRun(abs_path, started, source_hash, None, 0.0, 0, [], [])
+        try:
+            proc = subprocess.run(
+                [self.python_cmd, "-c", _PROFILER_CODE, abs_path, out_path, str(self.top)],
+                input=stdin_text.encode("utf-8"), capture_output=True,
+                timeout=self.timeout, cwd=os.path.dirname(abs_path), env=env,
+            )
+            run.stdout, run.stderr = _to_text(proc.stdout), _to_text(proc.stderr)
+            with open(out_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except subprocess.TimeoutExpired as e:
+            run.stdout, run.stderr = _to_text(e.stdout), _to_text(e.stderr)
+            run.stderr += f"\nSe detuvo tras {self.timeout:.0f} s: no hay perfil."
+            return run
+        except (OSError, ValueError) as e:
+            run.stderr += f"\nNo se pudo perfilar: {e}"
+            return run
+        finally:
+            try:
+                os.remove(out_path)
+            except OSError:
+                pass
+        run.returncode = data["rc"]
+        run.wall_time = data["wall"]
+        run.peak_bytes = data["peak"]
+        run.functions = [FunctionStat(*row) for row in data["functions"]]
+        run.allocations = [AllocationSite(*row) for row in data["allocations"]]
+        self.history.add(run)
+        return run
+
+
+def diff_profiles(old: ProfileRun, new: ProfileRun, n: int = 15) -> List[Tuple[str, float, float]]:
+    """
+    Funciones que más cambiaron de tiempo acumulado entre dos ejecuciones:
+    (nombre, antes, después). Se emparejan por archivo y nombre (la línea
+    puede moverse si se editó el script).
+    """
+    before = {(f.file, f.name): f for f in old.functions}
+    after = {(f.file, f.name): f for f in new.functions}
+    base_dir = os.path.dirname(new.script_path)
+    rows = []
+    for key in set(before) | set(after):
+        f = after.get(key) or before[key]
+        rows.append((f.label(base_dir),
+                     before[key].cumtime if key in before else 0.0,
+                     after[key].cumtime if key in after else 0.0))
+    rows.sort(key=lambda r: abs(r[2] - r[1]), reverse=True)
+    return rows[:n]
+
+
+def format_profile(run: ProfileRun, n: int = 15) -> str:
+    """Informe de texto: funciones más costosas y líneas que más memoria dejaron."""
+    base_dir = os.path.dirname(run.script_path)
+    lines = [f"Tiempo: {run.wall_time * 1000:.1f} ms   Pico de memoria: {run.peak_bytes / 1024:.1f} KiB"
+             f"   Código de salida: {run.returncode}", "",
+             f"{'Llamadas':>9} {'Propio ms':>10} {'Acum. ms':>10}  Función"]
+    for f in run.top_functions(n):
+        lines.append(f"{f.calls:>9} {f.tottime * 1000:>10.2f} {f.cumtime * 1000:>10.2f}  {f.label(base_dir)}")
+    lines += ["", f"{'KiB':>9} {'Bloques':>8}  Línea que reservó memoria"]
+    for a in run.allocations[:n]:
+        file = os.path.relpath(a.file, base_dir) if a.file.startswith(base_dir) else os.path.basename(a.file)
+        lines.append(f"{a.size / 1024:>9.1f} {a.count:>8}  {file}:{a.line}")
+    return "\n".join(lines)
+
+
+# --------------------------- Motor de Búsqueda ---------------------------
+
+@functools.lru_cache(maxsize=65536)
+def normalize_text(text: str) -> str:
+    """
+    Normaliza un nombre para buscar: minúsculas, sin tildes, sin extensión .py
+    y con separadores (_ - .) convertidos en espacios.
+    """
+    text = text.lower()
+    if text.endswith(".py"):
+        text = text[:-3]
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c if c.isalnum() else " " for c in text if not unicodedata.combining(c))
+    return " ".join(text.split())
+
+
+def trigrams(text: str, pad_end: bool = True) -> FrozenSet[str]:
+    """Trigramas de un texto ya normalizado (con espacio de relleno al inicio y fin)."""
+    padded = f" {text} " if pad_end else f" {text}"
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass
+class _SearchTerm:
+    """Un valor distinto de un campo (nombre de script, tema o unidad)."""
+    field_name: str
+    text: str
+    grams: FrozenSet[str]
+    docs: Dict[int, None] = field(default_factory=dict)  # dict = conjunto ordenado
+
+
+
+class SearchEngine:
+    """
+    Índice invertido de trigramas sobre nombre de script, tema y unidad.
+
+    Se indexan los valores DISTINTOS de cada campo (muchos scripts comparten
+    "Tema 1" o "Unidad 2"), y cada valor apunta a los scripts que lo usan.
+    La puntuación tolera errores de tipeo: cuenta cuántos trigramas de la
+    consulta aparecen en el valor, con bonificación si es subcadena exacta.
+    Las consultas de 1-2 letras buscan palabras que empiecen así. Una
+    consulta de varias palabras también encuentra scripts donde cada palabra
+    está en un campo distinto ("tema 3 clima": tema y nombre).
+    Agregar o quitar scripts actualiza el índice sin reconstruirlo.
+    """
+    FIELD_WEIGHTS = {"script": 1.0, "topic": 0.8, "unit": 0.7}
+    MIN_SCORE = 0.5
+    # Tope de valores parecidos (con errores de tipeo) a puntuar por
+    # consulta: mantiene la latencia acotada aunque la consulta comparta
+    # trigramas con decenas de miles de nombres.
+    MAX_CANDIDATES = 2000
+    # Consultas de hasta tantas palabras prueban todas las formas de
+    # repartirlas entre campos; con más, una palabra por campo.
+    MAX_SPLIT_WORDS = 4
+    # Cada trozo más en que se parte la consulta resta esta fracción: a
+    # igualdad, gana la partición que deja juntas más palabras.
+    SPLIT_PENALTY = 0.05
+
+    def __init__(self, items: Iterable[ScriptItem] = ()) -> None:
+        self._docs: Dict[int, ScriptItem] = {}
+        self._doc_ids: Dict[str, int] = {}
+        # script -> ids de los valores de sus campos
+        self._doc_terms: Dict[int, List[int]] = {}
+        self._next_doc = 0
+        # los valores se identifican con enteros: el conteo por trigramas
+        # hace muchísimos hash y el de un int es inmediato
+        self._terms: Dict[int, _SearchTerm] = {}
+        self._term_ids: Dict[Tuple[str, str], int] = {}
+        self._next_term = 0
+        self._postings: Dict[str, Set[int]] = {}
+        for it in items:
+            self.add(it)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @staticmethod
+    def _fields(item: ScriptItem) -> List[Tuple[str, str]]:
+        return [
+            ("script", normalize_text(item.script_name)),
+            ("topic", normalize_text(item.topic_name)),
+            ("unit", normalize_text(item.unit_name)),
+        ]
+
+    def add(self, item: ScriptItem) -> None:
+        key = os.path.abspath(item.script_path)
+        if key in self._doc_ids:
+            self.remove(key)
+        doc = self._next_doc
+        self._next_doc += 1
+        self._docs[doc] = item
+        self._doc_ids[key] = doc
+        doc_terms = self._doc_terms[doc] = []
+        for fkey in self._fields(item):
+            if not fkey[1]:
+                continue
+            tid = self._term_ids.get(fkey)
+            if tid is None:
+                tid = self._next_term
+                self._next_term += 1
+                term = _SearchTerm(fkey[0], fkey[1], trigrams(fkey[1]))
+                self._terms[tid] = term
+                self._term_ids[fkey] = tid
+                for g in term.grams:
+                    self._postings.setdefault(g, set()).add(tid)
+            self._terms[tid].docs[doc] = None
+            doc_terms.append(tid)
+
+    def remove(self, script_path: str) -> None:
+        doc = self._doc_ids.pop(os.path.abspath(script_path), None)
+        if doc is None:
+            return
+        item = self._docs.pop(doc)
+        del self._doc_terms[doc]
+        for fkey in self._fields(item):
+            tid = self._term_ids.get(fkey)
+            if tid is None:
+                continue
+            term = self._terms[tid]
+            term.docs.pop(doc, None)
+            if term.docs:
+                continue
+            del self._terms[tid]
+            del self._term_ids[fkey]
+            for g in term.grams:
+                posting = self._postings.get(g)
+                if posting is not None:
+                    posting.discard(tid)
+                    if not posting:
+                        del self._postings[g]
+
+    def sync(self, items: Iterable[ScriptItem]) -> Tuple[int, int]:
+        """
+        Deja el índice igual a `items` aplicando solo las diferencias.
+        Devuelve (agregados, quitados).
+        """
+        wanted = {os.path.abspath(it.script_path): it for it in items}
+        removed = [p for p in self._doc_ids if p not in wanted]
+        for p in removed:
+            self.remove(p)
+        added = 0
+        for p, it in wanted.items():
+            doc = self._doc_ids.get(p)
+            if doc is None or self._docs[doc] != it:
+                self.add(it)
+                added += 1
+        return added, len(removed)
+
+    @staticmethod
+    def _shortest_per_group(rows: List[Tuple[int, int, str, int]], limit: int) -> List[int]:
+        """
+        `rows` son (tamaño, id, campo, tipo de coincidencia). Devuelve los ids
+        de los `limit` valores más chicos de cada grupo (campo, tipo); a igual
+        tamaño, el id menor, igual que el desempate de search(). Dentro de
+        un grupo la puntuación solo baja con el tamaño, así que ningún valor
+        descartado podía quedar entre los `limit` mejores.
+        """
+        rows.sort()
+        taken: Dict[Tuple[str, int], int] = {}
+        chosen: List[int] = []
+        for _, tid, field_name, kind in rows:
+            group = (field_name, kind)
+            count = taken.get(group, 0)
+            if count < limit:
+                taken[group] = count + 1
+                chosen.append(tid)
+        return chosen
+
+    def _score_terms(self, q: str, limit: int) -> List[Tuple[float, int]]:
+        """Puntúa los valores candidatos; devuelve (puntuación ponderada, id)."""
+        terms = self._terms
+        weights = self.FIELD_WEIGHTS
+
+        if len(q) < 3:
+            # consultas cortas: palabras que EMPIEZAN con q (autocompletar).
+            # Exacta > el valor empieza con q > otra palabra; a igualdad, el
+            # más corto.
+            start = f" {q}"
+            tids: Set[int] = set()
+            for g, posting in self._postings.items():
+                if g.startswith(start):
+                    tids |= posting
+            found = list(tids)
+            if len(found) > self.MAX_CANDIDATES:
+                rows = []
+                for t in found:
+                    term = terms[t]
+                    kind = (term.text == q) + term.text.startswith(q)
+                    rows.append((len(term.text), t, term.field_name, kind))
+                found = self._shortest_per_group(rows, limit)
+            scored = []
+            for t in found:
+                term = terms[t]
+                score = 1.5 if term.text == q else 1.25 if term.text.startswith(q) else 1.0
+                scored.append((score * weights[term.field_name], t))
+            return scored
+
+        qgrams = trigrams(q, pad_end=False)
+        k = len(qgrams)
+        postings = sorted((self._postings.get(g, set()) for g in qgrams), key=len)
+
+        # Nivel 1: valores con TODOS los trigramas (intersección en C). Si son
+        # muchos, se eligen sin puntuarlos los que pueden quedar entre los
+        # mejores (prefijo > subcadena > otro, luego el más corto): el tope
+        # de candidatos solo se aplica al nivel 2.
+        full = set.intersection(*postings) if postings[0] else set()
+        kept = list(full)
+        if len(kept) > self.MAX_CANDIDATES:
+            rows = []
+            for tid in kept:
+                term = terms[tid]
+                kind = term.text.startswith(q) + (q in term.text)
+                # cantidad de trigramas (la puntuación) y, a igualdad, largo del texto
+                rows.append(((len(term.grams) << 16) + len(term.text), tid, term.field_name, kind))
+            kept = self._shortest_per_group(rows, limit)
+        candidates: List[Tuple[int, int]] = [(tid, k) for tid in kept]
+
+        # Nivel 2 (errores de tipeo): si faltan resultados, valores con al
+        # menos `m` trigramas. Por el principio del palomar aparecen en alguna
+        # de las k - m + 1 listas más cortas.
+        if len(full) < limit:
+            m = max(1, math.ceil(k * (self.MIN_SCORE - 0.15) / 0.85 - 1e-9))
+            partial: Set[int] = set()
+            for posting in postings[: k - m + 1]:
+                partial |= posting
+                if len(partial) >= self.MAX_CANDIDATES:
+                    break
+            partial -= full
+            for tid in itertools.islice(partial, self.MAX_CANDIDATES):
+                shared = len(qgrams & terms[tid].grams)
+                if shared >= m:
+                    candidates.append((tid, shared))
+
+        scored: List[Tuple[float, int]] = []
+        for tid, shared in candidates:
+            term = terms[tid]
+            # 85% cobertura de la consulta + 15% Jaccard + bonificación por subcadena
+            score = 0.85 * shared / k + 0.15 * shared / (k + len(term.grams) - shared)
+            if q in term.text:
+                score += 0.25 if term.text.startswith(q) else 0.15
+            if score >= self.MIN_SCORE:
+                scored.append((score * weights[term.field_name], tid))
+        return scored
+
+    def _splits(self, words: List[str]) -> List[List[str]]:
+        """
+        Formas de partir las palabras en dos o más trozos seguidos: "tema 3
+        clima" da ["tema", "3 clima"], ["tema 3", "clima"] y ["tema", "3", "clima"].
+        """
+        if len(words) > self.MAX_SPLIT_WORDS:
+            return [words]
+        splits = []
+        for mask in range(1, 2 ** (len(words) - 1)):
+            chunks = []
+            current = [words[0]]
+            for i, word in enumerate(words[1:]):
+                if mask >> i & 1:
+                    chunks.append(" ".join(current))
+                    current = [word]
+                else:
+                    current.append(word)
+            chunks.append(" ".join(current))
+            splits.append(chunks)
+        return splits
+
+    def _scripts_across_fields(self, words: List[str], limit: int) -> List[Tuple[float, int]]:
+        """
+        (puntuación, script) de los scripts donde la consulta aparece
+        repartida entre sus campos: cada trozo de una partición coincide con
+        alguno de los campos. La puntuación de una partición es el promedio
+        de la de sus trozos, menos SPLIT_PENALTY por cada trozo extra; cada
+        script se queda con su mejor partición.
+        """
+        terms = self._terms
+        chunk_scores: Dict[str, Dict[int, float]] = {}
+        best: Dict[int, float] = {}
+        for chunks in self._splits(words):
+            per_chunk: List[Dict[int, float]] = []
+            for chunk in chunks:
+                scores = chunk_scores.get(chunk)
+                if scores is None:
+                    scores = {}
+                    for score, tid in self._score_terms(chunk, self.MAX_CANDIDATES):
+                        scores[tid] = score
+                    chunk_scores[chunk] = scores
+                if not scores:
+                    break
+                per_chunk.append(scores)
+            else:
+                factor = (1 - self.SPLIT_PENALTY * (len(chunks) - 1)) / len(chunks)
+                # se parte del trozo con menos scripts y se revisan los demás
+                # en los campos de cada uno
+                rarest = min(per_chunk, key=lambda scores: sum(len(terms[t].docs) for t in scores))
+                seen: Set[int] = set()
+                for tid in rarest:
+                    for doc in terms[tid].docs:
+                        if doc in seen:
+                            continue
+                        seen.add(doc)
+                        doc_terms = self._doc_terms[doc]
+                        total = 0.0
+                        for scores in per_chunk:
+                            chunk_best = max(scores.get(t, 0.0) for t in doc_terms)
+                            if not chunk_best:
+                                break
+                            total += chunk_best
+                        else:
+                            score = total * factor
+                            if score > best.get(doc, 0.0):
+                                best[doc] = score
+        return heapq.nlargest(limit, ((score, doc) for doc, score in best.items()),
+                              key=lambda sd: (sd[0], -sd[1]))
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[float, ScriptItem]]:
+        """Devuelve hasta `limit` pares (puntuación, script), de mayor a menor."""
+        q = normalize_text(query)
+        if not q:
+            return []
+        scored = self._score_terms(q, limit)
+
+        # Cada valor aporta al menos un script: bastan los `limit` mejores.
+        # A igual puntuación gana el valor más corto (más parecido a q).
+        terms = self._terms
+        best = heapq.nlargest(limit, scored, key=lambda st: (st[0], -len(terms[st[1]].text), -st[1]))
+        found: List[Tuple[float, int]] = []
+        seen: Set[int] = set()
+        exact = 0  # scripts con la consulta entera dentro de un campo
+        for score, tid in best:
+            if len(found) >= limit:
+                break
+            contains = q in terms[tid].text
+            for doc in terms[tid].docs:
+                if doc in seen:
+                    continue
+                seen.add(doc)
+                found.append((score, doc))
+                exact += contains
+                if len(found) >= limit:
+                    break
+
+        words = q.split()
+        if len(words) > 1 and exact < limit:
+            # la consulta puede estar repartida entre campos ("tema 3 clima"):
+            # se mezcla con lo anterior y cada script queda con su mejor
+            # puntuación. Si ya sobran coincidencias exactas no hace falta.
+            best_by_doc = dict((doc, score) for score, doc in found)
+            for score, doc in self._scripts_across_fields(words, limit):
+                if score > best_by_doc.get(doc, 0.0):
+                    if doc not in best_by_doc:
+                        found.append((score, doc))
+                    best_by_doc[doc] = score
+            found = [(best_by_doc[doc], doc) for _, doc in found]
+            found.sort(key=lambda sd: -sd[0])  # estable: a igualdad, el orden de antes
+            del found[limit:]
+        return [(round(score, 3), self._docs[doc]) for score, doc in found]
+
+
+# --------------------------- Búsqueda en el Contenido ---------------------------
+
+@dataclass
+class ContentMatch:
+    item: ScriptItem
+    line_no: int
+    line: str
+
+    def display_label(self) -> str:
+        return f"{self.item.display_label()}:{self.line_no}: {self.line}"
+
+
+class ContentSearcher:
     """
-    Selecciona el intérprete de Python:
-    - En Windows suele ser 'python'
-    - En Linux/mac suele ser 'python3'
+    Busca texto (o una expresión regular) dentro de los scripts.
+
+    Cada archivo se abre con mmap: el sistema operativo trae las páginas a
+    medida que la búsqueda avanza y nunca se copia el archivo completo a la
+    memoria del proceso. Los números de línea se calculan contando saltos
+    de línea por bloques de CHUNK_SIZE. Varios archivos se recorren a la vez
+    con un grupo acotado de hilos (útil en carpetas de red, donde domina la
+    espera de E/S) y las coincidencias se entregan a medida que aparecen.
     """
-    # Si el programa se ejecuta con python, usar el mismo intérprete:
-    # sys.executable es el camino real al python actual.
-    return sys.executable if sys.executable else ("python" if os.name == "nt" else "python3")
+    CHUNK_SIZE = 1 << 20
+    MAX_LINE_CHARS = 200
 
+    def __init__(self, max_workers: int = 8) -> None:
+        self.max_workers = max(1, max_workers)
 
-# --------------------------- Datos y Favoritos ---------------------------
+    @staticmethod
+    def compile(query: str, regex: bool = False, ignore_case: bool = True) -> "re.Pattern[bytes]":
+        """Compila la consulta como patrón de bytes (UTF-8)."""
+        raw = query.encode("utf-8")
+        flags = re.IGNORECASE if ignore_case else 0
+        return re.compile(raw if regex else re.escape(raw), flags | re.MULTILINE)
+
+    def _count_newlines(self, mm: mmap.mmap, start: int, end: int) -> int:
+        count = 0
+        while start < end:
+            stop = min(start + self.CHUNK_SIZE, end)
+            count += mm[start:stop].count(b"\n")
+            start = stop
+        return count
+
+    def search_file(self, item: ScriptItem, pattern: "re.Pattern[bytes]",
+                    stop: Optional[threading.Event] = None) -> Iterator[ContentMatch]:
+        """Coincidencias de un archivo (una por línea), en orden."""
+        try:
+            with open(item.script_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        try:
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            size = len(mm)
+            line_no = 1
+            counted_to = 0
+            pos = 0
+            while pos <= size:
+                if stop is not None and stop.is_set():
+                    return
+                m = pattern.search(mm, pos)
+                if m is None:
+                    return
+                line_start = mm.rfind(b"\n", 0, m.start()) + 1
+                line_end = mm.find(b"\n", m.start())
+                if line_end == -1:
+                    line_end = size
+                line_no += self._count_newlines(mm, counted_to, line_start)
+                counted_to = line_start
+                raw = mm[line_start:min(line_end, line_start + self.MAX_LINE_CHARS * 4)]
+                text = decode_line(raw).rstrip("\r").strip()
+                yield ContentMatch(item, line_no, text[: self.MAX_LINE_CHARS])
+                pos = line_end + 1
+        finally:
+            mm.close()
+
+    def search(self, items: Iterable[ScriptItem], pattern: "re.Pattern[bytes]") -> Iterator[ContentMatch]:
+        """
+        Recorre `items` en paralelo y entrega coincidencias a medida que se
+        encuentran. Si se deja de consumir el generador, los hilos se detienen.
+        """
+        files = list(items)
+        if not files:
+            return
+        pending = iter(files)
+        pending_lock = threading.Lock()
+        results: "queue.Queue[Optional[ContentMatch]]" = queue.Queue(maxsize=1000)
+        stop = threading.Event()
+
+        def put(value: Optional[ContentMatch]) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(value, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def worker() -> None:
+            try:
+                while not stop.is_set():
+                    with pending_lock:
+                        item = next(pending, None)
+                    if item is None:
+                        return
+                    for match in self.search_file(item, pattern, stop):
+                        if not put(match):
+                            return
+            finally:
+                put(None)
+
+        n_threads = min(self.max_workers, len(files))
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(n_threads)]
+        for t in threads:
+            t.start()
+        finished = 0
+        try:
+            while finished < len(threads):
+                match = results.get()
+                if match is None:
+                    finished += 1
+                    continue
+                yield match
+        finally:
+            stop.set()
+
+
+# --------------------------- Índice de Símbolos ---------------------------
 
 @dataclass
-class ScriptItem:
-    unit_name: str
-    topic_name: str
-    script_name: str
+class ClassSymbol:
+    """Una clase encontrada en un script: bases, métodos y docstring."""
+    name: str
+    bases: List[str]
+    methods: List[str]
+    doc: str
+    line: int
     script_path: str
 
     def display_label(self) -> str:
-        return f"{self.unit_name} > {self.topic_name} > {self.script_name}"
+        bases = f"({', '.join(self.bases)})" if self.bases else ""
+        return f"{self.name}{bases}  ->  {os.path.basename(self.script_path)}:{self.line}"
 
 
-class FavoritesManager:
+def _base_name(node: ast.expr) -> str:
+    """Nombre simple de una base: `modulo.Empleado` -> "Empleado", `Generic[T]` -> "Generic"."""
+    if isinstance(node, ast.Subscript):
+        node = node.value
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return ast.unparse(node)
+
+
+def _iter_classes(body: List[ast.stmt]) -> Iterator[ast.ClassDef]:
     """
-    Maneja favoritos en un archivo de texto.
-    Cada línea guarda una ruta absoluta del script.
+    Clases definidas en `body`, también anidadas en otras clases, funciones,
+    if/try/with/match. Solo baja por listas de sentencias: las expresiones
+    (la mayor parte del árbol) no pueden contener una clase.
     """
-    def __init__(self, favorites_file: str) -> None:
-        self.favorites_file = favorites_file
-        self._favorites: List[str] = []
+    stack: List[ast.AST] = list(reversed(body))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.ClassDef):
+            yield node
+        children: List[ast.AST] = []
+        for name in ("body", "handlers", "orelse", "finalbody", "cases"):
+            value = getattr(node, name, None)
+            if isinstance(value, list):
+                children.extend(value)
+        stack.extend(reversed(children))
+
+
+def parse_class_symbols(script_path: str) -> Tuple[str, str, Optional[list]]:
+    """
+    Lee y analiza un script con ast. Devuelve (ruta, hash, clases); clases es
+    una lista de [nombre, bases, métodos, doc, línea], o None si no se pudo
+    analizar. Está a nivel de módulo para poder usarse en otro proceso.
+    """
+    try:
+        with open(script_path, "rb") as f:
+            source = f.read()
+    except OSError:
+        return script_path, "", None
+    digest = hashlib.sha256(source).hexdigest()
+    try:
+        tree = ast.parse(source, filename=script_path)
+    except (SyntaxError, ValueError):
+        return script_path, digest, None
+    classes = []
+    for node in _iter_classes(tree.body):
+        methods = [n.name for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
+        doc = (ast.get_docstring(node) or "").strip().split("\n")[0]
+        classes.append([node.name, [_base_name(b) for b in node.bases], methods, doc, node.lineno])
+    return script_path, digest, classes
+
+
+class SymbolIndex:
+    """
+    Clases, bases y métodos de todos los scripts, para preguntar cosas como
+    "subclases de Empleado" o "quién sobrescribe generar" sin releer nada.
+
+    Cada archivo se analiza una sola vez: el resultado se guarda en disco por
+    hash del contenido, y un archivo con el mismo tamaño y mtime ni se relee.
+    Cuando hay muchos archivos nuevos se analizan en paralelo con procesos
+    (si el sistema no lo permite, uno por uno). Las bases se resuelven por
+    nombre simple, así que dos clases homónimas en scripts distintos cuentan
+    como la misma.
+    """
+    VERSION = 1
+    PARALLEL_MIN_FILES = 16
+
+    def __init__(self, cache_file: str, max_workers: Optional[int] = None) -> None:
+        self.cache_file = cache_file
+        self.max_workers = max_workers
+        # hash -> clases (formato de parse_class_symbols)
+        self._by_hash: Dict[str, list] = {}
+        # ruta -> (tamaño, mtime_ns, hash)
+        self._files: Dict[str, Tuple[int, int, str]] = {}
+        self._dirty = False
+        self.parsed = 0
+        self.reused = 0
+        self.classes: List[ClassSymbol] = []
+        self._by_name: Dict[str, List[ClassSymbol]] = {}
+        self._children: Dict[str, List[ClassSymbol]] = {}
+        self._by_method: Dict[str, List[ClassSymbol]] = {}
         self.load()
 
     def load(self) -> None:
-        content = read_text_file(self.favorites_file)
+        content = read_text_file(self.cache_file)
         if not content:
-            self._favorites = []
             return
-        lines = [line.strip() for line in content.splitlines() if line.strip()]
-        # mantener solo existentes
-        self._favorites = [p for p in lines if os.path.exists(p)]
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        self._by_hash = dict(data.get("hashes", {}))
+        for path, entry in data.get("files", {}).items():
+            try:
+                size, mtime, digest = entry
+                self._files[path] = (int(size), int(mtime), str(digest))
+            except (TypeError, ValueError):
+                continue
 
     def save(self) -> None:
+        if not self._dirty:
+            return
+        used = {digest for _, _, digest in self._files.values()}
+        data = {
+            "version": self.VERSION,
+            "files": {p: list(v) for p, v in self._files.items()},
+            "hashes": {h: c for h, c in self._by_hash.items() if h in used},
+        }
+        tmp = f"{self.cache_file}.{os.getpid()}.tmp"
         try:
-            with open(self.favorites_file, "w", encoding="utf-8") as f:
-                for p in self._favorites:
-                    f.write(p + "\n")
-        except Exception as e:
-            print(f"No se pudo guardar favoritos: {e}")
+            os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            print(f"No se pudo guardar el índice de símbolos: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
 
-    def list(self) -> List[str]:
-        return list(self._favorites)
-
-    def is_favorite(self, path: str) -> bool:
-        return os.path.abspath(path) in set(map(os.path.abspath, self._favorites))
+    def _parse_all(self, paths: List[str]) -> Iterator[Tuple[str, str, Optional[list]]]:
+        if len(paths) >= self.PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    chunk = max(1, len(paths) // ((self.max_workers or os.cpu_count() or 1) * 4))
+                    return iter(list(pool.map(parse_class_symbols, paths, chunksize=chunk)))
+            except (OSError, BrokenProcessPool, AttributeError, ImportError, RuntimeError,
+                    pickle.PicklingError):
+                # PicklingError: el módulo se cargó con un nombre que los
+                # procesos hijos no pueden importar (este archivo lleva guiones)
+                pass  # sin procesos (o sin fork/spawn posible): seguir en este proceso
+        return map(parse_class_symbols, paths)
 
-    def add(self, path: str) -> None:
-        p = os.path.abspath(path)
-        if p not in self._favorites and os.path.exists(p):
-            self._favorites.append(p)
-            self.save()
+    def update(self, items: Iterable[ScriptItem]) -> Tuple[int, int]:
+        """
+        Pone el índice al día con `items`. Devuelve (analizados, reutilizados).
+        """
+        files: Dict[str, Tuple[int, int, str]] = {}
+        to_hash: List[Tuple[str, int, int]] = []
+        for it in items:
+            path = os.path.abspath(it.script_path)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            known = self._files.get(path)
+            if known is not None and known[0] == st.st_size and known[1] == st.st_mtime_ns \
+                    and known[2] in self._by_hash:
+                files[path] = known
+            else:
+                to_hash.append((path, st.st_size, st.st_mtime_ns))
 
-    def remove(self, path: str) -> None:
-        p = os.path.abspath(path)
-        self._favorites = [x for x in self._favorites if os.path.abspath(x) != p]
-        self.save()
+        # contenido ya visto (archivo tocado o copiado): basta con el hash
+        to_parse: List[str] = []
+        stats: Dict[str, Tuple[int, int]] = {}
+        for path, size, mtime in to_hash:
+            try:
+                with open(path, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                continue
+            if digest in self._by_hash:
+                files[path] = (size, mtime, digest)
+            else:
+                to_parse.append(path)
+                stats[path] = (size, mtime)
 
+        for path, digest, classes in self._parse_all(to_parse):
+            if not digest:
+                continue
+            self._by_hash[digest] = classes or []
+            files[path] = (stats[path][0], stats[path][1], digest)
 
-# --------------------------- Exploración de Proyecto ---------------------------
+        self.parsed = len(to_parse)
+        self.reused = len(files) - self.parsed
+        if files != self._files:
+            self._files = files
+            self._dirty = True
+        self._rebuild()
+        return self.parsed, self.reused
 
-class ProjectExplorer:
-    """
-    Explora la estructura del proyecto para detectar unidades, temas y scripts.
-    """
-    def __init__(self, base_path: str) -> None:
-        self.base_path = base_path
+    def _rebuild(self) -> None:
+        self.classes = []
+        self._by_name, self._children, self._by_method = {}, {}, {}
+        for path, (_, _, digest) in sorted(self._files.items()):
+            for name, bases, methods, doc, line in self._by_hash.get(digest, []):
+                sym = ClassSymbol(name, list(bases), list(methods), doc, line, path)
+                self.classes.append(sym)
+                self._by_name.setdefault(name, []).append(sym)
+                for base in bases:
+                    self._children.setdefault(base, []).append(sym)
+                for method in methods:
+                    self._by_method.setdefault(method, []).append(sym)
 
-    def get_units(self) -> List[str]:
-        """
-        Detecta carpetas que empiecen con "Unidad" (ej: "Unidad 1").
-        Si no existen, devuelve todas las carpetas del directorio base.
-        """
-        all_dirs = safe_list_dirs(self.base_path)
-        unidades = [d for d in all_dirs if d.lower().startswith("unidad")]
-        return unidades if unidades else all_dirs
+    def __len__(self) -> int:
+        return len(self.classes)
 
-    def get_topics(self, unit_path: str) -> List[str]:
-        return safe_list_dirs(unit_path)
+    def classes_named(self, name: str) -> List[ClassSymbol]:
+        return list(self._by_name.get(name, []))
 
-    def get_scripts(self, topic_path: str) -> List[str]:
-        return safe_list_py_files(topic_path)
+    def subclasses(self, name: str, transitive: bool = True) -> List[ClassSymbol]:
+        """Clases que heredan de `name` (también nietas, si `transitive`)."""
+        result: List[ClassSymbol] = []
+        seen: Set[int] = set()
+        pending = [name]
+        while pending:
+            for sym in self._children.get(pending.pop(), []):
+                if id(sym) in seen:
+                    continue
+                seen.add(id(sym))
+                result.append(sym)
+                if transitive:
+                    pending.append(sym.name)
+        return result
 
-    def collect_all_scripts(self) -> List[ScriptItem]:
-        """
-        Recorre todas las unidades y temas para construir una lista global de scripts.
-        Útil para búsqueda rápida.
-        """
-        items: List[ScriptItem] = []
-        for unit in self.get_units():
-            unit_path = os.path.join(self.base_path, unit)
-            topics = self.get_topics(unit_path)
-            if not topics:
-                # si no hay subcarpetas, buscar scripts directo en unidad
-                scripts = safe_list_py_files(unit_path)
-                for s in scripts:
-                    spath = os.path.join(unit_path, s)
-                    items.append(ScriptItem(unit, "(sin tema)", s, spath))
+    def _ancestor_defines(self, sym: ClassSymbol, method: str) -> bool:
+        pending, seen = list(sym.bases), {sym.name}
+        while pending:
+            base = pending.pop()
+            if base in seen:
                 continue
+            seen.add(base)
+            for parent in self._by_name.get(base, []):
+                if method in parent.methods:
+                    return True
+                pending.extend(parent.bases)
+        return False
 
-            for topic in topics:
-                topic_path = os.path.join(unit_path, topic)
-                scripts = self.get_scripts(topic_path)
-                for s in scripts:
-                    spath = os.path.join(topic_path, s)
-                    items.append(ScriptItem(unit, topic, s, spath))
-        return items
+    def overriding(self, method: str) -> List[ClassSymbol]:
+        """Clases que definen `method` y heredan de alguna clase que ya lo tenía."""
+        return [sym for sym in self._by_method.get(method, []) if self._ancestor_defines(sym, method)]
 
+    def defining(self, method: str) -> List[ClassSymbol]:
+        return list(self._by_method.get(method, []))
 
-# --------------------------- Ejecutar y Mostrar Código ---------------------------
 
-class ScriptRunner:
+# --------------------------- Pantalla ---------------------------
+
+def terminal_supports_ansi(stream: object) -> bool:
+    """True si `stream` es una terminal que entiende secuencias ANSI."""
+    try:
+        if not stream.isatty():  # type: ignore[attr-defined]
+            return False
+    except (AttributeError, ValueError):
+        return False
+    if os.environ.get("TERM", "") == "dumb":
+        return False
+    if os.name != "nt":
+        return True
+    # Windows 10+: hay que activar el modo VT de la consola
+    try:
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        handle = kernel32.GetStdHandle(-11)
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+
+class ScreenRenderer:
     """
-    Maneja la visualización y ejecución de scripts.
+    Ocupa el lugar de sys.stdout para dibujar los menús sin `clear`.
+
+    Lo impreso entre begin_frame() y el siguiente flush() (input() siempre
+    hace flush antes de leer) forma un cuadro. Al cerrarlo se reescriben con
+    ANSI solo las filas distintas al cuadro anterior y se borra lo que quedó
+    debajo (el prompt y lo que escribió el usuario).
+    Lo que se imprime fuera de un cuadro va directo a la terminal; si eso
+    pudo desplazar la pantalla, o si se llama a invalidate() tras lanzar
+    otro programa, el próximo cuadro se dibuja entero.
+    Sin soporte ANSI (terminal "dumb" o salida redirigida) las pantallas
+    solo se separan con una línea en blanco.
     """
-    def __init__(self) -> None:
-        self.python_cmd = choose_python_interpreter()
+    def __init__(self, stream: Optional[object] = None, enabled: Optional[bool] = None,
+                 size: Optional[Callable[[], Tuple[int, int]]] = None) -> None:
+        self.stream = stream if stream is not None else sys.stdout
+        self.enabled = terminal_supports_ansi(self.stream) if enabled is None else enabled
+        self._size = size or (lambda: tuple(shutil.get_terminal_size()))
+        self._lock = threading.RLock()
+        self._frame: Optional[List[str]] = None
+        self._rows: List[str] = []
+        self._valid = False
+        self._used_rows = 0
+        self.frames = 0
+        self.bytes_written = 0
 
-    def show_code(self, script_path: str) -> None:
-        code = read_text_file(script_path)
-        print(f"\n--- Código: {os.path.basename(script_path)} ---\n")
-        if code is None:
-            print("No se pudo leer el archivo.")
-            return
-        print(code)
+    def __getattr__(self, name: str) -> object:
+        # encoding, fileno, isatty, buffer... son los de la terminal real
+        return getattr(self.stream, name)
 
-    def run(self, script_path: str) -> None:
-        """
-        Ejecuta el script en un proceso separado.
-        - En Windows abre una consola nueva con cmd /k (deja la ventana abierta).
-        - En Linux/mac intenta ejecutar en terminal si existe; si no, ejecuta en segundo plano.
-        """
-        try:
-            abs_path = os.path.abspath(script_path)
+    def write(self, text: str) -> int:
+        with self._lock:
+            if self._frame is not None:
+                self._frame.append(text)
+            else:
+                self._count_rows(text)
+                self.stream.write(text)  # type: ignore[attr-defined]
+        return len(text)
 
-            if os.name == "nt":
-                # Abre una terminal y deja abierta para ver salida
-                subprocess.Popen(["cmd", "/k", self.python_cmd, abs_path])
+    def flush(self) -> None:
+        with self._lock:
+            if self._frame is not None:
+                self._render()
+            self.stream.flush()  # type: ignore[attr-defined]
+
+    def begin_frame(self) -> None:
+        """Empieza una pantalla nueva (reemplaza a clear_screen)."""
+        with self._lock:
+            if not self.enabled:
+                if os.name == "nt":
+                    clear_screen()  # consola vieja sin ANSI: no hay otra forma
+                else:
+                    self.stream.write("\n")  # type: ignore[attr-defined]
                 return
+            if self._frame is not None:
+                self._render()
+            self._frame = []
 
-            # macOS / Linux: intentar abrir terminal
-            # 1) GNOME Terminal
-            for term_cmd in [
-                ["gnome-terminal", "--", self.python_cmd, abs_path],
-                ["konsole", "-e", self.python_cmd, abs_path],
-                ["xterm", "-hold", "-e", self.python_cmd, abs_path],
-                ["mate-terminal", "-e", f"{self.python_cmd} {abs_path}"],
-            ]:
-                try:
-                    subprocess.Popen(term_cmd)
-                    return
-                except FileNotFoundError:
-                    continue
-                except Exception:
-                    continue
+    def note_input(self, prompt: str = "") -> None:
+        """Avisa que se va a leer una línea: el prompt y el Enter ocupan filas."""
+        with self._lock:
+            self._count_rows(prompt + "\n")
 
-            # fallback: ejecutar sin terminal nueva
-            subprocess.Popen([self.python_cmd, abs_path])
+    def invalidate(self) -> None:
+        """Otro programa pudo escribir en la terminal: redibujar todo la próxima vez."""
+        with self._lock:
+            self._valid = False
 
-        except Exception as e:
-            print(f"Ocurrió un error al ejecutar el script: {e}")
+    def _count_rows(self, text: str) -> None:
+        if not self.enabled or not self._valid:
+            return
+        width, height = self._size()
+        lines = text.split("\n")
+        self._used_rows += len(lines) - 1 + sum(len(line) // max(1, width) for line in lines)
+        if self._used_rows >= height - 1:
+            self._valid = False  # la pantalla se desplazó
+
+    def _render(self) -> None:
+        text = "".join(self._frame or [])
+        self._frame = None
+        width, height = self._size()
+        width = max(1, width)
+        rows: List[str] = []
+        for line in text.split("\n"):
+            rows.extend([line[i:i + width] for i in range(0, len(line), width)] or [""])
+        if text.endswith("\n"):
+            rows.pop()
+
+        out: List[str] = []
+        if len(rows) >= height - 1:
+            # no entra en la pantalla: se escribe entero y la terminal lo desplaza
+            out.append("\033[H\033[2J" + text)
+            self._valid = False
+            self._rows = []
+        else:
+            previous = self._rows if self._valid else []
+            if not self._valid:
+                out.append("\033[H\033[2J")
+            for n, row in enumerate(rows):
+                if n < len(previous) and previous[n] == row:
+                    continue
+                # en la última columna \033[K borraría el último carácter
+                out.append(f"\033[{n + 1};1H{row}" + ("\033[K" if len(row) < width else ""))
+            out.append(f"\033[{len(rows) + 1};1H\033[J")
+            if rows and not text.endswith("\n"):
+                out.append(f"\033[{len(rows)};{len(rows[-1]) + 1}H")
+            self._rows = rows
+            self._valid = True
+        self._used_rows = len(rows)
+        data = "".join(out)
+        self.stream.write(data)  # type: ignore[attr-defined]
+        self.frames += 1
+        self.bytes_written += len(data)
 
 
 # --------------------------- Interfaz de Menú ---------------------------
@@ -283,12 +4177,43 @@ class ScriptRunner:
 class DashboardApp:
     def __init__(self) -> None:
         self.base_path = os.path.dirname(os.path.abspath(__file__))
-        self.explorer = ProjectExplorer(self.base_path)
-        self.runner = ScriptRunner()
+        self.cache_dir = os.path.join(self.base_path, ".dashboard_cache")
+        self.script_index = ScriptIndex(os.path.join(self.cache_dir, "indice_scripts.json"))
+        self.watcher: Optional[TreeWatcher] = None
+        if env_int("DASHBOARD_VIGILAR", 1):
+            self.watcher = TreeWatcher(
+                self.base_path,
+                self.script_index.list_dir,
+                max_workers=env_int("DASHBOARD_HILOS", 8),
+                max_depth=env_int("DASHBOARD_PROFUNDIDAD", 2),
+            )
+        self.explorer = ProjectExplorer(
+            self.base_path,
+            self.script_index,
+            max_workers=env_int("DASHBOARD_HILOS", 8),
+            max_depth=env_int("DASHBOARD_PROFUNDIDAD", 2),
+            watcher=self.watcher,
+        )
+        self.search_engine = SearchEngine()
+        self.content_searcher = ContentSearcher()
+        self.runner = ScriptRunner(
+            warm_pool_size=env_int("DASHBOARD_PRECALENTADOS", 0),
+            cache=RunResultCache(os.path.join(self.cache_dir, "resultados")),
+            metrics=RunMetricsStore(os.path.join(self.cache_dir, "metricas")),
+            bytecode=BytecodeCache(os.path.join(self.cache_dir, "bytecode")),
+        )
+        self.preview_runner = InProcessRunner(fallback=self.runner)
+        self.symbol_index = SymbolIndex(os.path.join(self.cache_dir, "simbolos.json"))
+        self.profiler = ScriptProfiler(ProfileHistory(os.path.join(self.cache_dir, "perfiles")))
         self.favorites = FavoritesManager(os.path.join(self.base_path, "dashboard_favoritos.txt"))
+        self.renderer = ScreenRenderer()
+        self.live_runner = LiveRunner(self.runner)
 
     def header(self, title: str) -> None:
-        clear_screen()
+        if sys.stdout is self.renderer:
+            self.renderer.begin_frame()
+        else:
+            clear_screen()
         print("=" * 60)
         print(f"{title}".center(60))
         print("=" * 60)
@@ -297,8 +4222,56 @@ class DashboardApp:
         print("=" * 60)
 
     def input_option(self, prompt: str) -> str:
+        self.renderer.note_input(f"\n{prompt} ")
         return input(f"\n{prompt} ").strip()
 
+    def input_stdin(self, default: str = "") -> str:
+        """Pide la entrada estándar para un script (\\n separa líneas)."""
+        if default:
+            print("(Enter = usar el archivo .stdin del script)")
+        text = self.input_option("Entrada estándar (\\n separa líneas) [vacía]:")
+        if not text:
+            return default
+        text = text.replace("\\n", "\n")
+        return text if text.endswith("\n") else text + "\n"
+
+    def sync_search_engine(self) -> List[ScriptItem]:
+        """
+        Pone al día el motor de búsqueda y devuelve todos los scripts.
+        Con el vigilante solo se aplican los cambios ocurridos desde la última vez.
+        """
+        if self.watcher is not None and self.watcher.running:
+            deltas = self.watcher.drain()
+            if deltas is None:
+                self.search_engine.sync(self.watcher.items())
+            else:
+                for delta in deltas:
+                    for it in delta.removed:
+                        self.search_engine.remove(it.script_path)
+                    for it in delta.added:
+                        self.search_engine.add(it)
+            return self.watcher.items()
+
+        self.script_index.reset_stats()
+        all_items = self.explorer.collect_all_scripts()
+        if self.script_index.stats()["misses"] or len(self.search_engine) != len(all_items):
+            # solo se aplican las diferencias si alguna carpeta cambió
+            self.search_engine.sync(all_items)
+        return all_items
+
+    def show_run_result(self, result: RunResult, title: str) -> None:
+        origin = " - DESDE CACHÉ, el script no cambió" if result.from_cache else ""
+        usage = ""
+        if result.user_time or result.system_time:
+            usage = f", CPU {(result.user_time + result.system_time) * 1000:.1f} ms"
+        if result.max_rss_kb:
+            usage += f", memoria {result.max_rss_kb / 1024:.1f} MB"
+        print(f"\n--- {title} [{result.status_label()}] ({result.wall_time * 1000:.1f} ms{usage}){origin} ---")
+        print(result.stdout or "(sin salida estándar)")
+        if result.stderr:
+            print("--- stderr ---")
+            print(result.stderr)
+
     def main_menu(self) -> None:
         while True:
             self.header("MENU PRINCIPAL - DASHBOARD")
@@ -312,9 +4285,15 @@ class DashboardApp:
 
             print("\nOpciones:")
             print("1) Ver Unidades y scripts")
-            print("2) Buscar script por nombre")
+            print("2) Buscar script (nombre, tema o unidad)")
             print("3) Favoritos")
             print("4) Abrir carpeta del proyecto")
+            print("5) Buscar dentro del código (contenido)")
+            print("6) Estadísticas del escaneo")
+            print("7) Ejecutar scripts en lote")
+            print("8) Clases y herencia")
+            print("9) Tiempos de ejecución")
+            print("10) Ejecutar varios scripts en vivo")
             print("0) Salir")
 
             op = self.input_option("Elige una opción:")
@@ -329,7 +4308,20 @@ class DashboardApp:
                 self.favorites_menu()
             elif op == "4":
                 open_in_editor(self.base_path)
+                self.renderer.invalidate()
                 pause("Se intentó abrir la carpeta. Presiona Enter...")
+            elif op == "5":
+                self.content_search_menu()
+            elif op == "6":
+                self.scan_stats_menu()
+            elif op == "7":
+                self.batch_menu()
+            elif op == "8":
+                self.symbols_menu()
+            elif op == "9":
+                self.timings_menu()
+            elif op == "10":
+                self.live_menu()
             else:
                 print("Opción no válida.")
                 pause()
@@ -402,6 +4394,7 @@ class DashboardApp:
                 pause()
                 return
 
+            self.favorites.refresh()
             for i, s in enumerate(scripts, start=1):
                 spath = os.path.join(topic_path, s)
                 fav_mark = "★" if self.favorites.is_favorite(spath) else " "
@@ -442,6 +4435,8 @@ class DashboardApp:
             print("2) Ejecutar script")
             print("3) Abrir script en editor")
             print("4) Marcar/Desmarcar favorito")
+            print("5) Vista previa rápida (sin abrir otro proceso)")
+            print("6) Perfilar (tiempo y memoria)")
             print("0) Volver")
 
             op = self.input_option("Elige una acción:")
@@ -453,9 +4448,11 @@ class DashboardApp:
             elif op == "2":
                 print("Ejecutando... (se abrirá una consola/terminal si es posible)")
                 self.runner.run(item.script_path)
+                self.renderer.invalidate()
                 pause("Script lanzado. Presiona Enter para volver...")
             elif op == "3":
                 open_in_editor(item.script_path)
+                self.renderer.invalidate()
                 pause("Se intentó abrir el script. Presiona Enter...")
             elif op == "4":
                 if self.favorites.is_favorite(item.script_path):
@@ -465,19 +4462,63 @@ class DashboardApp:
                     self.favorites.add(item.script_path)
                     print("Favorito agregado.")
                 pause()
+            elif op == "5":
+                stdin_text = self.input_stdin(read_text_file(item.script_path + ".stdin") or "")
+                result = self.preview_runner.run(item.script_path, stdin_text)
+                self.show_run_result(result, f"Vista previa: {item.script_name}")
+                pause()
+            elif op == "6":
+                self.profile_menu(item)
             else:
                 print("Opción no válida.")
                 pause()
 
+    def profile_menu(self, item: ScriptItem) -> None:
+        stdin_text = self.input_stdin(read_text_file(item.script_path + ".stdin") or "")
+        print("\nPerfilando...")
+        run = self.profiler.profile(item.script_path, stdin_text)
+        self.header(f"PERFIL: {item.script_name}")
+        if not run.functions:
+            print(run.stderr.strip() or "No se obtuvo un perfil.")
+            pause()
+            return
+        print(format_profile(run))
+        if run.stderr.strip():
+            print("\n--- stderr del script ---")
+            print(run.stderr.rstrip())
+
+        history = [r for r in self.profiler.history.runs(item.script_path) if r.run_id != run.run_id]
+        if not history:
+            pause()
+            return
+        print("\nEjecuciones anteriores:")
+        recent = history[-10:]
+        for i, old in enumerate(reversed(recent), start=1):
+            changed = "" if old.source_hash == run.source_hash else "  (código distinto)"
+            print(f"{i}) {old.started_label()}  {old.wall_time * 1000:8.1f} ms  "
+                  f"{old.peak_bytes / 1024:8.1f} KiB{changed}")
+        op = self.input_option("Número para comparar con esta ejecución, o Enter para volver:")
+        if not op.isdigit() or not (1 <= int(op) <= len(recent)):
+            return
+        old = list(reversed(recent))[int(op) - 1]
+
+        self.header(f"COMPARAR PERFILES: {item.script_name}")
+        print(f"Antes:   {old.started_label()}  {old.wall_time * 1000:.1f} ms  {old.peak_bytes / 1024:.1f} KiB")
+        print(f"Después: {run.started_label()}  {run.wall_time * 1000:.1f} ms  {run.peak_bytes / 1024:.1f} KiB")
+        print(f"\n{'Antes ms':>10} {'Después ms':>10} {'Cambio':>9}  Función (tiempo acumulado)")
+        for label, before, after in diff_profiles(old, run):
+            print(f"{before * 1000:>10.2f} {after * 1000:>10.2f} {(after - before) * 1000:>+9.2f}  {label}")
+        pause()
+
     def search_menu(self) -> None:
         while True:
             self.header("BUSCAR SCRIPT")
-            query = self.input_option("Escribe parte del nombre del script (.py) o 0 para volver:")
+            query = self.input_option("Escribe parte del nombre (script, tema o unidad) o 0 para volver:")
             if query == "0":
                 return
 
-            all_items = self.explorer.collect_all_scripts()
-            matches = [it for it in all_items if query.lower() in it.script_name.lower()]
+            self.sync_search_engine()
+            matches = [it for _, it in self.search_engine.search(query, limit=50)]
 
             if not matches:
                 print("\nNo se encontraron coincidencias.")
@@ -485,10 +4526,17 @@ class DashboardApp:
                 continue
 
             print("\nCoincidencias:")
+            self.favorites.refresh()
             for i, it in enumerate(matches, start=1):
                 fav_mark = "★" if self.favorites.is_favorite(it.script_path) else " "
                 print(f"{i}) [{fav_mark}] {it.display_label()}")
 
+            if self.watcher is not None and self.watcher.running:
+                print(f"\n(Árbol en memoria, vigilado con {self.watcher.backend_name})")
+            else:
+                st = self.script_index.stats()
+                print(f"\n(Índice: {st['hits']} carpetas sin cambios, {st['misses']} re-escaneadas)")
+
             op = self.input_option("\nElige un número para abrir acciones, o 0 para buscar de nuevo:")
             if op == "0":
                 continue
@@ -505,10 +4553,324 @@ class DashboardApp:
 
             self.script_actions_menu(matches[idx])
 
+    def content_search_menu(self) -> None:
+        max_matches = 200
+        while True:
+            self.header("BUSCAR DENTRO DEL CÓDIGO")
+            print("Ejemplos: class Empleado   |   calcular_pago(")
+            print("Empieza con re: para usar una expresión regular (ej: re:def \\w+_pago)")
+            query = self.input_option("Texto a buscar, o 0 para volver:")
+            if query == "0":
+                return
+            if not query:
+                continue
+
+            regex = query.startswith("re:")
+            try:
+                pattern = ContentSearcher.compile(query[3:] if regex else query, regex=regex)
+            except re.error as e:
+                print(f"Expresión regular no válida: {e}")
+                pause()
+                continue
+
+            print("\nCoincidencias (se muestran a medida que se encuentran):")
+            matches: List[ContentMatch] = []
+            results = self.content_searcher.search(self.explorer.collect_all_scripts(), pattern)
+            try:
+                for match in results:
+                    matches.append(match)
+                    print(f"{len(matches)}) {match.display_label()}")
+                    if len(matches) >= max_matches:
+                        print(f"... se muestran solo las primeras {max_matches} coincidencias.")
+                        break
+            finally:
+                results.close()
+
+            if not matches:
+                print("\nNo se encontraron coincidencias.")
+                pause()
+                continue
+
+            op = self.input_option("\nElige un número para abrir acciones, o 0 para buscar de nuevo:")
+            if op == "0":
+                continue
+            if not op.isdigit():
+                print("Ingresa un número válido.")
+                pause()
+                continue
+
+            idx = int(op) - 1
+            if idx < 0 or idx >= len(matches):
+                print("Opción fuera de rango.")
+                pause()
+                continue
+
+            self.script_actions_menu(matches[idx].item)
+
+    def symbols_menu(self) -> None:
+        items = self.explorer.collect_all_scripts()
+        by_path = {os.path.abspath(it.script_path): it for it in items}
+        start = time.perf_counter()
+        parsed, reused = self.symbol_index.update(items)
+        self.symbol_index.save()
+        elapsed = time.perf_counter() - start
+
+        while True:
+            self.header("CLASES Y HERENCIA")
+            print(f"{len(self.symbol_index)} clases en {len(by_path)} scripts "
+                  f"({parsed} analizados, {reused} desde la caché, {elapsed * 1000:.0f} ms)")
+            print("\n1) Subclases de una clase (ej: Empleado)")
+            print("2) Clases que sobrescriben un método (ej: generar)")
+            print("3) Buscar una clase por nombre")
+            print("0) Volver")
+            op = self.input_option("Elige una opción:")
+            if op == "0":
+                return
+            if op not in ("1", "2", "3"):
+                print("Opción no válida.")
+                pause()
+                continue
+            name = self.input_option("Nombre:")
+            if not name:
+                continue
+
+            if op == "1":
+                title = f"Subclases de {name}"
+                symbols = self.symbol_index.subclasses(name)
+            elif op == "2":
+                title = f"Clases que sobrescriben {name}()"
+                symbols = self.symbol_index.overriding(name)
+                if not symbols:
+                    # nadie lo hereda: mostrar al menos dónde está definido
+                    title = f"Clases que definen {name}()"
+                    symbols = self.symbol_index.defining(name)
+            else:
+                title = f"Clases llamadas {name}"
+                symbols = self.symbol_index.classes_named(name)
+
+            print(f"\n{title}:")
+            if not symbols:
+                print("No se encontraron clases.")
+                pause()
+                continue
+            for i, sym in enumerate(symbols, start=1):
+                print(f"{i}) {sym.display_label()}")
+                if sym.doc:
+                    print(f"     {sym.doc}")
+
+            op = self.input_option("\nElige un número para abrir acciones del script, o 0 para volver:")
+            if not op.isdigit() or not (1 <= int(op) <= len(symbols)):
+                continue
+            item = by_path.get(symbols[int(op) - 1].script_path)
+            if item is not None:
+                self.script_actions_menu(item)
+
+    def timings_menu(self) -> None:
+        metrics = self.runner.metrics
+        while True:
+            self.header("TIEMPOS DE EJECUCIÓN")
+            timings = metrics.summarize() if metrics is not None else []
+            if not timings:
+                print("Aún no hay ejecuciones registradas.")
+                print("Se registran al ejecutar scripts (en terminal, capturados o en lote).")
+                pause()
+                return
+            print(f"{'#':>4}  {'p50 ms':>9} {'p95 ms':>9} {'Última ms':>9} {'CPU ms':>8} {'Mem MB':>7} "
+                  f"{'Veces':>5} {'Fallos':>6}  {'Marca':<13} Script")
+            print("-" * 100)
+            for i, t in enumerate(timings, start=1):
+                mem = f"{t.max_rss_kb / 1024:.1f}" if t.max_rss_kb else "-"
+                rel = os.path.relpath(t.script_path, self.base_path)
+                print(f"{i:>4}  {t.p50 * 1000:>9.1f} {t.p95 * 1000:>9.1f} {t.last * 1000:>9.1f} "
+                      f"{t.cpu_p50 * 1000:>8.1f} {mem:>7} {t.runs:>5} {t.failures:>6}  {t.flags_label():<13} {rel}")
+            print("\nLENTO: mucho más lento que el resto del árbol. "
+                  "ATÍPICA: la última ejecución tardó mucho más que las anteriores.")
+            print("Mem: memoria máxima del proceso (- = no se pudo medir).")
+
+            op = self.input_option("Número para ver el historial de un script, o 0 para volver:")
+            if op == "0" or not op:
+                return
+            if not op.isdigit() or not (1 <= int(op) <= len(timings)):
+                print("Opción fuera de rango.")
+                pause()
+                continue
+            timing = timings[int(op) - 1]
+            samples = metrics.samples(timing.script_path)  # type: ignore[union-attr]
+            print(f"\n--- {os.path.relpath(timing.script_path, self.base_path)}: "
+                  f"últimas {min(len(samples), 20)} de {len(samples)} ejecuciones ---")
+            for sample in samples[-20:]:
+                when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sample.started))
+                mem = f"{sample.max_rss_kb / 1024:.1f} MB" if sample.max_rss_kb else "-"
+                print(f"  {when}  {sample.status_label():<12} {sample.wall_time * 1000:>9.1f} ms  "
+                      f"CPU {sample.cpu_time * 1000:>8.1f} ms  {mem:>9}  {sample.origin_label()}")
+            pause()
+
+    def scan_stats_menu(self) -> None:
+        self.header("ESTADÍSTICAS DEL ESCANEO")
+        self.script_index.reset_stats()
+        if self.watcher is not None and self.watcher.running:
+            # el árbol está en memoria: se muestra el recorrido inicial
+            items = self.watcher.items()
+            scanner = self.watcher.loader
+            print(f"Vigilancia: {self.watcher.backend_name} sobre {self.watcher.folder_count()} carpetas, "
+                  f"{self.watcher.generation} cambios aplicados")
+        else:
+            items = self.explorer.collect_all_scripts()
+            scanner = self.explorer.scanner
+        st = self.script_index.stats()
+        print(f"Scripts encontrados: {len(items)}")
+        print(f"Carpetas recorridas: {len(scanner.latencies)} "
+              f"(hilos: {scanner.max_workers}, profundidad: {self.explorer.scanner.max_depth})")
+        print(f"Tiempo total: {scanner.last_scan_seconds * 1000:.1f} ms")
+        print(f"Índice: {st['hits']} carpetas sin cambios, {st['misses']} re-escaneadas")
+        if self.runner.bytecode is not None:
+            bc = self.runner.bytecode.stats()
+            print(f"Código precompilado: {bc['entries']} scripts ({bc['bytes'] / 1024:.0f} KB)")
+        print("\nCarpetas más lentas:")
+        for path, seconds in scanner.slowest(10):
+            rel = os.path.relpath(path, self.base_path)
+            print(f"  {seconds * 1000:8.2f} ms  {rel}")
+        pause()
+
+    def batch_menu(self) -> None:
+        self.header("EJECUTAR SCRIPTS EN LOTE")
+        query = self.input_option("Filtro (nombre, tema o unidad; vacío = todos, 0 = volver):")
+        if query == "0":
+            return
+        all_items = self.sync_search_engine()
+        if query:
+            items = [it for _, it in self.search_engine.search(query, limit=len(all_items))]
+        else:
+            items = all_items
+        if not items:
+            print("No hay scripts para ejecutar.")
+            pause()
+            return
+
+        timeout_txt = self.input_option("Tiempo máximo por script en segundos [10]:")
+        try:
+            timeout = float(timeout_txt) if timeout_txt else 10.0
+        except ValueError:
+            timeout = 10.0
+        print("Entrada para todos (un archivo <script>.stdin junto al script tiene prioridad).")
+        stdin_text = self.input_stdin()
+
+        use_cache = self.input_option("¿Reusar resultados de scripts sin cambios? (s/n) [s]:").lower() != "n"
+
+        batch = BatchRunner(self.runner, timeout=timeout, default_stdin=stdin_text, use_cache=use_cache)
+        if self.runner.bytecode is not None:
+            compiled, reused, failed = self.explorer.precompile(self.runner.bytecode, items)
+            print(f"\nPrecompilados: {compiled} nuevos, {reused} sin cambios, {failed} con errores "
+                  f"({self.runner.bytecode.last_seconds * 1000:.0f} ms)")
+        print(f"\nEjecutando {len(items)} scripts ({batch.max_workers} a la vez)...\n")
+        done = [0]
+
+        def progress(i: int, result: RunResult) -> None:
+            done[0] += 1
+            origin = " (caché)" if result.from_cache else ""
+            print(f"[{done[0]}/{len(items)}] {result.status_label():<12} "
+                  f"{result.wall_time:7.3f} s  {items[i].display_label()}{origin}")
+
+        results = batch.run_many([it.script_path for it in items], on_result=progress)
+        self.run_results_menu("RESUMEN DEL LOTE", results, items)
+
+    def run_results_menu(self, title: str, results: List[RunResult], items: List[ScriptItem]) -> None:
+        """Tabla de resultados; se puede abrir la salida de cada script."""
+        while True:
+            self.header(title)
+            print(format_run_summary(results, self.base_path))
+            op = self.input_option("\nNúmero para ver la salida de un script, o 0 para volver:")
+            if op == "0" or not op:
+                return
+            if not op.isdigit() or not (1 <= int(op) <= len(results)):
+                print("Opción fuera de rango.")
+                pause()
+                continue
+            self.show_run_result(results[int(op) - 1], items[int(op) - 1].display_label())
+            pause()
+
+    def live_menu(self) -> None:
+        self.header("EJECUTAR VARIOS SCRIPTS EN VIVO")
+        query = self.input_option("Filtro (nombre, tema o unidad; vacío = todos, 0 = volver):")
+        if query == "0":
+            return
+        all_items = self.sync_search_engine()
+        if query:
+            items = [it for _, it in self.search_engine.search(query, limit=len(all_items))]
+        else:
+            items = all_items
+        if not items:
+            print("No hay scripts para ejecutar.")
+            pause()
+            return
+
+        parallel_txt = self.input_option(f"¿Cuántos a la vez? [{self.live_runner.max_parallel}]:")
+        if parallel_txt.isdigit() and int(parallel_txt) > 0:
+            self.live_runner.max_parallel = int(parallel_txt)
+        timeout_txt = self.input_option("Tiempo máximo por script en segundos (0 = sin límite) [0]:")
+        try:
+            timeout = float(timeout_txt) if timeout_txt else 0.0
+        except ValueError:
+            timeout = 0.0
+        print("Entrada para todos (un archivo <script>.stdin junto al script tiene prioridad).")
+        stdin_text = self.input_stdin()
+        batch = BatchRunner(self.runner, default_stdin=stdin_text)
+        paths = [it.script_path for it in items]
+        if self.runner.bytecode is not None:
+            # antes de abrir la salida en vivo: ahí ya no se compila
+            self.explorer.precompile(self.runner.bytecode, items)
+
+        self.header("SALIDA EN VIVO")
+        width = len(str(len(items)))
+        for i, it in enumerate(items, start=1):
+            print(f"[{i:>{width}}] {it.display_label()}")
+        print("\nÓrdenes: c N + Enter = cancelar el script N, c + Enter (o Ctrl+C) = cancelar todos\n")
+        sys.stdout.flush()
+
+        colors = ("36", "33", "35", "32", "34", "91", "96", "93")
+        prefixes = []
+        for i, it in enumerate(items):
+            prefix = f"[{i + 1:>{width}} {it.script_name[:20]}]"
+            if self.renderer.enabled:
+                prefix = f"\033[{colors[i % len(colors)]}m{prefix}\033[0m"
+            prefixes.append(prefix)
+
+        session = self.live_runner.start(paths, [batch.stdin_for(p) for p in paths], timeout or None)
+        keyboard = LineInput()
+        try:
+            while not session.finished:
+                try:
+                    for line in session.lines():
+                        if line.stream == "fin":
+                            print(f"{prefixes[line.index]} === {line.text} ===")
+                        else:
+                            mark = "!" if line.stream == "err" else " "
+                            print(f"{prefixes[line.index]}{mark} {line.text}")
+                    sys.stdout.flush()
+                    order = keyboard.poll(0)
+                except KeyboardInterrupt:
+                    order = "c"
+                if order is None:
+                    continue
+                parts = order.strip().lower().split()
+                if parts == ["c"]:
+                    session.cancel()
+                    print("--- Cancelando todos ---")
+                elif len(parts) == 2 and parts[0] == "c" and parts[1].isdigit() and 1 <= int(parts[1]) <= len(items):
+                    session.cancel(int(parts[1]) - 1)
+                    print(f"--- Cancelando {int(parts[1])} ---")
+        except KeyboardInterrupt:
+            session.cancel()
+            session.done.wait()
+        self.renderer.invalidate()
+        pause("\nTodos terminaron. Presiona Enter para ver el resumen...")
+        results = [r or RunResult(p, None, "", "", 0.0, cancelled=True) for r, p in zip(session.results, paths)]
+        self.run_results_menu("RESUMEN EN VIVO", results, items)
+
     def favorites_menu(self) -> None:
         while True:
             self.header("FAVORITOS")
-            favs = self.favorites.list()
+            favs = self.favorites.list(existing_only=True)
 
             if not favs:
                 print("Aún no tienes favoritos.")
@@ -554,9 +4916,23 @@ class DashboardApp:
 
 def main() -> None:
     app = DashboardApp()
-    app.main_menu()
+    sys.stdout = app.renderer  # type: ignore[assignment]
+    try:
+        if app.watcher is not None:
+            app.watcher.start()
+            if app.watcher.running:
+                app.script_index.prune(app.watcher.folders())
+        app.main_menu()
+    finally:
+        sys.stdout = app.renderer.stream  # type: ignore[assignment]
+        app.renderer.flush()
+        if app.watcher is not None:
+            app.watcher.stop()
+        app.explorer.save_index()
+        app.symbol_index.save()
+        app.live_runner.close()
+        app.runner.close()
 
 
 if __name__ == "__main__":
     main()
-¿
\ No newline at end of file
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+# ============================================================
+# BENCHMARK_DASHBOARD.PY
+# Autor: Henry Baldeón Ochoa
+# Asignatura: Programación Orientada a Objetos
+# Objetivo:
+#   Medir el Dashboard (adaptacion-dashboard-poo.py) con los scripts
+#   reales del repositorio.
+#
+# Uso:
+#   python benchmark_dashboard.py arranque [--raiz RUTA] [--repeticiones N]
+#   python benchmark_dashboard.py suite [--tamanos 1000,10000] [--guardar-base]
+#   python benchmark_dashboard.py pantalla [--cuadros N]
+#   python benchmark_dashboard.py bytecode [--lineas 300,3000,30000] [--scripts N]
+#
+#   arranque  compara la latencia de lanzar cada script con un intérprete
+#             nuevo (frío) y con un intérprete precalentado (tibio).
+#   suite     genera árboles "Unidad N/Tema M/*.py" de varios tamaños y mide
+#             escaneo, búsqueda y favoritos (p50/p99 y pico de memoria).
+#             Compara contra la base benchmark_suite_base.json (junto a
+#             este archivo) y termina con código 1 si falta la base o si
+#             algo empeoró más de la tolerancia.
+#   pantalla  cuadros por segundo al navegar menús: `clear` de antes,
+#             redibujo completo con ANSI y redibujo solo de lo que cambió.
+#   bytecode  arranque de scripts de varios tamaños compilando el fuente
+#             vs. desde el código precompilado, y tiempo de precompilar un
+#             árbol de scripts en serie y en paralelo.
+# ============================================================
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from typing import Callable, Dict, List, Tuple
+
+AQUI = os.path.dirname(os.path.abspath(__file__))
+RAIZ_REPO = os.path.dirname(AQUI)
+ENTRADA_POR_DEFECTO = "20\n21\n22\n23\n24\n25\n26\nn\n"
+# base versionada junto al script: sin ella `suite` no tendría contra qué comparar
+BASE_POR_DEFECTO = os.path.join(AQUI, "benchmark_suite_base.json")
+
+
+def cargar_dashboard(path: str = os.path.join(AQUI, "adaptacion-dashboard-poo.py")):
+    """Importa el Dashboard (su nombre tiene guiones, no se puede con import)."""
+    spec = importlib.util.spec_from_file_location("dashboard", path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No se pudo cargar {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["dashboard"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def scripts_del_repositorio(dash, raiz: str) -> List[str]:
+    """Scripts detectados por el Dashboard, sin incluir las herramientas de esta carpeta."""
+    items = dash.ProjectExplorer(raiz).collect_all_scripts()
+    return [it.script_path for it in items if os.path.dirname(os.path.abspath(it.script_path)) != AQUI]
+
+
+# --------------------------- arranque ---------------------------
+
+def bench_arranque(args: argparse.Namespace) -> int:
+    dash = cargar_dashboard()
+    if not dash.WarmInterpreterPool.available():
+        print("Este sistema no tiene fork(): el modo precalentado no está disponible.")
+        return 1
+
+    scripts = scripts_del_repositorio(dash, args.raiz)
+    if not scripts:
+        print(f"No se encontraron scripts en {args.raiz}")
+        return 1
+
+    runner = dash.ScriptRunner(warm_pool_size=1)
+    try:
+        # la primera ejecución espera a que el cigoto termine de importar
+        runner.run_captured(scripts[0], args.entrada, args.timeout)
+
+        frio: Dict[str, List[float]] = {p: [] for p in scripts}
+        tibio: Dict[str, List[float]] = {p: [] for p in scripts}
+        for _ in range(args.repeticiones):
+            for p in scripts:
+                frio[p].append(runner.run_cold(p, args.entrada, args.timeout).wall_time)
+                tibio[p].append(runner.run_captured(p, args.entrada, args.timeout).wall_time)
+    finally:
+        runner.close()
+
+    print(f"Lanzamientos: {len(scripts)} scripts x {args.repeticiones} repeticiones\n")
+    print(f"{'Frío p50':>10} {'Tibio p50':>10} {'Ahorro':>8}  Script")
+    for p in scripts:
+        f50 = dash.percentile(frio[p], 50) * 1000
+        t50 = dash.percentile(tibio[p], 50) * 1000
+        print(f"{f50:8.1f}ms {t50:8.1f}ms {f50 - t50:6.1f}ms  {os.path.relpath(p, args.raiz)}")
+
+    todos_f = [t for ts in frio.values() for t in ts]
+    todos_t = [t for ts in tibio.values() for t in ts]
+    f50, t50 = dash.percentile(todos_f, 50) * 1000, dash.percentile(todos_t, 50) * 1000
+    f95, t95 = dash.percentile(todos_f, 95) * 1000, dash.percentile(todos_t, 95) * 1000
+    print(f"\nTotal frío : p50 {f50:.1f} ms  p95 {f95:.1f} ms")
+    print(f"Total tibio: p50 {t50:.1f} ms  p95 {t95:.1f} ms")
+    if t50 > 0:
+        print(f"El modo precalentado lanza {f50 / t50:.1f}x más rápido (p50).")
+    return 0
+
+
+# --------------------------- suite ---------------------------
+
+TEMAS_POR_UNIDAD = 20
+SCRIPTS_POR_TEMA = 50
+PALABRAS = ("clase objeto herencia polimorfismo encapsulacion abstraccion empleado cliente "
+            "reserva producto carrito tienda clima promedio reporte notas cuenta universidad "
+            "cita medico archivo constructor destructor menu favoritos calculadora rectangulo "
+            "area perimetro inventario factura pedido").split()
+
+
+def generar_arbol(destino: str, total: int, semilla: int = 1) -> List[str]:
+    """
+    Crea `total` scripts en destino/Unidad N/Tema M/ y devuelve sus nombres.
+    Las fechas se mueven un minuto atrás para que el índice confíe en ellas.
+    """
+    rnd = random.Random(semilla)
+    nombres = []
+    hace_un_minuto = time.time() - 60
+    for n in range(total):
+        unidad = n // (TEMAS_POR_UNIDAD * SCRIPTS_POR_TEMA) + 1
+        tema = n // SCRIPTS_POR_TEMA % TEMAS_POR_UNIDAD + 1
+        carpeta = os.path.join(destino, f"Unidad {unidad}", f"Tema {tema}")
+        if n % SCRIPTS_POR_TEMA == 0:
+            os.makedirs(carpeta, exist_ok=True)
+        nombre = "_".join(rnd.sample(PALABRAS, 2)) + f"_{n}.py"
+        with open(os.path.join(carpeta, nombre), "w", encoding="utf-8") as f:
+            f.write(f"print({n})\n")
+        nombres.append(nombre)
+    for raiz, carpetas, _ in os.walk(destino):
+        for c in carpetas:
+            os.utime(os.path.join(raiz, c), (hace_un_minuto, hace_un_minuto))
+    os.utime(destino, (hace_un_minuto, hace_un_minuto))
+    return nombres
+
+
+def consultas_de_prueba(nombres: List[str], semilla: int = 2) -> List[str]:
+    """Mezcla de búsquedas reales: prefijos, palabras, pares, unidad/tema y errores de tipeo."""
+    rnd = random.Random(semilla)
+    consultas = ["unidad 1", "tema 3", "tema", "car", "py"]
+    for _ in range(15):
+        a, b = rnd.choice(nombres).split("_")[:2]
+        consultas += [a[:3], a, f"{a} {b}", a[:2] + a[3:]]
+    return consultas
+
+
+def medir(funcion: Callable[[], object], repeticiones: int) -> List[float]:
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - t0)
+    return tiempos
+
+
+def pico_memoria(funcion: Callable[[], object]) -> float:
+    """Pico de memoria (MB) asignada durante una llamada, con tracemalloc."""
+    tracemalloc.start()
+    try:
+        funcion()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def fases_de_la_suite(dash, arbol: str, nombres: List[str], trabajo: str,
+                      repeticiones: int) -> Dict[str, Tuple[List[float], float]]:
+    """Ejecuta cada fase y devuelve fase -> (tiempos en segundos, pico en MB)."""
+    fases: Dict[str, Tuple[List[float], float]] = {}
+    indice = os.path.join(trabajo, "indice.json")
+
+    def escaneo_frio() -> None:
+        if os.path.exists(indice):
+            os.remove(indice)
+        dash.ProjectExplorer(arbol, index=dash.ScriptIndex(indice)).collect_all_scripts()
+
+    def escaneo_indice() -> None:
+        # como al abrir el Dashboard otra vez: índice leído del disco
+        dash.ProjectExplorer(arbol, index=dash.ScriptIndex(indice)).collect_all_scripts()
+
+    fases["escaneo_frio"] = (medir(escaneo_frio, repeticiones), pico_memoria(escaneo_frio))
+    fases["escaneo_indice"] = (medir(escaneo_indice, repeticiones), pico_memoria(escaneo_indice))
+
+    items = dash.ProjectExplorer(arbol).collect_all_scripts()
+    motor = dash.SearchEngine()
+    indexar = lambda: dash.SearchEngine().sync(items)
+    fases["indexar_busqueda"] = (medir(indexar, repeticiones), pico_memoria(indexar))
+    motor.sync(items)
+    consultas = consultas_de_prueba(nombres)
+    tiempos = []
+    for _ in range(repeticiones):
+        for q in consultas:
+            tiempos += medir(lambda: motor.search(q, limit=50), 1)
+    fases["busqueda"] = (tiempos, pico_memoria(lambda: [motor.search(q, limit=50) for q in consultas]))
+
+    # favoritos: uno de cada diez scripts, guardado como lo deja el Dashboard
+    archivo = os.path.join(trabajo, "favoritos.txt")
+    with open(archivo, "w", encoding="utf-8") as f:
+        f.write("\n".join(it.script_path for it in items[::10]) + "\n")
+    favs = dash.FavoritesManager(archivo)
+    por_tema: Dict[str, List[str]] = {}
+    for it in items:
+        por_tema.setdefault(os.path.dirname(it.script_path), []).append(it.script_path)
+    temas = list(por_tema.values())
+
+    def pintar_tema(rutas: List[str]) -> List[str]:
+        # lo mismo que hace scripts_menu por cada pantalla, sin imprimir
+        favs.refresh()
+        return ["★" if favs.is_favorite(ruta) else " " for ruta in rutas]
+
+    tiempos = []
+    for _ in range(repeticiones):
+        for rutas in temas:
+            tiempos += medir(lambda: pintar_tema(rutas), 1)
+    fases["favoritos_tema"] = (tiempos, pico_memoria(lambda: [pintar_tema(r) for r in temas]))
+    listar = lambda: favs.list(existing_only=True)
+    fases["favoritos_menu"] = (medir(listar, repeticiones), pico_memoria(listar))
+    return fases
+
+
+def comparar_con_base(actual: Dict[str, Dict[str, float]], base: Dict[str, Dict[str, float]],
+                      tolerancia: float) -> List[str]:
+    """
+    Lista de regresiones: un valor que supera a la base en más de `tolerancia`
+    (proporción) y además por un margen absoluto que no sea ruido.
+    El p99 sale de pocas muestras, así que se le permite el doble.
+    """
+    # métrica -> (margen absoluto, multiplicador de la tolerancia)
+    reglas = {"p50_ms": (0.5, 1), "p99_ms": (1.0, 2), "pico_mb": (1.0, 1)}
+    regresiones = []
+    for clave, valores in sorted(actual.items()):
+        previo = base.get(clave)
+        if previo is None:
+            continue
+        for metrica, (minimo, factor) in reglas.items():
+            antes, ahora = previo.get(metrica), valores[metrica]
+            if antes is None:
+                continue
+            if ahora > antes * (1 + tolerancia * factor) and ahora - antes > minimo:
+                regresiones.append(f"{clave} {metrica}: {antes:.2f} -> {ahora:.2f} "
+                                   f"(+{(ahora / antes - 1) * 100 if antes else float('inf'):.0f}%)")
+    return regresiones
+
+
+def bench_suite(args: argparse.Namespace) -> int:
+    dash = cargar_dashboard()
+    try:
+        tamanos = [int(t) for t in args.tamanos.split(",") if t.strip()]
+    except ValueError:
+        print(f"--tamanos inválido: {args.tamanos}")
+        return 2
+
+    temporal = args.directorio is None
+    directorio = args.directorio or tempfile.mkdtemp(prefix="suite_dashboard_")
+    actual: Dict[str, Dict[str, float]] = {}
+    try:
+        print(f"{'Fase':<22} {'Muestras':>8} {'p50 ms':>9} {'p99 ms':>9} {'Pico MB':>8}")
+        for total in tamanos:
+            arbol = os.path.join(directorio, f"arbol_{total}")
+            trabajo = os.path.join(directorio, f"trabajo_{total}")
+            if os.path.isdir(arbol):
+                shutil.rmtree(arbol)
+            shutil.rmtree(trabajo, ignore_errors=True)
+            os.makedirs(trabajo)
+            t0 = time.perf_counter()
+            nombres = generar_arbol(arbol, total)
+            print(f"\n== {total} scripts (árbol generado en {time.perf_counter() - t0:.1f} s) ==")
+
+            for fase, (tiempos, pico) in fases_de_la_suite(dash, arbol, nombres, trabajo,
+                                                           args.repeticiones).items():
+                fila = {"p50_ms": dash.percentile(tiempos, 50) * 1000,
+                        "p99_ms": dash.percentile(tiempos, 99) * 1000,
+                        "pico_mb": pico}
+                actual[f"{total}/{fase}"] = fila
+                print(f"{fase:<22} {len(tiempos):>8} {fila['p50_ms']:>9.2f} "
+                      f"{fila['p99_ms']:>9.2f} {pico:>8.1f}")
+    finally:
+        if temporal:
+            shutil.rmtree(directorio, ignore_errors=True)
+
+    if args.guardar_base:
+        os.makedirs(os.path.dirname(os.path.abspath(args.base)), exist_ok=True)
+        base = {}
+        if os.path.exists(args.base):
+            with open(args.base, "r", encoding="utf-8") as f:
+                base = json.load(f)
+        base.update(actual)
+        with open(args.base, "w", encoding="utf-8") as f:
+            json.dump(base, f, indent=2, sort_keys=True)
+        print(f"\nBase guardada en {args.base}")
+        return 0
+
+    if not os.path.exists(args.base):
+        print(f"\nERROR: no hay base en {args.base}; usa --guardar-base para crearla.")
+        return 1
+    with open(args.base, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    regresiones = comparar_con_base(actual, base, args.tolerancia)
+    if regresiones:
+        print(f"\nREGRESIÓN: {len(regresiones)} medida(s) empeoraron más de {args.tolerancia:.0%}:")
+        for r in regresiones:
+            print("  " + r)
+        return 1
+    print(f"\nSin regresiones frente a {args.base} (tolerancia {args.tolerancia:.0%}).")
+    return 0
+
+
+# --------------------------- pantalla ---------------------------
+
+class TerminalFalsa(io.StringIO):
+    """Salida que dice ser una terminal, para medir sin pintar de verdad."""
+    def isatty(self) -> bool:
+        return True
+
+
+def recorrido_de_menus(dash, app, scripts: List[str]) -> List[Callable[[int], None]]:
+    """
+    Pantallas de una navegación típica: menú principal -> unidades -> temas
+    -> scripts (marcando favoritos) -> y de vuelta.
+    """
+    def principal(_: int) -> None:
+        dash.DashboardApp.header(app, "MENU PRINCIPAL - DASHBOARD")
+        for linea in ("", "Opciones:", "1) Ver Unidades y scripts", "2) Buscar script (nombre, tema o unidad)",
+                      "3) Favoritos", "4) Abrir carpeta del proyecto", "0) Salir"):
+            print(linea)
+
+    def unidades(_: int) -> None:
+        dash.DashboardApp.header(app, "UNIDADES")
+        for n in range(1, 6):
+            print(f"{n}) Unidad {n}")
+        print("0) Volver")
+
+    def temas(_: int) -> None:
+        dash.DashboardApp.header(app, "TEMAS - Unidad 1")
+        for n in range(1, 9):
+            print(f"{n}) Tema {n}")
+        print("0) Volver")
+
+    def lista_scripts(paso: int) -> None:
+        dash.DashboardApp.header(app, "SCRIPTS - Unidad 1 > Tema 1")
+        for n, nombre in enumerate(scripts, start=1):
+            marca = "★" if n == paso % len(scripts) + 1 else " "
+            print(f"{n}) [{marca}] {nombre}")
+        print("\nAcciones:\n0) Volver\n9) Ir al menú principal")
+
+    return [principal, unidades, temas, lista_scripts, lista_scripts, lista_scripts, temas, unidades]
+
+
+def medir_pantallas(pintar: Callable[[int], None], cuadros: int) -> float:
+    inicio = time.perf_counter()
+    for paso in range(cuadros):
+        pintar(paso)
+    return time.perf_counter() - inicio
+
+
+def bench_pantalla(args: argparse.Namespace) -> int:
+    dash = cargar_dashboard()
+    rnd = random.Random(3)
+    scripts = ["_".join(rnd.sample(PALABRAS, 2)) + f"_{n}.py" for n in range(args.scripts)]
+    tamano = (120, max(args.scripts + 20, 40))
+    salida_real = sys.stdout
+    resultados = []
+    try:
+        for modo in ("clear (antes)", "ANSI completo", "ANSI diferencial"):
+            terminal = TerminalFalsa()
+            renderer = dash.ScreenRenderer(terminal, enabled=True, size=lambda: tamano)
+            app = types.SimpleNamespace(base_path=RAIZ_REPO, renderer=renderer)
+            pantallas = recorrido_de_menus(dash, app, scripts)
+
+            def pintar(paso: int) -> None:
+                if modo == "clear (antes)":
+                    # header() llama a clear_screen(): un proceso nuevo por pantalla
+                    sys.stdout = terminal
+                else:
+                    sys.stdout = renderer
+                    if modo == "ANSI completo":
+                        renderer.invalidate()
+                pantallas[paso % len(pantallas)](paso)
+                renderer.note_input("\nElige una opción: ")
+                sys.stdout.flush()
+
+            # el `clear` escribe en el descriptor 1: se manda a la nada mientras se mide
+            salida_real.flush()
+            fd_guardado = os.dup(1)
+            nulo = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(nulo, 1)
+            try:
+                segundos = medir_pantallas(pintar, args.cuadros)
+            finally:
+                os.dup2(fd_guardado, 1)
+                os.close(fd_guardado)
+                os.close(nulo)
+            sys.stdout = salida_real
+            resultados.append((modo, args.cuadros / segundos, len(terminal.getvalue()) / args.cuadros))
+    finally:
+        sys.stdout = salida_real
+
+    print(f"{args.cuadros} cuadros, lista de {args.scripts} scripts\n")
+    print(f"{'Modo':<18} {'Cuadros/s':>10} {'Bytes/cuadro':>13}")
+    for modo, fps, bytes_cuadro in resultados:
+        print(f"{modo:<18} {fps:>10.0f} {bytes_cuadro:>13.0f}")
+    return 0
+
+
+# --------------------------- bytecode ---------------------------
+
+def generar_script(lineas: int) -> str:
+    """Un script con clases y métodos (3 líneas por clase) que imprime una línea al final."""
+    partes = []
+    for i in range(max(1, lineas // 3)):
+        partes.append(f"class Clase{i}:\n"
+                      f"    def calcular(self, x):\n"
+                      f"        return [x * {i} + k for k in range(3) if k % 2]\n")
+    partes.append("print('listo')\n")
+    return "".join(partes)
+
+
+def bench_bytecode(args: argparse.Namespace) -> int:
+    dash = cargar_dashboard()
+    tamanos = [int(t) for t in args.lineas.split(",") if t.strip()]
+    trabajo = tempfile.mkdtemp(prefix="bench-bytecode-")
+    try:
+        # min_bytes=0: se mide también por debajo del umbral, para ver dónde conviene
+        cache = dash.BytecodeCache(os.path.join(trabajo, "cache"), min_bytes=0)
+        umbral = dash.BytecodeCache(trabajo).min_bytes
+        fuente = dash.ScriptRunner()
+        compilado = dash.ScriptRunner(bytecode=cache)
+
+        print(f"Arranque en frío, {args.repeticiones} repeticiones (p50)\n")
+        print(f"{'Líneas':>8} {'Bytes':>8} {'Fuente':>10} {'Precompilado':>13} {'Ahorro':>8}")
+        for lineas in tamanos:
+            script = os.path.join(trabajo, f"script_{lineas}.py")
+            with open(script, "w", encoding="utf-8") as f:
+                f.write(generar_script(lineas))
+            cache.precompile([script])
+            t_fuente = [fuente.run_cold(script).wall_time for _ in range(args.repeticiones)]
+            t_cache = [compilado.run_cold(script).wall_time for _ in range(args.repeticiones)]
+            f50 = dash.percentile(t_fuente, 50) * 1000
+            c50 = dash.percentile(t_cache, 50) * 1000
+            tamano = os.path.getsize(script)
+            marca = "" if tamano >= umbral else "  (bajo el umbral: se usa el fuente)"
+            print(f"{lineas:>8} {tamano:>8} {f50:8.1f}ms {c50:11.1f}ms {f50 - c50:6.1f}ms{marca}")
+        fuente.close()
+        compilado.close()
+
+        arbol = os.path.join(trabajo, "arbol")
+        os.makedirs(arbol)
+        scripts = []
+        for i in range(args.scripts):
+            scripts.append(os.path.join(arbol, f"s{i}.py"))
+            with open(scripts[-1], "w", encoding="utf-8") as f:
+                f.write(generar_script(args.lineas_arbol) + f"# {i}\n")
+        print(f"\nPrecompilar {args.scripts} scripts de {args.lineas_arbol} líneas "
+              f"({os.cpu_count() or 1} CPU)\n")
+        for nombre, minimo in (("en serie", 10 ** 9), ("en paralelo", dash.BytecodeCache.PARALLEL_MIN_FILES)):
+            cache = dash.BytecodeCache(os.path.join(trabajo, "cache_" + nombre.replace(" ", "_")))
+            cache.PARALLEL_MIN_FILES = minimo
+            compilados, _, _ = cache.precompile(scripts)
+            primera = cache.last_seconds
+            cache.precompile(scripts)
+            print(f"{nombre:<12} {primera * 1000:8.1f} ms ({compilados} compilados); "
+                  f"de nuevo sin cambios: {cache.last_seconds * 1000:.1f} ms")
+    finally:
+        shutil.rmtree(trabajo, ignore_errors=True)
+    return 0
+
+
+# --------------------------- Punto de Entrada ---------------------------
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks del Dashboard POO")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_arr = sub.add_parser("arranque", help="latencia de lanzamiento: intérprete frío vs precalentado")
+    p_arr.add_argument("--raiz", default=RAIZ_REPO, help="carpeta con los scripts (por defecto, el repositorio)")
+    p_arr.add_argument("--repeticiones", type=int, default=5)
+    p_arr.add_argument("--timeout", type=float, default=10.0)
+    p_arr.add_argument("--entrada", default=ENTRADA_POR_DEFECTO, help="stdin para scripts con input()")
+    p_arr.set_defaults(func=bench_arranque)
+
+    p_suite = sub.add_parser("suite", help="escaneo, búsqueda y favoritos en árboles sintéticos")
+    p_suite.add_argument("--tamanos", default="1000,10000,100000", help="cantidades de scripts, separadas por coma")
+    p_suite.add_argument("--repeticiones", type=int, default=5)
+    p_suite.add_argument("--directorio", help="dónde generar los árboles (por defecto, uno temporal que se borra)")
+    p_suite.add_argument("--base", default=BASE_POR_DEFECTO, help="archivo JSON con la medición de referencia")
+    p_suite.add_argument("--tolerancia", type=float, default=0.25, help="empeoramiento aceptado (0.25 = 25%%)")
+    p_suite.add_argument("--guardar-base", action="store_true", help="guardar esta medición como la nueva base")
+    p_suite.set_defaults(func=bench_suite)
+
+    p_pan = sub.add_parser("pantalla", help="cuadros por segundo del dibujo de menús")
+    p_pan.add_argument("--cuadros", type=int, default=300)
+    p_pan.add_argument("--scripts", type=int, default=30, help="largo de la lista de scripts del recorrido")
+    p_pan.set_defaults(func=bench_pantalla)
+
+    p_bc = sub.add_parser("bytecode", help="arranque desde el fuente vs. código precompilado")
+    p_bc.add_argument("--lineas", default="300,3000,30000", help="tamaños de script, separados por coma")
+    p_bc.add_argument("--repeticiones", type=int, default=10)
+    p_bc.add_argument("--scripts", type=int, default=200, help="scripts del árbol a precompilar")
+    p_bc.add_argument("--lineas-arbol", type=int, default=600, help="líneas de cada script del árbol")
+    p_bc.set_defaults(func=bench_bytecode)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,16 @@
+# El Dashboard tiene guiones en el nombre y no se puede importar con
+# `import`: las pruebas lo cargan igual que benchmark_dashboard.py.
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark_dashboard import cargar_dashboard  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def dash():
+    return cargar_dashboard()
@@ -0,0 +1,90 @@
+# Pruebas de InProcessRunner: después de cada vista previa el proceso del
+# Dashboard tiene que quedar como estaba (argv, path, carpeta actual,
+# salidas y módulos del script).
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+
+@pytest.fixture
+def runner(dash):
+    return dash.InProcessRunner(timeout=2.0)
+
+
+def write_script(folder, name, code):
+    path = folder / name
+    path.write_text(textwrap.dedent(code), encoding="utf-8")
+    return str(path)
+
+
+def snapshot():
+    return (sys.argv[:], sys.path[:], os.getcwd(), sys.stdin, sys.stdout, sys.stderr)
+
+
+def test_state_is_restored_after_a_run(runner, tmp_path):
+    write_script(tmp_path, "preview_helper.py", "VALUE = 41\n")
+    script = write_script(tmp_path, "main.py", """
+        import atexit, colorsys, os, sys
+        import preview_helper
+        atexit.register(print, "bye")
+        name = input()
+        print(f"hola {name}", preview_helper.VALUE + 1, os.path.basename(os.getcwd()), sys.argv[0])
+        print("warning", file=sys.stderr)
+        sys.argv.append("--changed")
+        sys.path.append("/somewhere/else")
+    """)
+    sys.modules.pop("colorsys", None)
+    before = snapshot()
+
+    result = runner.run(script, "Ana\n")
+
+    assert result.returncode == 0 and not result.timed_out
+    assert result.stdout == f"hola Ana 42 {tmp_path.name} {script}\nbye\n"
+    assert result.stderr == "warning\n"
+    assert snapshot() == before
+    # el módulo de la carpeta del script se olvida; la biblioteca estándar queda
+    assert "preview_helper" not in sys.modules
+    assert "colorsys" in sys.modules
+
+
+def test_state_is_restored_after_an_error(runner, tmp_path):
+    script = write_script(tmp_path, "broken.py", """
+        import os
+        os.chdir("/")
+        raise RuntimeError("boom")
+    """)
+    before = snapshot()
+    result = runner.run(script)
+    assert result.returncode == 1
+    assert "RuntimeError: boom" in result.stderr
+    assert snapshot() == before
+
+
+@pytest.mark.parametrize("code, returncode, stderr", [
+    ("import sys; sys.exit()", 0, ""),
+    ("import sys; sys.exit(3)", 3, ""),
+    ("import sys; sys.exit('bad input')", 1, "bad input\n"),
+])
+def test_exit_codes(runner, tmp_path, code, returncode, stderr):
+    result = runner.run(write_script(tmp_path, "exits.py", code))
+    assert (result.returncode, result.stderr) == (returncode, stderr)
+
+
+def test_timeout(dash, tmp_path):
+    before = snapshot()
+    result = dash.InProcessRunner(timeout=0.3).run(write_script(tmp_path, "loop.py", "while True:\n    pass\n"))
+    assert result.timed_out and result.returncode is None
+    assert snapshot() == before
+
+
+def test_threads_left_running_are_reported(runner, tmp_path):
+    script = write_script(tmp_path, "threads.py", """
+        import threading, time
+        threading.Thread(target=time.sleep, args=(0.5,), name="leftover", daemon=True).start()
+    """)
+    result = runner.run(script)
+    assert result.returncode == 0
+    assert "leftover" in result.stderr
@@ -0,0 +1,69 @@
+# Pruebas del orden de resultados de SearchEngine: exacto antes que
+# prefijo, prefijo antes que subcadena, errores de tipeo y consultas de
+# varias palabras repartidas entre tema y nombre.
+
+import pytest
+
+
+@pytest.fixture
+def engine(dash):
+    item = dash.ScriptItem
+    return dash.SearchEngine([
+        item("Unidad 1", "Tema 1", "clima.py", "/proyecto/u1/t1/clima.py"),
+        item("Unidad 1", "Tema 1", "clima_avanzado.py", "/proyecto/u1/t1/clima_avanzado.py"),
+        item("Unidad 1", "Tema 2", "microclima.py", "/proyecto/u1/t2/microclima.py"),
+        item("Unidad 1", "Tema 3", "clima.py", "/proyecto/u1/t3/clima.py"),
+        item("Unidad 1", "Tema 3", "ventas.py", "/proyecto/u1/t3/ventas.py"),
+        item("Unidad 2", "Tema 1", "inventario.py", "/proyecto/u2/t1/inventario.py"),
+    ])
+
+
+def paths(results):
+    return [item.script_path for _, item in results]
+
+
+def test_exact_before_prefix_before_substring(engine):
+    results = engine.search("clima")
+    assert paths(results) == [
+        "/proyecto/u1/t1/clima.py",
+        "/proyecto/u1/t3/clima.py",
+        "/proyecto/u1/t1/clima_avanzado.py",
+        "/proyecto/u1/t2/microclima.py",
+    ]
+    scores = [score for score, _ in results]
+    assert scores == sorted(scores, reverse=True)
+    assert scores[0] == scores[1] > scores[2] > scores[3]
+
+
+@pytest.mark.parametrize("query", ["inventaro", "INVENTARIO", "invéntario", "in"])
+def test_case_accents_typos_and_short_queries(engine, query):
+    assert paths(engine.search(query))[:1] == ["/proyecto/u2/t1/inventario.py"]
+
+
+def test_no_matches(engine):
+    assert engine.search("zzzz") == []
+    assert engine.search("   ") == []
+
+
+def test_words_across_fields(engine):
+    results = paths(engine.search("tema 3 clima"))
+    # tema y nombre a la vez primero; después los que solo tienen una parte
+    assert results[0] == "/proyecto/u1/t3/clima.py"
+    assert results.index("/proyecto/u1/t1/clima.py") < results.index("/proyecto/u1/t3/ventas.py")
+
+
+def test_limit(engine):
+    assert len(engine.search("clima", limit=2)) == 2
+
+
+def test_add_and_remove_without_rebuilding(dash, engine):
+    engine.remove("/proyecto/u1/t1/clima.py")
+    assert "/proyecto/u1/t1/clima.py" not in paths(engine.search("clima"))
+
+    engine.add(dash.ScriptItem("Unidad 4", "Tema 9", "pronostico.py", "/proyecto/u4/t9/pronostico.py"))
+    assert paths(engine.search("pronostico")) == ["/proyecto/u4/t9/pronostico.py"]
+
+    # volver a agregar la misma ruta reemplaza al anterior
+    engine.add(dash.ScriptItem("Unidad 4", "Tema 9", "lluvia.py", "/proyecto/u4/t9/pronostico.py"))
+    assert engine.search("pronostico") == []
+    assert paths(engine.search("lluvia")) == ["/proyecto/u4/t9/pronostico.py"]